@@ -1,5 +1,10 @@
 # game/ai.py
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from math import inf
+import os
+import random
 import time
 
 HUMAN = "X"
@@ -8,28 +13,114 @@ EMPTY = ""
 
 DIRECTIONS = [(1, 0), (0, 1), (1, 1), (1, -1)]
 
+# Les 8 symétries du plateau (4 rotations x miroir), en coordonnées relatives au centre
+SYMMETRIES = (
+    lambda a, b: (a, b),
+    lambda a, b: (b, -a),
+    lambda a, b: (-a, -b),
+    lambda a, b: (-b, a),
+    lambda a, b: (a, -b),
+    lambda a, b: (-a, b),
+    lambda a, b: (b, a),
+    lambda a, b: (-b, -a),
+)
+INVERSE_SYMMETRY = tuple(
+    next(j for j, inv in enumerate(SYMMETRIES) if inv(*t(1, 2)) == (1, 2) and inv(*t(3, -5)) == (3, -5))
+    for t in SYMMETRIES
+)
+
+# L'horloge n'est consultée qu'une fois tous les N nœuds (alpha-bêta et quiescence)
+TIME_CHECK_INTERVAL = 1024
+
+# Taille max de la table de transposition (éviction LRU au-delà)
+TT_MAX_ENTRIES = 200_000
+
+# Profondeur max indexable dans la table des killers
+MAX_SEARCH_DEPTH = 64
+
+# Cache d'évaluation statique (clé: hash Zobrist), éviction LRU au-delà
+EVAL_CACHE_MAX_ENTRIES = 200_000
+
+# Fenêtre d'aspiration autour du score de l'itération précédente
+ASPIRATION_DELTA = 50_000
+ASPIRATION_MAX_WIDENINGS = 3
+
+# Null-move pruning: réduction R et profondeur minimale d'application
+NULL_MOVE_R = 2
+NULL_MOVE_MIN_DEPTH = 3
+# Au-delà de ce score on est dans une séquence gagnante forcée
+WIN_THRESHOLD = 900_000
+
+# Recherche racine parallèle (profondeur fixe) à partir de cette profondeur
+PARALLEL_MIN_DEPTH = 3
+
+# Rayon du voisinage maintenu incrémentalement pour la génération de coups
+CAND_DIST = 2
+
 
 def in_bounds(r, c, n):
     return 0 <= r < n and 0 <= c < n
 
 
 def has_five(board, r, c, player):
+    # Directions déroulées et bornes en ligne: fonction appelée dans les boucles chaudes
     n = len(board)
-    for dr, dc in DIRECTIONS:
-        cnt = 1
-        rr, cc = r + dr, c + dc
-        while in_bounds(rr, cc, n) and board[rr][cc] == player:
-            cnt += 1
-            rr += dr
-            cc += dc
-        rr, cc = r - dr, c - dc
-        while in_bounds(rr, cc, n) and board[rr][cc] == player:
-            cnt += 1
-            rr -= dr
-            cc -= dc
-        if cnt >= 5:
-            return True
-    return False
+
+    # Horizontale (0, 1)
+    row = board[r]
+    cnt = 1
+    cc = c + 1
+    while cc < n and row[cc] == player:
+        cnt += 1
+        cc += 1
+    cc = c - 1
+    while cc >= 0 and row[cc] == player:
+        cnt += 1
+        cc -= 1
+    if cnt >= 5:
+        return True
+
+    # Verticale (1, 0)
+    cnt = 1
+    rr = r + 1
+    while rr < n and board[rr][c] == player:
+        cnt += 1
+        rr += 1
+    rr = r - 1
+    while rr >= 0 and board[rr][c] == player:
+        cnt += 1
+        rr -= 1
+    if cnt >= 5:
+        return True
+
+    # Diagonale ↘ (1, 1)
+    cnt = 1
+    rr, cc = r + 1, c + 1
+    while rr < n and cc < n and board[rr][cc] == player:
+        cnt += 1
+        rr += 1
+        cc += 1
+    rr, cc = r - 1, c - 1
+    while rr >= 0 and cc >= 0 and board[rr][cc] == player:
+        cnt += 1
+        rr -= 1
+        cc -= 1
+    if cnt >= 5:
+        return True
+
+    # Diagonale ↙ (1, -1)
+    cnt = 1
+    rr, cc = r + 1, c - 1
+    while rr < n and cc >= 0 and board[rr][cc] == player:
+        cnt += 1
+        rr += 1
+        cc -= 1
+    rr, cc = r - 1, c + 1
+    while rr >= 0 and cc < n and board[rr][cc] == player:
+        cnt += 1
+        rr -= 1
+        cc += 1
+    return cnt >= 5
 
 
 def check_win(board):
@@ -42,6 +133,42 @@ def check_win(board):
     return None
 
 
+class BitBoard:
+    """
+    Plateau en bitboards (un entier Python par joueur).
+
+    Case (r, c) -> bit r * (n + 1) + c : la colonne de padding n reste
+    toujours vide, ce qui évite les masques de bord lors des décalages.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.stride = size + 1
+        self.shifts = (1, self.stride, self.stride + 1, self.stride - 1)
+        self.bbs = [0, 0]  # [ia, humain]
+
+    def toggle(self, r, c, idx):
+        self.bbs[idx] ^= 1 << (r * self.stride + c)
+
+    def has_five(self, idx):
+        bb = self.bbs[idx]
+        for s in self.shifts:
+            x = bb & (bb >> s)
+            x &= x >> (2 * s)
+            if x & (bb >> (4 * s)):
+                return True
+        return False
+
+    def has_four(self, idx):
+        """Au moins 4 pierres alignées contiguës (menace directe)."""
+        bb = self.bbs[idx]
+        for s in self.shifts:
+            x = bb & (bb >> s)
+            if x & (x >> (2 * s)):
+                return True
+        return False
+
+
 def basic_neighbors(board, dist=2):
     """
     Version simple: cases vides proches de n'importe quel pion.
@@ -80,18 +207,94 @@ PATTERN_SCORES = {
     "_OO__": 300,
 }
 
+# Séparateur de lignes: absent de tous les patterns, aucun match ne le traverse
+LINE_SEP = b"|"
+DOT = ord(".")
+
+# Patterns en bytes pour travailler directement sur le plateau aplati
+PATTERN_BYTES = tuple((pattern.encode(), value) for pattern, value in PATTERN_SCORES.items())
+
+
+def _perspective_table(player_char, opp_char):
+    """Table bytes.translate: joueur -> 'O', adversaire -> 'X', séparateur conservé, reste -> '_'."""
+    table = bytearray(b"_" * 256)
+    table[ord(player_char)] = ord("O")
+    table[ord(opp_char)] = ord("X")
+    table[LINE_SEP[0]] = LINE_SEP[0]
+    return bytes(table)
+
+
+# Marqueur du coup nul en attente dans un _Frame
+_NULL_MOVE = object()
+
+
+class _Frame:
+    """État d'un nœud intérieur pour search_iter."""
+
+    __slots__ = (
+        "depth", "alpha", "beta", "player", "opponent", "maximizing", "last_move", "ply",
+        "alpha_orig", "beta_orig", "key", "sym", "hash_move",
+        "moves", "index", "best_val", "best_local", "pending",
+    )
+
+    def __init__(self, depth, alpha, beta, player, opponent, maximizing, last_move, ply,
+                 alpha_orig, beta_orig, key, sym, hash_move):
+        self.depth = depth
+        self.alpha = alpha
+        self.beta = beta
+        self.player = player
+        self.opponent = opponent
+        self.maximizing = maximizing
+        self.last_move = last_move
+        self.ply = ply
+        self.alpha_orig = alpha_orig
+        self.beta_orig = beta_orig
+        self.key = key
+        self.sym = sym
+        self.hash_move = hash_move
+        self.moves = ()
+        self.index = 0
+        self.best_val = -inf if maximizing else inf
+        self.best_local = None
+        self.pending = None
+
 
 class AdvancedGomokuAI:
-    def __init__(self, size=15, ai_player=AI):
+    def __init__(self, size=15, ai_player=AI, workers=1):
         self.size = size
         self.ai_player = ai_player
         self.human_player = HUMAN if ai_player == AI else AI
+        # Processus pour la recherche racine parallèle (1 = séquentiel).
+        # Opt-in uniquement : forker un worker serveur multi-thread n'est pas
+        # sûr, et le pool vit aussi longtemps que le processus.
+        self.workers = max(1, workers)
 
         # Optimisations de recherche
-        self.transposition_table = {}
-        self.killer_moves = {}       # depth -> [move1, move2]
-        self.history_heuristic = {}  # (player, move) -> score
-        self.opening_book = {}       # TODO: bibliothèque d'ouvertures
+        self.transposition_table = OrderedDict()
+        self._init_move_tables(size)  # killers / history indexés par case r * n + c
+        self._init_center(size)
+        self.opening_book = OPENING_BOOK  # positions canoniques -> coup (relatif au centre)
+
+        # Tables de remapping par point de vue (évaluation)
+        self._perspective = {
+            ai_player: _perspective_table(ai_player, self.human_player),
+            self.human_player: _perspective_table(self.human_player, ai_player),
+        }
+
+        # Hash Zobrist incrémental de la position courante
+        self._eval_cache = OrderedDict()
+        self._init_zobrist(size)
+        self._hashes = [0] * len(SYMMETRIES)  # une par symétrie, [0] = identité
+
+        # Bitboards synchronisés avec le plateau texte par _make/_unmake
+        self._bb = BitBoard(size)
+
+        # Plateau aplati (codes ASCII) + lignes précalculées pour l'évaluation
+        self._init_lines(size)
+
+        # Voisinage des pierres (rayon CAND_DIST): case -> nb de pierres proches
+        self._cand_refcount = {}
+        self._occ_count = 0
 
         # Stats pour benchmarking
         self.nodes = 0
@@ -100,78 +303,230 @@ class AdvancedGomokuAI:
 
         self.time_limit = None
         self.start_time = None
+        self._deadline = None
+        self._timed_out = False
+        self._time_check = TIME_CHECK_INTERVAL  # nœuds restants avant de lire l'horloge
+
+        # Meilleur coup racine de l'itération précédente (iterative deepening)
+        self._pv_move = None
+
+        # Interdit deux coups nuls consécutifs
+        self._null_ok = True
 
     # --------- Utilitaires / hash ---------
 
-    def _board_key(self, board, player, depth):
-        # Simple clé de transposition (remplaçable par un hash Zobrist plus rapide)
-        return (player, depth, tuple(tuple(row) for row in board))
+    def _init_zobrist(self, size):
+        # Une clé aléatoire 64 bits par (case, joueur) + une par trait
+        z = [[random.getrandbits(64) for _ in range(2)] for _ in range(size * size)]
+        self._z_side = [random.getrandbits(64), random.getrandbits(64)]
+
+        # sym_perm[k][case] = image de la case par la symétrie k
+        # (coordonnées doublées autour du centre: valable aussi pour n pair)
+        span = size - 1
+        self._sym_perm = []
+        for transform in SYMMETRIES:
+            perm = []
+            for r in range(size):
+                for c in range(size):
+                    dr, dc = transform(2 * r - span, 2 * c - span)
+                    perm.append(((dr + span) // 2) * size + (dc + span) // 2)
+            self._sym_perm.append(perm)
+
+        # zsym[case][joueur] = clés de la case image sous chacune des 8 symétries:
+        # on maintient ainsi le hash des 8 orientations du plateau en parallèle
+        self._zsym = [
+            [tuple(z[perm[cell]][idx] for perm in self._sym_perm) for idx in range(2)]
+            for cell in range(size * size)
+        ]
+        # Nouvelles clés: les évaluations mémorisées ne sont plus adressables
+        self._eval_cache.clear()
+
+    def _compute_hashes(self, board):
+        """Hashes complets (8 orientations), calculés une seule fois à l'entrée de la recherche."""
+        n = self.size
+        hashes = [0] * len(SYMMETRIES)
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell == EMPTY:
+                    continue
+                keys = self._zsym[r * n + c][0 if cell == self.ai_player else 1]
+                for k, key in enumerate(keys):
+                    hashes[k] ^= key
+        return hashes
+
+    def _xor_stone(self, cell, idx):
+        hashes = self._hashes
+        keys = self._zsym[cell][idx]
+        for k in range(len(keys)):
+            hashes[k] ^= keys[k]
+
+    def _load_bitboards(self, board):
+        self._bb = BitBoard(len(board))
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell == self.ai_player:
+                    self._bb.toggle(r, c, 0)
+                elif cell == self.human_player:
+                    self._bb.toggle(r, c, 1)
+
+    def _load_candidates(self, board):
+        self._cand_refcount = {}
+        self._occ_count = 0
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell != EMPTY:
+                    self._push_neighbors(r, c)
+
+    def _push_neighbors(self, r, c):
+        n = self.size
+        refcount = self._cand_refcount
+        self._occ_count += 1
+        for rr in range(max(0, r - CAND_DIST), min(n, r + CAND_DIST + 1)):
+            for cc in range(max(0, c - CAND_DIST), min(n, c + CAND_DIST + 1)):
+                refcount[(rr, cc)] = refcount.get((rr, cc), 0) + 1
+
+    def _pop_neighbors(self, r, c):
+        n = self.size
+        refcount = self._cand_refcount
+        self._occ_count -= 1
+        for rr in range(max(0, r - CAND_DIST), min(n, r + CAND_DIST + 1)):
+            for cc in range(max(0, c - CAND_DIST), min(n, c + CAND_DIST + 1)):
+                left = refcount[(rr, cc)] - 1
+                if left:
+                    refcount[(rr, cc)] = left
+                else:
+                    del refcount[(rr, cc)]
+
+    def _make(self, board, r, c, player):
+        idx = 0 if player == self.ai_player else 1
+        cell = r * self.size + c
+        board[r][c] = player
+        self._flat[cell] = ord(player)
+        self._center_sums[idx] += self._center_bonus[cell]
+        self._xor_stone(cell, idx)
+        self._bb.toggle(r, c, idx)
+        self._push_neighbors(r, c)
+
+    def _unmake(self, board, r, c, player):
+        idx = 0 if player == self.ai_player else 1
+        cell = r * self.size + c
+        board[r][c] = EMPTY
+        self._flat[cell] = DOT
+        self._center_sums[idx] -= self._center_bonus[cell]
+        self._xor_stone(cell, idx)
+        self._bb.toggle(r, c, idx)
+        self._pop_neighbors(r, c)
+
+    def _winner(self):
+        """Équivalent bitboard de check_win sur la position courante."""
+        if self._bb.has_five(0):
+            return self.ai_player
+        if self._bb.has_five(1):
+            return self.human_player
+        return None
+
+    def _board_key(self, player, depth):
+        """
+        Clé de transposition canonique: le plus petit des 8 hashes (positions
+        symétriques => même entrée), plus l'indice de la symétrie retenue pour
+        convertir le coup stocké dans la TT.
+        """
+        hashes = self._hashes
+        canonical = min(hashes)
+        sym = hashes.index(canonical)
+        return canonical ^ self._z_side[0 if player == self.ai_player else 1] ^ (depth << 1), sym
 
     # --------- Évaluation avancée ---------
 
-    def _extract_lines(self, board):
-        n = len(board)
+    def _init_lines(self, size):
+        """
+        Précalcule, une fois par taille, chaque ligne (≥ 5 cases) comme une
+        tranche (start, stop, step) du plateau aplati r * n + c.
+        """
+        n = size
         lines = []
-
-        # Lignes horizontales
         for r in range(n):
-            lines.append("".join(board[r][c] if board[r][c] != EMPTY else "." for c in range(n)))
-
-        # Colonnes
+            lines.append((r * n, r * n + n, 1))
         for c in range(n):
-            col = []
-            for r in range(n):
-                col.append(board[r][c] if board[r][c] != EMPTY else ".")
-            lines.append("".join(col))
-
-        # Diagonales (↘)
-        for k in range(-n + 1, n):
-            diag = []
-            for r in range(n):
-                c = r + k
-                if 0 <= c < n:
-                    diag.append(board[r][c] if board[r][c] != EMPTY else ".")
-            if len(diag) >= 5:
-                lines.append("".join(diag))
-
-        # Diagonales (↗)
-        for k in range(0, 2 * n - 1):
-            diag = []
-            for r in range(n):
-                c = k - r
-                if 0 <= c < n:
-                    diag.append(board[r][c] if board[r][c] != EMPTY else ".")
-            if len(diag) >= 5:
-                lines.append("".join(diag))
-
-        return lines
+            lines.append((c, n * n, n))
+        # Diagonales (↘): départ sur la première ligne ou la première colonne
+        for r0, c0 in [(0, c) for c in range(n)] + [(r, 0) for r in range(1, n)]:
+            length = n - max(r0, c0)
+            if length >= 5:
+                start = r0 * n + c0
+                lines.append((start, start + (length - 1) * (n + 1) + 1, n + 1))
+        # Diagonales (↗): départ sur la première ligne ou la dernière colonne
+        for r0, c0 in [(0, c) for c in range(n)] + [(r, n - 1) for r in range(1, n)]:
+            length = min(n - r0, c0 + 1)
+            if length >= 5:
+                start = r0 * n + c0
+                lines.append((start, start + (length - 1) * (n - 1) + 1, n - 1))
+        self._line_slices = lines
+        self._flat = bytearray(b"." * (n * n))
+
+    def _init_center(self, size):
+        # Distance de Manhattan au centre et bonus d'évaluation, par case r * n + c
+        mid = size // 2
+        self._center_dist = [abs(r - mid) + abs(c - mid) for r in range(size) for c in range(size)]
+        self._center_bonus = [max(0, 8 - d) for d in self._center_dist]
+        self._center_sums = [0, 0]
+
+    def _load_center(self, board):
+        n = self.size
+        sums = [0, 0]
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell == self.ai_player:
+                    sums[0] += self._center_bonus[r * n + c]
+                elif cell == self.human_player:
+                    sums[1] += self._center_bonus[r * n + c]
+        self._center_sums = sums
+
+    def _init_move_tables(self, size):
+        # history[joueur][case] et killers[profondeur] = [case1, case2] (-1: vide)
+        self._history = [[0] * (size * size), [0] * (size * size)]
+        self._killers = [[-1, -1] for _ in range(MAX_SEARCH_DEPTH)]
+
+    def _record_cutoff(self, player, r, c, depth):
+        idx = r * self.size + c
+        if 0 < depth < MAX_SEARCH_DEPTH:
+            killers = self._killers[depth]
+            if idx != killers[0] and idx != killers[1]:
+                killers[1] = killers[0]
+                killers[0] = idx
+        self._history[0 if player == self.ai_player else 1][idx] += depth * depth
+
+    def _load_flat(self, board):
+        n = self.size
+        flat = self._flat
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                flat[r * n + c] = ord(cell) if cell != EMPTY else DOT
+
+    def _extract_lines(self):
+        # Une tranche C par ligne sur le plateau aplati, synchronisé par _make/_unmake
+        flat = self._flat
+        return [flat[start:stop:step] for start, stop, step in self._line_slices]
 
     def _score_line_patterns(self, line, player_char):
         """
-        Score une ligne pour un joueur donné.
-        On mappe:
+        Score une ligne (ou toutes les lignes jointes par LINE_SEP), en bytes,
+        pour un joueur. On mappe (bytes.translate, une passe C):
           - player_char    -> 'O'
           - adversaire     -> 'X'
           - vide / autre   -> '_'
-        puis on applique PATTERN_SCORES.
-        """
-        opp_char = self.human_player if player_char == self.ai_player else self.ai_player
-        mapped = []
-        for ch in line:
-            if ch == player_char:
-                mapped.append("O")
-            elif ch == opp_char:
-                mapped.append("X")
-            else:
-                mapped.append("_")
-        mapped = "".join(mapped)
+        puis on applique PATTERN_SCORES (occurrences chevauchantes comprises).
+        """
+        mapped = line.translate(self._perspective[player_char])
 
+        # Un seul balayage C par pattern sur tout le plateau plutôt que par ligne
         s = 0
-        for pattern, value in PATTERN_SCORES.items():
-            idx = mapped.find(pattern)
+        find = mapped.find
+        for pattern, value in PATTERN_BYTES:
+            idx = find(pattern)
             while idx != -1:
                 s += value
-                idx = mapped.find(pattern, idx + 1)
+                idx = find(pattern, idx + 1)
         return s
 
     def enhanced_evaluation(self, board):
@@ -183,48 +538,44 @@ class AdvancedGomokuAI:
         """
         self.eval_calls += 1
 
-        winner = check_win(board)
+        cache = self._eval_cache
+        position = self._hashes[0]
+        cached = cache.get(position)
+        if cached is not None:
+            cache.move_to_end(position)
+            return cached
+
+        winner = self._winner()
         if winner == self.ai_player:
             return 1_000_000
         if winner == self.human_player:
             return -1_000_000
 
-        ai_score = 0
-        human_score = 0
-        lines = self._extract_lines(board)
-
-        for line in lines:
-            ai_score += self._score_line_patterns(line, self.ai_player)
-            human_score += self._score_line_patterns(line, self.human_player)
-
-        # Bonus de contrôle du centre
-        n = len(board)
-        mid = n // 2
-        center_bonus_ai = 0
-        center_bonus_human = 0
-        for r in range(n):
-            for c in range(n):
-                if board[r][c] == self.ai_player:
-                    center_bonus_ai += max(0, 8 - (abs(r - mid) + abs(c - mid)))
-                elif board[r][c] == self.human_player:
-                    center_bonus_human += max(0, 8 - (abs(r - mid) + abs(c - mid)))
+        board_text = LINE_SEP.join(self._extract_lines())
+        ai_score = self._score_line_patterns(board_text, self.ai_player)
+        human_score = self._score_line_patterns(board_text, self.human_player)
 
-        ai_score += center_bonus_ai
-        human_score += center_bonus_human
+        # Bonus de contrôle du centre (sommes maintenues par _make/_unmake)
+        ai_score += self._center_sums[0]
+        human_score += self._center_sums[1]
 
         # Défense un peu plus importante
-        return ai_score - int(1.1 * human_score)
+        value = ai_score - int(1.1 * human_score)
+        cache[position] = value
+        if len(cache) > EVAL_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return value
 
     # --------- Génération & tri de coups ---------
 
     def generate_moves(self, board, last_move=None, dist=2):
         """
         Génère les coups candidats autour du dernier coup.
-        Fallback sur basic_neighbors si pas assez de candidats.
+        Fallback sur le voisinage de toutes les pierres si pas assez de candidats
+        (maintenu incrémentalement pour dist == CAND_DIST).
         """
         n = len(board)
-        occ = [(r, c) for r in range(n) for c in range(n) if board[r][c] in (HUMAN, AI)]
-        if not occ:
+        if not self._occ_count:
             m = n // 2
             return [(m, m)]
 
@@ -238,13 +589,17 @@ class AdvancedGomokuAI:
 
         # Si pas assez de candidats, on élargit
         if len(cand) < 6:
-            cand.update(basic_neighbors(board, dist))
+            if dist == CAND_DIST:
+                cand.update(cell for cell in self._cand_refcount if board[cell[0]][cell[1]] == EMPTY)
+            else:
+                cand.update(basic_neighbors(board, dist))
 
         return list(cand)
 
-    def advanced_move_ordering(self, board, moves, player, depth, last_move=None):
+    def advanced_move_ordering(self, board, moves, player, depth, last_move=None, pv_hint=None):
         """
         Tri heuristique des coups :
+        - coup de la variation principale / de la TT (pv_hint) en premier
         - coups gagnants immédiats
         - blocks gagnants adverses
         - killer moves
@@ -252,36 +607,44 @@ class AdvancedGomokuAI:
         - proximité du centre / du dernier coup
         """
         n = len(board)
-        mid = n // 2
+        center_dist = self._center_dist
         opponent = self.human_player if player == self.ai_player else self.ai_player
 
-        killer_list = self.killer_moves.get(depth, [])
+        if 0 < depth < MAX_SEARCH_DEPTH:
+            killer1, killer2 = self._killers[depth]
+        else:
+            killer1 = killer2 = -1
+        history = self._history[0 if player == self.ai_player else 1]
         scored = []
 
         for (r, c) in moves:
-            score = 0
             move = (r, c)
+            idx = r * n + c
 
-            # Proximité du centre
-            score -= (abs(r - mid) + abs(c - mid))
+            # Proximité du centre (table précalculée par taille)
+            score = -center_dist[idx]
+
+            if move == pv_hint:
+                score += 2_000_000
 
             # Killer moves
-            if move in killer_list:
+            if idx == killer1 or idx == killer2:
                 score += 50_000
 
             # History heuristic
-            score += self.history_heuristic.get((player, move), 0)
+            score += history[idx]
 
-            # Coups tactiques immédiats
-            board[r][c] = player
-            if check_win(board) == player:
+            # Coups tactiques immédiats (test local autour de la case)
+            row = board[r]
+            row[c] = player
+            if has_five(board, r, c, player):
                 score += 1_000_000  # coup gagnant
             else:
                 # Coup qui bloque un gain adverse
-                board[r][c] = opponent
-                if check_win(board) == opponent:
+                row[c] = opponent
+                if has_five(board, r, c, opponent):
                     score += 200_000
-            board[r][c] = EMPTY
+            row[c] = EMPTY
 
             # Proximité du dernier coup
             if last_move and max(abs(r - last_move[0]), abs(c - last_move[1])) <= 1:
@@ -294,27 +657,36 @@ class AdvancedGomokuAI:
 
     # --------- Quiescence search ---------
 
+    def _start_clock(self, time_limit):
+        self.time_limit = time_limit
+        self.start_time = time.time() if time_limit is not None else None
+        self._deadline = self.start_time + time_limit if time_limit is not None else None
+        self._timed_out = False
+        self._time_check = TIME_CHECK_INTERVAL
+
     def _is_time_over(self):
-        if self.time_limit is None:
+        # Le drapeau reste levé une fois l'échéance passée: plus d'appel à time()
+        if self._timed_out:
+            return True
+        if self._deadline is None:
             return False
-        return (time.time() - self.start_time) >= self.time_limit
+        if time.time() >= self._deadline:
+            self._timed_out = True
+        return self._timed_out
 
     def _is_quiet(self, board):
         """
         Position "calme" si aucun 5 en ligne détecté.
         (On pourrait affiner en détectant aussi les 4 ouverts.)
         """
-        n = len(board)
-        for r in range(n):
-            for c in range(n):
-                if board[r][c] in (self.ai_player, self.human_player):
-                    if has_five(board, r, c, board[r][c]):
-                        return False
-        return True
+        return not (self._bb.has_five(0) or self._bb.has_five(1))
 
     def quiescence_search(self, board, alpha, beta, player, last_move=None, q_depth=2):
-        self.nodes += 1
         stand_pat = self.enhanced_evaluation(board)
+        if self._out_of_time():
+            return stand_pat
+
+        self.nodes += 1
 
         if stand_pat >= beta:
             return beta
@@ -330,11 +702,11 @@ class AdvancedGomokuAI:
         opponent = self.human_player if player == self.ai_player else self.ai_player
 
         for (r, c) in ordered:
-            board[r][c] = player
+            self._make(board, r, c, player)
             score = -self.quiescence_search(
                 board, -beta, -alpha, opponent, last_move=(r, c), q_depth=q_depth - 1
             )
-            board[r][c] = EMPTY
+            self._unmake(board, r, c, player)
 
             if score >= beta:
                 return beta
@@ -345,142 +717,283 @@ class AdvancedGomokuAI:
 
     # --------- Alpha-bêta amélioré ---------
 
-    def alpha_beta(self, board, depth, alpha, beta, player, maximizing, last_move=None, ply=0):
-        if self._is_time_over():
-            # Si temps dépassé: fallback sur une évaluation statique
+    def _terminal_value(self, board, player, last_move, ply):
+        """Score de fin de partie si le dernier coup a aligné 5 pierres, sinon None."""
+        # Seul le dernier coup a pu créer un alignement: test local en O(1)
+        if last_move is None:
+            return None
+        last_player = self.human_player if player == self.ai_player else self.ai_player
+        if not has_five(board, last_move[0], last_move[1], last_player):
+            return None
+        if last_player == self.ai_player:
+            return 1_000_000 - ply  # gagner plus tôt est mieux
+        return -1_000_000 + ply  # perdre plus tard est légèrement mieux
+
+    def _tt_probe(self, key, sym, depth, alpha, beta):
+        """
+        Retourne (valeur de coupure ou None, alpha, beta, coup de la TT).
+        Le coup est stocké dans l'orientation canonique: on le ramène sur le
+        plateau réel via la symétrie inverse.
+        """
+        tt = self.transposition_table
+        tt_entry = tt.get(key)
+        if tt_entry is None:
+            return None, alpha, beta, None
+        tt.move_to_end(key)
+        stored_val, stored_depth, stored_flag, stored_cell = tt_entry
+        hash_move = None
+        if stored_cell is not None:
+            hash_move = divmod(self._sym_perm[INVERSE_SYMMETRY[sym]][stored_cell], self.size)
+        if stored_depth >= depth:
+            if stored_flag == "EXACT":
+                return stored_val, alpha, beta, hash_move
+            elif stored_flag == "LOWERBOUND":
+                alpha = max(alpha, stored_val)
+            elif stored_flag == "UPPERBOUND":
+                beta = min(beta, stored_val)
+            if alpha >= beta:
+                return stored_val, alpha, beta, hash_move
+        return None, alpha, beta, hash_move
+
+    def _tt_store(self, key, sym, best_val, depth, alpha_orig, beta_orig, maximizing, best_local):
+        flag = "EXACT"
+        if best_val <= alpha_orig:
+            flag = "UPPERBOUND" if maximizing else "LOWERBOUND"
+        elif best_val >= beta_orig:
+            flag = "LOWERBOUND" if maximizing else "UPPERBOUND"
+        stored_cell = None
+        if best_local is not None:
+            stored_cell = self._sym_perm[sym][best_local[0] * self.size + best_local[1]]
+        tt = self.transposition_table
+        tt[key] = (best_val, depth, flag, stored_cell)
+        tt.move_to_end(key)
+        if len(tt) > TT_MAX_ENTRIES:
+            tt.popitem(last=False)
+
+    def _out_of_time(self):
+        """
+        Appelé à l'entrée de chaque nœud: décompte dédié, l'horloge n'est lue
+        qu'une fois tous les TIME_CHECK_INTERVAL appels.
+        """
+        if self._timed_out:
+            return True
+        if self._deadline is None:
+            return False
+        self._time_check -= 1
+        if self._time_check > 0:
+            return False
+        self._time_check = TIME_CHECK_INTERVAL
+        return self._is_time_over()
+
+    # --------- Alpha-bêta itératif (pile explicite) ---------
+
+    def search_iter(self, board, depth, alpha, beta, player, maximizing, last_move=None, ply=0):
+        """
+        Recherche alpha-bêta sans récursion Python: chaque nœud
+        intérieur est un _Frame sur une pile explicite. Un coup joué empile
+        l'enfant, le retour d'une valeur dépile et la propage au parent.
+        (La quiescence, peu profonde, reste récursive.)
+        """
+        stack = []
+        value = self._open_node(stack, board, depth, alpha, beta, player, maximizing, last_move, ply)
+
+        while stack:
+            f = stack[-1]
+
+            if value is not None:
+                # Un enfant vient de rendre sa valeur
+                if f.pending is _NULL_MOVE:
+                    f.pending = None
+                    self._null_ok = True
+                    if f.maximizing and value >= f.beta:
+                        self.cutoffs += 1
+                        value = f.beta
+                        stack.pop()
+                        continue
+                    if not f.maximizing and value <= f.alpha:
+                        self.cutoffs += 1
+                        value = f.alpha
+                        stack.pop()
+                        continue
+                    value = None
+                    if not self._expand(f, board):
+                        value = self.enhanced_evaluation(board)
+                        stack.pop()
+                        continue
+                else:
+                    r, c = f.pending
+                    f.pending = None
+                    self._unmake(board, r, c, f.player)
+                    val = value
+                    value = None
+                    if f.maximizing:
+                        if val > f.best_val:
+                            f.best_val = val
+                            f.best_local = (r, c)
+                        if f.best_val > f.alpha:
+                            f.alpha = f.best_val
+                        if val >= f.beta:
+                            self.cutoffs += 1
+                            self._record_cutoff(f.player, r, c, f.depth)
+                            f.index = len(f.moves)
+                    else:
+                        if val < f.best_val:
+                            f.best_val = val
+                            f.best_local = (r, c)
+                        if f.best_val < f.beta:
+                            f.beta = f.best_val
+                        if val <= f.alpha:
+                            self.cutoffs += 1
+                            self._record_cutoff(f.player, r, c, f.depth)
+                            f.index = len(f.moves)
+
+            if f.index < len(f.moves):
+                r, c = f.moves[f.index]
+                f.index += 1
+                self._make(board, r, c, f.player)
+                f.pending = (r, c)
+                value = self._open_node(
+                    stack, board, f.depth - 1, f.alpha, f.beta, f.opponent,
+                    not f.maximizing, (r, c), f.ply + 1,
+                )
+                continue
+
+            # Tous les coups vus (ou coupure): stockage TT et retour au parent
+            self._tt_store(
+                f.key, f.sym, f.best_val, f.depth, f.alpha_orig, f.beta_orig, f.maximizing,
+                f.best_local,
+            )
+            value = f.best_val
+            stack.pop()
+
+        return value
+
+    def _open_node(self, stack, board, depth, alpha, beta, player, maximizing, last_move, ply):
+        """
+        Prologue d'un nœud (temps, fin de partie, feuille, TT, coup nul).
+        Retourne sa valeur s'il est résolu immédiatement, sinon empile son
+        _Frame (ou celui de son coup nul) et retourne None.
+        """
+        if self._out_of_time():
             return self.enhanced_evaluation(board)
 
         self.nodes += 1
 
-        winner = check_win(board)
-        if winner == self.ai_player:
-            return 1_000_000 - ply  # gagner plus tôt est mieux
-        if winner == self.human_player:
-            return -1_000_000 + ply  # perdre plus tard est légèrement mieux
+        terminal = self._terminal_value(board, player, last_move, ply)
+        if terminal is not None:
+            return terminal
 
         if depth == 0:
             return self.quiescence_search(board, alpha, beta, player, last_move=last_move)
 
         alpha_orig, beta_orig = alpha, beta
+        key, sym = self._board_key(player, depth)
+        cut, alpha, beta, hash_move = self._tt_probe(key, sym, depth, alpha, beta)
+        if cut is not None:
+            return cut
 
-        # Table de transposition
-        key = self._board_key(board, player, depth)
-        tt_entry = self.transposition_table.get(key)
-        if tt_entry is not None:
-            stored_val, stored_depth, stored_flag = tt_entry
-            if stored_depth >= depth:
-                if stored_flag == "EXACT":
-                    return stored_val
-                elif stored_flag == "LOWERBOUND":
-                    alpha = max(alpha, stored_val)
-                elif stored_flag == "UPPERBOUND":
-                    beta = min(beta, stored_val)
-                if alpha >= beta:
-                    return stored_val
-
-        moves = self.generate_moves(board, last_move=last_move)
-        if not moves:
-            return self.enhanced_evaluation(board)
-
-        ordered_moves = self.advanced_move_ordering(board, moves, player, depth, last_move=last_move)
         opponent = self.human_player if player == self.ai_player else self.ai_player
-
-        best_val = -inf if maximizing else inf
-
-        for (r, c) in ordered_moves:
-            board[r][c] = player
-            val = self.alpha_beta(
-                board,
-                depth - 1,
-                alpha,
-                beta,
-                opponent,
-                not maximizing,
-                last_move=(r, c),
-                ply=ply + 1,
+        f = _Frame(
+            depth, alpha, beta, player, opponent, maximizing, last_move, ply,
+            alpha_orig, beta_orig, key, sym, hash_move,
+        )
+
+        if self._null_move_allowed(depth, beta if maximizing else alpha, ply):
+            self._null_ok = False
+            f.pending = _NULL_MOVE
+            stack.append(f)
+            if maximizing:
+                return self._open_node(
+                    stack, board, depth - 1 - NULL_MOVE_R, beta - 1, beta, opponent, False, None, ply + 1
+                )
+            return self._open_node(
+                stack, board, depth - 1 - NULL_MOVE_R, alpha, alpha + 1, opponent, True, None, ply + 1
             )
-            board[r][c] = EMPTY
 
-            if maximizing:
-                if val > best_val:
-                    best_val = val
-                if best_val > alpha:
-                    alpha = best_val
-                if val >= beta:
-                    self.cutoffs += 1
-                    # killer move & history heuristic
-                    killers = self.killer_moves.get(depth, [])
-                    move = (r, c)
-                    if move not in killers:
-                        killers = [move] + killers[:1]
-                        self.killer_moves[depth] = killers
-                    self.history_heuristic[(player, move)] = (
-                        self.history_heuristic.get((player, move), 0) + depth * depth
-                    )
-                    break
-            else:
-                if val < best_val:
-                    best_val = val
-                if best_val < beta:
-                    beta = best_val
-                if val <= alpha:
-                    self.cutoffs += 1
-                    killers = self.killer_moves.get(depth, [])
-                    move = (r, c)
-                    if move not in killers:
-                        killers = [move] + killers[:1]
-                        self.killer_moves[depth] = killers
-                    self.history_heuristic[(player, move)] = (
-                        self.history_heuristic.get((player, move), 0) + depth * depth
-                    )
-                    break
-
-        # Mise à jour de la table de transposition
-        flag = "EXACT"
-        if best_val <= alpha_orig:
-            flag = "UPPERBOUND" if maximizing else "LOWERBOUND"
-        elif best_val >= beta_orig:
-            flag = "LOWERBOUND" if maximizing else "UPPERBOUND"
-        self.transposition_table[key] = (best_val, depth, flag)
+        if not self._expand(f, board):
+            return self.enhanced_evaluation(board)
+        stack.append(f)
+        return None
+
+    def _expand(self, f, board):
+        """Génère et trie les coups du nœud; False s'il n'y en a aucun."""
+        moves = self.generate_moves(board, last_move=f.last_move)
+        if not moves:
+            return False
+        f.moves = self.advanced_move_ordering(
+            board, moves, f.player, f.depth, last_move=f.last_move, pv_hint=f.hash_move
+        )
+        return True
 
-        return best_val
+    def _null_move_allowed(self, depth, bound, ply):
+        """
+        Pas de coup nul: à la racine, en fin d'arbre, juste après un autre coup nul,
+        si la borne testée (beta pour le max, alpha pour le min) est infinie ou
+        proche d'un gain forcé, ou si une ligne de 4 existe déjà (passer son tour
+        serait alors suicidaire).
+        """
+        if not self._null_ok or ply == 0 or depth < NULL_MOVE_MIN_DEPTH:
+            return False
+        if abs(bound) >= WIN_THRESHOLD:
+            return False
+        return not (self._bb.has_four(0) or self._bb.has_four(1))
 
     # --------- Iterative deepening ---------
 
     def iterative_deepening(self, board, max_depth, time_limit):
-        self.time_limit = time_limit
-        self.start_time = time.time()
+        self._start_clock(time_limit)
 
         best_move = None
         best_score = None
 
         for depth in range(1, max_depth + 1):
-            self.killer_moves.clear()  # on réinitialise les killer moves à chaque itération
-            try_move, try_score = self._search_root(board, depth)
+            # Killers conservés d'une itération à l'autre, history amortie de moitié
+            self._history = [[v // 2 for v in table] for table in self._history]
+            if best_score is None:
+                try_move, try_score = self._search_root(board, depth)
+            else:
+                # Fenêtre étroite d'abord, élargie (x2) en cas d'échec haut/bas
+                delta = ASPIRATION_DELTA
+                for _ in range(ASPIRATION_MAX_WIDENINGS):
+                    alpha, beta = best_score - delta, best_score + delta
+                    try_move, try_score = self._search_root(board, depth, alpha, beta)
+                    if self._is_time_over() or alpha < try_score < beta:
+                        break
+                    delta *= 2
+                else:
+                    try_move, try_score = self._search_root(board, depth)
             if self._is_time_over():
                 break
             best_move, best_score = try_move, try_score
+            self._pv_move = best_move  # PV de la profondeur d, jouée en premier à d + 1
 
         return best_move, best_score
 
-    def _search_root(self, board, depth):
+    def _search_root(self, board, depth, alpha=-inf, beta=inf):
         """
         Recherche à la racine : on sait que c'est le tour de l'IA.
+        (alpha, beta) permet une recherche en fenêtre d'aspiration.
         """
-        player = self.ai_player
+        return self._search_root_moves(board, self._root_moves(board, depth), depth, alpha, beta)
+
+    def _root_moves(self, board, depth):
         moves = self.generate_moves(board)
-        ordered = self.advanced_move_ordering(board, moves, player, depth, last_move=None)
+        return self.advanced_move_ordering(
+            board, moves, self.ai_player, depth, last_move=None, pv_hint=self._pv_move
+        )
+
+    def _search_root_moves(self, board, ordered, depth, alpha=-inf, beta=inf):
+        player = self.ai_player
         opponent = self.human_player
 
         best_val = -inf
         best_move = None
 
-        alpha, beta = -inf, inf
         for (r, c) in ordered:
             if self._is_time_over():
                 break
-            board[r][c] = player
-            val = self.alpha_beta(
+            self._make(board, r, c, player)
+            val = self.search_iter(
                 board,
                 depth - 1,
                 alpha,
@@ -490,17 +1003,98 @@ class AdvancedGomokuAI:
                 last_move=(r, c),
                 ply=1,
             )
-            board[r][c] = EMPTY
+            self._unmake(board, r, c, player)
             if val > best_val:
                 best_val = val
                 best_move = (r, c)
             if val > alpha:
                 alpha = val
+            if val >= beta:
+                break  # échec haut: l'appelant élargit la fenêtre
 
         return best_move, best_val
 
+    def _parallel_search_root(self, board, depth):
+        """
+        Parallélisation à la racine: les coups racine sont répartis (round-robin,
+        pour équilibrer les bons coups) entre processus, chacun avec sa propre TT.
+        Retourne None si la parallélisation n'est pas possible (fallback séquentiel).
+        """
+        ordered = self._root_moves(board, depth)
+        workers = min(self.workers, len(ordered))
+        if workers < 2:
+            return None
+        chunks = [ordered[i::workers] for i in range(workers)]
+        try:
+            results = list(
+                _get_executor(workers).map(
+                    _search_root_chunk, repeat(board), chunks, repeat(depth), repeat(self.ai_player)
+                )
+            )
+        except Exception:
+            # Pool cassé / module non importable dans le sous-processus
+            _shutdown_executor()
+            return None
+
+        rank = {move: i for i, move in enumerate(ordered)}
+        best_move, best_val = None, -inf
+        for move, val, nodes, cutoffs, eval_calls in results:
+            self.nodes += nodes
+            self.cutoffs += cutoffs
+            self.eval_calls += eval_calls
+            if move is None:
+                continue
+            # À score égal, on garde le coup le mieux classé (comme en séquentiel)
+            if val > best_val or (val == best_val and rank[move] < rank[best_move]):
+                best_move, best_val = move, val
+        return best_move, best_val
+
     # --------- API publique ---------
 
+    def _book_move(self, board):
+        """
+        Coup de la bibliothèque d'ouvertures pour `board` (IA au trait), ou None.
+        La position est ramenée à sa forme canonique parmi les 8 symétries.
+        """
+        n = len(board)
+        mid = n // 2
+        stones = []
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell != EMPTY:
+                    stones.append((r - mid, c - mid, "A" if cell == self.ai_player else "H"))
+                    if len(stones) > OPENING_BOOK_MAX_STONES:
+                        return None
+
+        k, key = _canonical_stones(stones)
+        rel = self.opening_book.get(key)
+        if rel is None:
+            return None
+        dr, dc = SYMMETRIES[INVERSE_SYMMETRY[k]](*rel)
+        r, c = mid + dr, mid + dc
+        if not (0 <= r < n and 0 <= c < n) or board[r][c] != EMPTY:
+            return None
+        return (r, c)
+
+    def _prepare(self, board):
+        """Synchronise hash, bitboards, plateau aplati et voisinage avec `board`."""
+        if len(board) != self.size:
+            self.size = len(board)
+            self._init_zobrist(self.size)
+            self._init_lines(self.size)
+            self._init_move_tables(self.size)
+            self._init_center(self.size)
+        self._hashes = self._compute_hashes(board)
+        self._load_bitboards(board)
+        self._load_flat(board)
+        self._load_center(board)
+        self._load_candidates(board)
+        self._pv_move = None
+        self.nodes = 0
+        self.cutoffs = 0
+        self.eval_calls = 0
+        self.transposition_table.clear()
+
     def best_move(self, board, depth=3, time_limit=None):
         """
         Choisit le meilleur coup pour l'IA.
@@ -511,18 +1105,21 @@ class AdvancedGomokuAI:
           - move : (row, col)
           - stats : dict (score, nodes, cutoffs, eval_calls)
         """
-        self.size = len(board)
-        self.nodes = 0
-        self.cutoffs = 0
-        self.eval_calls = 0
-        self.transposition_table.clear()
+        # Ouverture connue: aucun calcul
+        book_move = self._book_move(board)
+        if book_move is not None:
+            return book_move, {"score": 0, "nodes": 0, "cutoffs": 0, "eval_calls": 0, "book": True}
+
+        self._prepare(board)
 
         if time_limit is not None:
             move, score = self.iterative_deepening(board, depth, time_limit)
         else:
-            self.time_limit = None
-            self.start_time = None
-            move, score = self._search_root(board, depth)
+            self._start_clock(None)
+            result = None
+            if depth >= PARALLEL_MIN_DEPTH and self.workers > 1:
+                result = self._parallel_search_root(board, depth)
+            move, score = result if result is not None else self._search_root(board, depth)
 
         return move, {
             "score": score,
@@ -532,8 +1129,82 @@ class AdvancedGomokuAI:
         }
 
 
+# --------- Bibliothèque d'ouvertures ---------
+
+# (pierres (dr, dc, "A" = camp au trait / "H" = adversaire), coup à jouer)
+OPENING_LINES = (
+    ((), (0, 0)),
+    # L'adversaire a ouvert: au centre -> diagonale, ailleurs -> on prend le centre
+    (((0, 0, "H"),), (1, 1)),
+    (((0, 1, "H"),), (0, 0)),
+    (((1, 1, "H"),), (0, 0)),
+    (((0, 2, "H"),), (0, 0)),
+    (((1, 2, "H"),), (0, 0)),
+    (((2, 2, "H"),), (0, 0)),
+    # On a ouvert au centre: 3e pierre au contact des deux premières
+    (((0, 0, "A"), (0, 1, "H")), (1, 1)),
+    (((0, 0, "A"), (1, 1, "H")), (0, 1)),
+)
+OPENING_BOOK_MAX_STONES = max(len(stones) for stones, _ in OPENING_LINES)
+
+
+def _canonical_stones(stones):
+    """(indice k de la symétrie retenue, clé canonique = plus petite forme triée)."""
+    best_k, best_key = 0, None
+    for k, transform in enumerate(SYMMETRIES):
+        key = tuple(sorted((*transform(dr, dc), who) for dr, dc, who in stones))
+        if best_key is None or key < best_key:
+            best_k, best_key = k, key
+    return best_k, best_key
+
+
+def _build_opening_book():
+    book = {}
+    for stones, move in OPENING_LINES:
+        k, key = _canonical_stones(stones)
+        book[key] = SYMMETRIES[k](*move)
+    return book
+
+
+OPENING_BOOK = _build_opening_book()
+
+
+# --------- Recherche racine parallèle ---------
+
+_executor = None
+_executor_workers = 0
+
+
+def _get_executor(workers):
+    # Pool réutilisé d'un coup à l'autre (démarrer des processus coûte cher)
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        _shutdown_executor()
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def _shutdown_executor():
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = 0
+
+
+def _search_root_chunk(board, moves, depth, ai_player):
+    """Worker: cherche un sous-ensemble des coups racine dans un processus dédié."""
+    ai = AdvancedGomokuAI(size=len(board), ai_player=ai_player, workers=1)
+    ai._prepare(board)
+    ai._start_clock(None)
+    move, val = ai._search_root_moves(board, moves, depth)
+    return move, val, ai.nodes, ai.cutoffs, ai.eval_calls
+
+
 # Singleton pratique si tu veux garder une API fonctionnelle simple
-_global_ai = AdvancedGomokuAI()
+# (parallèle seulement si HVM_AI_WORKERS est défini, cf. minimax_engine)
+_global_ai = AdvancedGomokuAI(workers=int(os.environ.get("HVM_AI_WORKERS", "1")))
 
 
 def best_move(board, depth=3, time_limit=None):
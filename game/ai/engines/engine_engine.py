@@ -1,6 +1,9 @@
 # game/ai/engines/engine_engine.py
 from __future__ import annotations
 
+from array import array
+from functools import lru_cache
+from operator import mul
 from typing import Dict, List, Optional, Tuple
 import random
 
@@ -8,6 +11,14 @@ import random
 #   0  = empty
 #   1  = Human (X)
 #  -1  = AI (O)
+#
+# The search works on a flat array('b') of n*n cells, buf[r * n + c]
+# (see _flatten); the public API keeps taking List[List[int]].
+
+# Candidate moves are empty cells within this distance of a stone
+CANDIDATE_RADIUS = 2
+
+DIRS = [(1, 0), (0, 1), (1, 1), (1, -1)]
 
 
 def _difficulty_to_depth(difficulty: str) -> int:
@@ -25,135 +36,179 @@ def _in_bounds(n: int, r: int, c: int) -> bool:
     return 0 <= r < n and 0 <= c < n
 
 
-def _legal_moves(board: List[List[int]]) -> List[Tuple[int, int]]:
-    n = len(board)
-    return [(r, c) for r in range(n) for c in range(n) if board[r][c] == 0]
+def _flatten(board: List[List[int]]) -> array:
+    """Row-major array('b') copy of the board."""
+    return array("b", [v for row in board for v in row])
+
+
+@lru_cache(maxsize=None)
+def _center_weights(n: int) -> bytes:
+    """Per-cell center bonus max(0, 8 - manhattan distance to center)."""
+    center = n // 2
+    return bytes(
+        max(0, 8 - abs(r - center) - abs(c - center)) for r in range(n) for c in range(n)
+    )
+
 
+@lru_cache(maxsize=None)
+def _neighbors8(n: int) -> Tuple[Tuple[int, ...], ...]:
+    """For each cell, the flat indexes of its (up to 8) adjacent cells."""
+    return tuple(
+        tuple(
+            rr * n + cc
+            for rr in range(r - 1, r + 2)
+            for cc in range(c - 1, c + 2)
+            if (rr, cc) != (r, c) and _in_bounds(n, rr, cc)
+        )
+        for r in range(n)
+        for c in range(n)
+    )
 
-def _has_any_stone(board: List[List[int]]) -> bool:
-    return any(v != 0 for row in board for v in row)
 
+def _legal_moves(buf: array, n: int) -> List[Tuple[int, int]]:
+    return [divmod(i, n) for i in range(n * n) if buf[i] == 0]
 
-def _candidate_moves(board: List[List[int]], k: int = 18, radius: int = 2) -> List[Tuple[int, int]]:
+
+def _has_any_stone(buf: array) -> bool:
+    return buf.count(0) != len(buf)
+
+
+def _spread_influence(
+    influence: array, n: int, r: int, c: int, delta: int, radius: int = CANDIDATE_RADIUS
+) -> None:
+    """Add delta to the influence count of every cell within radius of (r,c)."""
+    for rr in range(max(0, r - radius), min(n, r + radius + 1)):
+        base = rr * n
+        for cc in range(max(0, c - radius), min(n, c + radius + 1)):
+            influence[base + cc] += delta
+
+
+def _build_influence(buf: array, n: int, radius: int = CANDIDATE_RADIUS) -> array:
+    """
+    Number of stones within radius of each cell. Search code keeps it in
+    step with the board (_spread_influence +1 / -1 around each move) so
+    candidates never need a rescan of all stones.
+    """
+    influence = array("b", bytes(n * n))
+    for i in range(n * n):
+        if buf[i] != 0:
+            _spread_influence(influence, n, i // n, i % n, 1, radius)
+    return influence
+
+
+def _candidate_moves(
+    buf: array,
+    n: int,
+    k: int = 18,
+    radius: int = CANDIDATE_RADIUS,
+    influence: Optional[array] = None,
+) -> List[Tuple[int, int]]:
     """
     Reduce branching: consider empty cells near existing stones.
     If board is empty -> play center.
     """
-    n = len(board)
-    if not _has_any_stone(board):
+    if not _has_any_stone(buf):
         center = n // 2
         return [(center, center)]
 
-    candidates = set()
-    for r in range(n):
-        for c in range(n):
-            if board[r][c] != 0:
-                for dr in range(-radius, radius + 1):
-                    for dc in range(-radius, radius + 1):
-                        rr, cc = r + dr, c + dc
-                        if _in_bounds(n, rr, cc) and board[rr][cc] == 0:
-                            candidates.add((rr, cc))
-
-    cand = list(candidates)
+    if influence is None:
+        influence = _build_influence(buf, n, radius)
+
+    cand = [divmod(i, n) for i in range(n * n) if influence[i] and buf[i] == 0]
     # If too many, sample deterministically-ish by sorting then taking k
     cand.sort(key=lambda x: (abs(x[0] - n // 2) + abs(x[1] - n // 2), x[0], x[1]))
     return cand[:k] if len(cand) > k else cand
 
 
-def _count_in_direction(board: List[List[int]], r: int, c: int, dr: int, dc: int, player: int) -> int:
+def _count_in_direction(
+    buf: array, n: int, r: int, c: int, dr: int, dc: int, player: int
+) -> int:
     """Count consecutive stones for player starting from next cell in (dr,dc)."""
-    n = len(board)
     cnt = 0
     rr, cc = r + dr, c + dc
-    while _in_bounds(n, rr, cc) and board[rr][cc] == player:
+    while _in_bounds(n, rr, cc) and buf[rr * n + cc] == player:
         cnt += 1
         rr += dr
         cc += dc
     return cnt
 
 
-def _is_winning_move(board: List[List[int]], r: int, c: int, player: int) -> bool:
+def _is_winning_move(buf: array, n: int, r: int, c: int, player: int) -> bool:
     """Check if placing player at (r,c) makes 5 in a row."""
-    if board[r][c] != 0:
+    if buf[r * n + c] != 0:
         return False
 
-    board[r][c] = player
-    try:
-        dirs = [(1, 0), (0, 1), (1, 1), (1, -1)]
-        for dr, dc in dirs:
-            a = _count_in_direction(board, r, c, dr, dc, player)
-            b = _count_in_direction(board, r, c, -dr, -dc, player)
-            if 1 + a + b >= 5:
-                return True
-        return False
-    finally:
-        board[r][c] = 0
+    # The cell itself is empty, so the two runs around it can be counted
+    # without placing the stone.
+    for dr, dc in DIRS:
+        a = _count_in_direction(buf, n, r, c, dr, dc, player)
+        b = _count_in_direction(buf, n, r, c, -dr, -dc, player)
+        if 1 + a + b >= 5:
+            return True
+    return False
 
 
-def _heuristic(board: List[List[int]]) -> int:
+def _heuristic(buf: array, n: int) -> int:
     """
     Evaluate position from AI perspective.
     Positive => good for AI (-1), negative => good for Human (1).
     """
-    n = len(board)
-    center = n // 2
-
-    # Center preference + local neighborhood activity
-    score = 0
-    for r in range(n):
-        for c in range(n):
-            v = board[r][c]
-            if v == 0:
-                continue
-            # closer to center is better (both players, but weighted for AI)
-            dist = abs(r - center) + abs(c - center)
-            w_center = max(0, 8 - dist)  # small bonus
-            # AI stones add, Human stones subtract
-            score += (-v) * w_center  # because AI is -1 (so -(-1)=+1)
-
-            # neighborhood influence
-            for dr in (-1, 0, 1):
-                for dc in (-1, 0, 1):
-                    if dr == 0 and dc == 0:
-                        continue
-                    rr, cc = r + dr, c + dc
-                    if _in_bounds(n, rr, cc) and board[rr][cc] == 0:
-                        score += (-v) * 1
+    # Center preference: closer to center is better, AI stones add and
+    # Human stones subtract (-v), so the whole term is one dot product.
+    score = -sum(map(mul, _center_weights(n), buf))
+
+    # Neighborhood influence: each empty cell next to a stone counts for
+    # its owner
+    neighbors = _neighbors8(n)
+    for i, v in enumerate(buf):
+        if v == 0:
+            continue
+        free = 0
+        for j in neighbors[i]:
+            if buf[j] == 0:
+                free += 1
+        score -= v * free
 
     return score
 
 
 def _minimax_ab(
-    board: List[List[int]],
+    buf: array,
+    n: int,
     depth: int,
     player_to_move: int,
     alpha: int,
     beta: int,
+    influence: Optional[array] = None,
 ) -> int:
     """
     Alpha-beta minimax.
     player_to_move: -1 AI, 1 Human
+    influence: counts from _build_influence, updated in place on each move
     Returns evaluation from AI perspective.
     """
     # Terminal / depth limit
     if depth == 0:
-        return _heuristic(board)
+        return _heuristic(buf, n)
+
+    if influence is None:
+        influence = _build_influence(buf, n)
 
     # Candidate moves to reduce branching
-    moves = _candidate_moves(board, k=20, radius=2)
+    moves = _candidate_moves(buf, n, k=20, influence=influence)
     if not moves:
-        return _heuristic(board)
+        return _heuristic(buf, n)
 
     # Quick tactical: immediate win / immediate block
     # If current player can win now, prioritize
     for r, c in moves:
-        if _is_winning_move(board, r, c, player_to_move):
+        if _is_winning_move(buf, n, r, c, player_to_move):
             # Big swing: if AI wins => very positive; if Human wins => very negative
             return 10**8 if player_to_move == -1 else -(10**8)
 
     # If opponent has an immediate win next, block if possible (tactical safety)
     opp = -player_to_move
-    opp_wins = [(r, c) for (r, c) in moves if _is_winning_move(board, r, c, opp)]
+    opp_wins = [(r, c) for (r, c) in moves if _is_winning_move(buf, n, r, c, opp)]
     if opp_wins:
         # If multiple threats, still evaluate deeper, but this penalizes not blocking
         # Encourage blocking by returning a big value for the side to move if it can block.
@@ -166,11 +221,14 @@ def _minimax_ab(
     if maximizing:
         best = -10**9
         for r, c in moves:
-            if board[r][c] != 0:
+            i = r * n + c
+            if buf[i] != 0:
                 continue
-            board[r][c] = -1
-            val = _minimax_ab(board, depth - 1, 1, alpha, beta)
-            board[r][c] = 0
+            buf[i] = -1
+            _spread_influence(influence, n, r, c, 1)
+            val = _minimax_ab(buf, n, depth - 1, 1, alpha, beta, influence)
+            _spread_influence(influence, n, r, c, -1)
+            buf[i] = 0
             best = max(best, val)
             alpha = max(alpha, best)
             if beta <= alpha:
@@ -179,11 +237,14 @@ def _minimax_ab(
     else:
         best = 10**9
         for r, c in moves:
-            if board[r][c] != 0:
+            i = r * n + c
+            if buf[i] != 0:
                 continue
-            board[r][c] = 1
-            val = _minimax_ab(board, depth - 1, -1, alpha, beta)
-            board[r][c] = 0
+            buf[i] = 1
+            _spread_influence(influence, n, r, c, 1)
+            val = _minimax_ab(buf, n, depth - 1, -1, alpha, beta, influence)
+            _spread_influence(influence, n, r, c, -1)
+            buf[i] = 0
             best = min(best, val)
             beta = min(beta, best)
             if beta <= alpha:
@@ -208,16 +269,19 @@ def compute_ai_move(
         # fallback
         return 0, 0, {"score": 0, "depth": depth}
 
+    buf = _flatten(board)
+
     # If board empty -> center
-    if not _has_any_stone(board):
+    if not _has_any_stone(buf):
         center = n // 2
         return center, center, {"score": 0, "depth": depth}
 
     # Candidate moves near stones
-    moves = _candidate_moves(board, k=24, radius=2)
+    influence = _build_influence(buf, n)
+    moves = _candidate_moves(buf, n, k=24, influence=influence)
     if not moves:
         # fallback to any legal move
-        lm = _legal_moves(board)
+        lm = _legal_moves(buf, n)
         if not lm:
             return 0, 0, {"score": 0, "depth": depth}
         r, c = random.choice(lm)
@@ -225,11 +289,11 @@ def compute_ai_move(
 
     # Tactical: immediate win for AI
     for r, c in moves:
-        if _is_winning_move(board, r, c, -1):
+        if _is_winning_move(buf, n, r, c, -1):
             return r, c, {"score": 10**8, "depth": depth}
 
     # Tactical: block immediate win for Human
-    threats = [(r, c) for (r, c) in moves if _is_winning_move(board, r, c, 1)]
+    threats = [(r, c) for (r, c) in moves if _is_winning_move(buf, n, r, c, 1)]
     if threats:
         # if multiple, pick one closest to center
         threats.sort(key=lambda x: (abs(x[0] - n // 2) + abs(x[1] - n // 2), x[0], x[1]))
@@ -240,11 +304,16 @@ def compute_ai_move(
     best_moves: List[Tuple[int, int]] = []
 
     for r, c in moves:
-        if board[r][c] != 0:
+        i = r * n + c
+        if buf[i] != 0:
             continue
-        board[r][c] = -1
-        score = _minimax_ab(board, depth - 1, player_to_move=1, alpha=-10**9, beta=10**9)
-        board[r][c] = 0
+        buf[i] = -1
+        _spread_influence(influence, n, r, c, 1)
+        score = _minimax_ab(
+            buf, n, depth - 1, player_to_move=1, alpha=-10**9, beta=10**9, influence=influence
+        )
+        _spread_influence(influence, n, r, c, -1)
+        buf[i] = 0
 
         if score > best_score:
             best_score = score
@@ -254,7 +323,7 @@ def compute_ai_move(
 
     if not best_moves:
         # fallback safe
-        lm = _legal_moves(board)
+        lm = _legal_moves(buf, n)
         if not lm:
             return 0, 0, {"score": 0, "depth": depth}
         r, c = random.choice(lm)
@@ -1,14 +1,27 @@
 
-import math
+import heapq
+import os
 import random
 import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+from operator import add, xor
 from typing import List, Optional, Tuple, Dict
 
 # ==================== Constants & Configuration ====================
 
 BOARD_SIZE = 15
+CELL_COUNT = BOARD_SIZE * BOARD_SIZE
 WIN_LEN = 5
 
+# Board encoding (same as engines/engine_engine.py): flat array('b') of
+# CELL_COUNT bytes, row-major, board[r * BOARD_SIZE + c]
+EMPTY = 0
+X = 1  # Human
+O = -1  # AI
+
 # Directions: vertical, horizontal, two diagonals
 DIRS = [(1, 0), (0, 1), (1, 1), (1, -1)]
 
@@ -39,30 +52,139 @@ DIFFICULTY_PARAMS = {
     "challenge": {"max_depth": 6, "radius": 1, "max_candidates": 30, "noise": 0},
 }
 
+# Upper bound on DIFFICULTY_PARAMS max_depth (sizes the killer table)
+MAX_DEPTH = 16
+NO_MOVE = -1
+
+# Search window bound: above any evaluation (WIN plus pattern sums), and
+# an int so scores never mix with floats
+INF = 1_000_000_000
+
+# Null-move pruning: depth reduction, minimum remaining depth, and the
+# pattern total of the side not to move above which the position is too
+# sharp to pass (an open three or any four)
+NULL_MOVE_R = 2
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_MAX_THREAT = PATTERN_SCORES[OPEN_THREE]
+
+# Late move reductions: moves from LMR_MIN_INDEX on, at nodes with at
+# least LMR_MIN_DEPTH plies left, are first searched LMR_REDUCTION plies
+# shallower. A move whose placement swings the pattern totals by at least
+# LMR_THREAT_DELTA (making or blocking a four) is never reduced.
+LMR_MIN_INDEX = 4
+LMR_MIN_DEPTH = 3
+LMR_REDUCTION = 1
+LMR_THREAT_DELTA = PATTERN_SCORES[HALF_OPEN_FOUR] - PATTERN_SCORES[OPEN_THREE]
+
+# Aspiration windows: re-searches (doubling the margin) before a side of
+# the window is opened to infinity
+ASPIRATION_MAX_WIDENINGS = 3
+
+# Root moves are split across processes from this depth on. Opt-in with
+# HVM_AI_WORKERS=<n> (dedicated AI processes only): forking a threaded
+# server worker is unsafe and the pool lives as long as the process.
+PARALLEL_MIN_DEPTH = 3
+PARALLEL_WORKERS = max(1, int(os.environ.get("HVM_AI_WORKERS", "1")))
+
 # ==================== Module-Level State ====================
 
-# Zobrist keys for hashing board positions (lazy initialization)
-_zobrist_keys: Optional[List[List[List[int]]]] = None
+# Zobrist keys for hashing board positions (lazy initialization), packed
+# three per cell: _zobrist_keys[3 * idx + 1 + cell], the EMPTY key being 0
+_zobrist_keys: Optional[array] = None
+
+# Offset of each cell's EMPTY key in _zobrist_keys
+_ZOBRIST_BASE = range(1, 3 * CELL_COUNT, 3)
+
+# Hashed in by a null move: the same stones with the other side to move
+_zobrist_pass = 0
+
+# Transposition table: fixed-size, open-addressed on node_hash & TT_MASK.
+# _tt_keys holds the full hash, _tt_data the packed entry (see _tt_store);
+# both are allocated by _init_zobrist.
+# flag: what the stored fail-soft score is relative to the true value
+TT_EXACT = 0
+TT_LOWERBOUND = 1  # true value >= score (failed high)
+TT_UPPERBOUND = 2  # true value <= score (failed low)
+TT_BITS = 20
+TT_MASK = (1 << TT_BITS) - 1
+TT_SCORE_OFFSET = 1 << 31
+TT_NO_MOVE = 0xFF
+_tt_keys: Optional[array] = None
+_tt_data: Optional[array] = None
 
-# Transposition table: hash -> (depth, score, flag, best_move)
-_transposition_table: Dict[int, Tuple[int, int, int, Optional[Tuple[int, int]]]] = {}
+# Search generation (8 bits), bumped by each choose_best_move: entries
+# from older searches are always replaceable
+_tt_age = 0
 
-# History heuristic table: move frequency for ordering
-_history_table: Optional[List[List[int]]] = None
+# History heuristic table: flat cell index -> cutoff weight
+_history_table: array = array("q", bytes(8 * CELL_COUNT))
 
-# Killer moves: depth -> [move1, move2]
-_killer_moves: Dict[int, List[Optional[Tuple[int, int]]]] = {}
+# Killer moves: two flat cell indexes per depth, at [2*depth] and [2*depth+1]
+_killer_moves: array = array("h", [NO_MOVE] * (2 * (MAX_DEPTH + 1)))
 
 
 def _init_zobrist():
-    """One-time initialization of Zobrist keys and history table."""
-    global _zobrist_keys, _history_table
+    """One-time initialization of Zobrist keys and transposition table."""
+    global _zobrist_keys, _zobrist_pass, _tt_keys, _tt_data
     if _zobrist_keys is None:
-        _zobrist_keys = [
-            [[random.getrandbits(64) for _ in range(2)] for _ in range(BOARD_SIZE)]
-            for _ in range(BOARD_SIZE)
-        ]
-        _history_table = [[0] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+        _zobrist_keys = array(
+            "Q", [random.getrandbits(64) if k % 3 != 1 else 0 for k in range(3 * CELL_COUNT)]
+        )
+        _zobrist_pass = random.getrandbits(64)
+        _tt_keys = array("Q", bytes(8 << TT_BITS))
+        _tt_data = array("Q", bytes(8 << TT_BITS))
+
+
+# ==================== Transposition Table ====================
+
+
+def _tt_probe(node_hash: int) -> Optional[Tuple[int, int, int, Optional[Tuple[int, int]]]]:
+    """Return (depth, score, flag, best_move) stored for node_hash, or None."""
+    slot = node_hash & TT_MASK
+    data = _tt_data[slot]
+    if not data or _tt_keys[slot] != node_hash:
+        return None
+    move = (data >> 40) & 0xFF
+    return (
+        (data >> 32) & 0x3F,
+        (data & 0xFFFFFFFF) - TT_SCORE_OFFSET,
+        (data >> 38) & 0x3,
+        None if move == TT_NO_MOVE else divmod(move, BOARD_SIZE),
+    )
+
+
+def _tt_store(
+    node_hash: int, depth: int, score: int, flag: int, best_move: Optional[Tuple[int, int]]
+):
+    """
+    Store an entry packed as score:32 | depth:6 | flag:2 | move:8 | age:8.
+    Depth-preferred: a deeper entry of the current search is kept unless
+    it is the same position.
+    """
+    slot = node_hash & TT_MASK
+    old = _tt_data[slot]
+    if (
+        old
+        and _tt_keys[slot] != node_hash
+        and (old >> 48) == _tt_age
+        and ((old >> 32) & 0x3F) > depth
+    ):
+        return
+    move = TT_NO_MOVE if best_move is None else best_move[0] * BOARD_SIZE + best_move[1]
+    _tt_keys[slot] = node_hash
+    _tt_data[slot] = (
+        (score + TT_SCORE_OFFSET)
+        | (depth << 32)
+        | (flag << 38)
+        | (move << 40)
+        | (_tt_age << 48)
+    )
+
+
+def _tt_new_search():
+    """Start a new TT generation (older entries become replaceable)."""
+    global _tt_age
+    _tt_age = (_tt_age + 1) & 0xFF
 
 
 # ==================== Board Utilities ====================
@@ -72,87 +194,149 @@ def _in_bounds(r: int, c: int) -> bool:
     return 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE
 
 
-def _check_winner(board: List[List[str]]) -> Optional[str]:
-    """Fast winner check - returns 'X', 'O', or None."""
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            player = board[r][c]
-            if not player:
-                continue
-            for dr, dc in DIRS:
-                nr, nc = r + dr * (WIN_LEN - 1), c + dc * (WIN_LEN - 1)
-                if not _in_bounds(nr, nc):
-                    continue
-                for i in range(WIN_LEN):
-                    if board[r + dr * i][c + dc * i] != player:
-                        break
-                else:
-                    return player
-    return None
+def _to_flat(board: List[List[str]]) -> array:
+    """Convert the API board ('X' / 'O' / '') to the flat engine board."""
+    return array(
+        "b",
+        [X if cell == "X" else O if cell == "O" else EMPTY for row in board for cell in row],
+    )
+
+
+# Bitboards: one Python int per player, bit r * STRIDE + c. The spare
+# column (c == BOARD_SIZE) stays empty so that shifted runs cannot wrap
+# from one row into the next.
+STRIDE = BOARD_SIZE + 1
+CELL_BIT = [1 << (idx + idx // BOARD_SIZE) for idx in range(CELL_COUNT)]
 
+# Bit shift of one step along each of DIRS
+SHIFTS = [dr * STRIDE + dc for dr, dc in DIRS]
 
-def _zobrist_hash(board: List[List[str]]) -> int:
-    """Compute hash for current board position."""
-    h = 0
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            cell = board[r][c]
-            if cell == "X":
-                h ^= _zobrist_keys[r][c][0]
-            elif cell == "O":
-                h ^= _zobrist_keys[r][c][1]
-    return h
+# Stones of the search position, indexed by player (see _pattern_total)
+_bits: List[int] = [0, 0, 0]
 
 
-def _get_game_stage(board: List[List[str]]) -> int:
+def _build_rays() -> List[List[Tuple[int, ...]]]:
+    """
+    RAYS[idx][d]: flat indexes of the cells stepping away from idx, up to
+    the board edge, along DIRS[d] for d < 4 and against DIRS[d - 4] for
+    d >= 4 (so d ^ 4 is the opposite ray).
+    """
+    steps = DIRS + [(-dr, -dc) for dr, dc in DIRS]
+    rays = []
+    for idx in range(CELL_COUNT):
+        r, c = divmod(idx, BOARD_SIZE)
+        cell_rays = []
+        for dr, dc in steps:
+            ray = []
+            rr, cc = r + dr, c + dc
+            while _in_bounds(rr, cc):
+                ray.append(rr * BOARD_SIZE + cc)
+                rr += dr
+                cc += dc
+            cell_rays.append(tuple(ray))
+        rays.append(cell_rays)
+    return rays
+
+
+RAYS = _build_rays()
+
+
+def _build_neighborhood(radius: int) -> List[List[int]]:
+    """For each cell, the flat indexes of the other cells within radius."""
+    table = []
+    for idx in range(CELL_COUNT):
+        r, c = divmod(idx, BOARD_SIZE)
+        table.append([
+            rr * BOARD_SIZE + cc
+            for rr in range(r - radius, r + radius + 1)
+            for cc in range(c - radius, c + radius + 1)
+            if _in_bounds(rr, cc) and (rr, cc) != (r, c)
+        ])
+    return table
+
+
+# Neighbourhood tables by radius (built on first use)
+_neighborhoods: Dict[int, List[List[int]]] = {}
+
+# Number of stones within the search radius of each cell, kept up to date
+# by _place/_remove: a candidate move is an empty cell with a count > 0
+_influence: array = array("b", bytes(CELL_COUNT))
+_influence_cells: List[List[int]] = []
+
+
+def _has_five(bits: int) -> bool:
+    """True if the bitboard holds WIN_LEN stones in a row."""
+    for s in SHIFTS:
+        pairs = bits & (bits >> s)
+        fours = pairs & (pairs >> (2 * s))
+        if fours & (bits >> (4 * s)):
+            return True
+    return False
+
+
+def _check_winner() -> int:
+    """
+    Winner of the search position - returns X, O, or EMPTY. Read from the
+    five-line counts kept by _set_line_code, so no board scan is needed.
+    """
+    if _five_lines[X]:
+        return X
+    if _five_lines[O]:
+        return O
+    return EMPTY
+
+
+def _zobrist_hash(board: array) -> int:
+    """Compute hash for current board position (one XOR reduction)."""
+    return reduce(xor, map(_zobrist_keys.__getitem__, map(add, _ZOBRIST_BASE, board)))
+
+
+def _get_game_stage(board: array) -> int:
     """Estimate game stage by counting stones (affects search radius)."""
-    stone_count = sum(1 for row in board for cell in row if cell)
+    stone_count = CELL_COUNT - board.count(EMPTY)
     return min(stone_count // 10, 2)  # 0: early, 1: mid, 2: late
 
 
-def _find_immediate_win(board: List[List[str]], player: str) -> Optional[Tuple[int, int]]:
-    """If player has a winning move, return it; else None."""
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if board[r][c]:
-                continue
-            board[r][c] = player
-            if _check_winner(board) == player:
-                board[r][c] = ""
-                return (r, c)
-            board[r][c] = ""
+def _find_immediate_win(board: array, player: int) -> Optional[Tuple[int, int]]:
+    """
+    If player has a winning move, return it; else None. A winning cell
+    touches one of player's stones, so only the candidate cells (non-zero
+    _influence) need the bitboard probe.
+    """
+    bits = _bits[player]
+    for idx in range(CELL_COUNT):
+        if _influence[idx] and not board[idx] and _has_five(bits | CELL_BIT[idx]):
+            return divmod(idx, BOARD_SIZE)
     return None
 
 
 # ==================== Pattern Detection ====================
 
 
-def _scan_direction(
-    board: List[List[str]], player: str, r: int, c: int, dr: int, dc: int
-) -> Tuple[int, int]:
+def _scan_direction(board: array, player: int, idx: int, d: int) -> Tuple[int, int]:
     """
-    Scan a line from (r,c) in direction (dr,dc) to identify patterns.
-    Returns (pattern_type, length) for the sequence starting at (r,c).
+    Scan a line from idx along RAYS[idx][d] to identify patterns.
+    Returns (pattern_type, length) for the sequence starting at idx.
     """
-    if not _in_bounds(r, c) or board[r][c] != player:
+    if board[idx] != player:
         return (0, 0)
 
     # Find start of sequence (avoid double-counting)
-    pr, pc = r - dr, c - dc
-    if _in_bounds(pr, pc) and board[pr][pc] == player:
+    behind = RAYS[idx][d ^ 4]
+    if behind and board[behind[0]] == player:
         return (0, 0)
 
     # Count length
+    ray = RAYS[idx][d]
     length = 1
-    nr, nc = r + dr, c + dc
-    while _in_bounds(nr, nc) and board[nr][nc] == player:
+    for j in ray:
+        if board[j] != player:
+            break
         length += 1
-        nr += dr
-        nc += dc
 
     # Check openness of ends
-    left_open = _in_bounds(pr, pc) and board[pr][pc] == ""
-    right_open = _in_bounds(nr, nc) and board[nr][nc] == ""
+    left_open = bool(behind) and board[behind[0]] == EMPTY
+    right_open = length <= len(ray) and board[ray[length - 1]] == EMPTY
 
     # Classify pattern
     if length >= 5:
@@ -176,44 +360,211 @@ def _scan_direction(
     return (0, length)
 
 
-def _evaluate_position(board: List[List[str]], player: str, opponent: str) -> int:
+# ==================== Incremental Pattern Sums ====================
+
+
+def _build_lines() -> Tuple[List[List[int]], List[List[Tuple[int, int]]]]:
+    """
+    Every board line (rows, columns, both diagonals) as a list of flat
+    indexes, plus for each cell the (line id, code shift) of the lines
+    through it (see _line_codes).
+    """
+    lines = []
+    for dr, dc in DIRS:
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                # Lines start on the cell whose predecessor is off-board
+                if _in_bounds(r - dr, c - dc):
+                    continue
+                line = []
+                rr, cc = r, c
+                while _in_bounds(rr, cc):
+                    line.append(rr * BOARD_SIZE + cc)
+                    rr += dr
+                    cc += dc
+                if len(line) >= 2:
+                    lines.append(line)
+    cell_lines = [[] for _ in range(CELL_COUNT)]
+    for line_id, line in enumerate(lines):
+        for pos, idx in enumerate(line):
+            cell_lines[idx].append((line_id, LINE_CODE_SHIFT + 2 * pos))
+    return lines, cell_lines
+
+
+# Line codes pack a whole line into one int: the line length in the low
+# LINE_CODE_SHIFT bits, then 2 bits per cell (00 empty, 01 X, 10 O)
+LINE_CODE_SHIFT = 4
+LINE_CODE_MASK = (1 << LINE_CODE_SHIFT) - 1
+
+# 2-bit cell code, indexed by cell value (so CELL_CODE[O] is CELL_CODE[-1])
+CELL_CODE = [0, 1, 2]
+
+
+LINES, CELL_LINES = _build_lines()
+
+# Run score by [length capped at 5][number of open ends], same
+# classification as _scan_direction
+RUN_SCORES = [
+    [0, 0, 0],
+    [0, 0, 0],
+    [0, PATTERN_SCORES[HALF_OPEN_TWO], PATTERN_SCORES[OPEN_TWO]],
+    [0, PATTERN_SCORES[HALF_OPEN_THREE], PATTERN_SCORES[OPEN_THREE]],
+    [0, PATTERN_SCORES[HALF_OPEN_FOUR], PATTERN_SCORES[OPEN_FOUR]],
+    [PATTERN_SCORES[WIN]] * 3,
+]
+
+# Early-game centre bonus of a stone on each cell
+_center = BOARD_SIZE // 2
+CENTER_BONUS = [
+    max(0, 10 - abs(idx // BOARD_SIZE - _center) - abs(idx % BOARD_SIZE - _center))
+    for idx in range(CELL_COUNT)
+]
+
+# Pattern scores by line code, filled on first sight of each code
+_code_scores: Dict[int, List[int]] = {}
+CODE_SCORES_MAX_ENTRIES = 500_000
+
+# Search state kept in step with the board by _place/_remove. Totals are
+# indexed by player value, so [X] is X's and [O] (i.e. [-1]) is O's.
+_line_codes: List[int] = [len(line) for line in LINES]
+_line_scores: List[List[int]] = [[0, 0, 0] for _ in LINES]
+_pattern_total: List[int] = [0, 0, 0]
+_center_total: List[int] = [0, 0, 0]
+
+# Lines holding five in a row, per player (a line scores at least
+# PATTERN_SCORES[WIN] exactly when it has one)
+_five_lines: List[int] = [0, 0, 0]
+
+
+def _score_code(code: int) -> List[int]:
+    """Pattern scores of one line code, indexed by player like _pattern_total."""
+    n = code & LINE_CODE_MASK
+    cells = [CELL_CODE.index((code >> (LINE_CODE_SHIFT + 2 * i)) & 3) for i in range(n)]
+    scores = [0, 0, 0]
+    i = 0
+    while i < n:
+        cell = cells[i]
+        if not cell:
+            i += 1
+            continue
+        j = i + 1
+        while j < n and cells[j] == cell:
+            j += 1
+        length = j - i
+        if length >= 2:
+            open_ends = (i > 0 and cells[i - 1] == EMPTY) + (j < n and cells[j] == EMPTY)
+            scores[cell] += RUN_SCORES[min(length, 5)][open_ends]
+        i = j
+    return scores
+
+
+def _set_line_code(line_id: int, code: int):
+    """Store a line's new code and move its score delta into the totals."""
+    new = _code_scores.get(code)
+    if new is None:
+        new = _code_scores[code] = _score_code(code)
+    old = _line_scores[line_id]
+    _pattern_total[X] += new[X] - old[X]
+    _pattern_total[O] += new[O] - old[O]
+    win = PATTERN_SCORES[WIN]
+    _five_lines[X] += (new[X] >= win) - (old[X] >= win)
+    _five_lines[O] += (new[O] >= win) - (old[O] >= win)
+    _line_scores[line_id] = new
+    _line_codes[line_id] = code
+
+
+def _load_search_state(board: array, radius: int = 2):
+    """
+    Recompute bitboards, influence counts (for the given move radius) and
+    pattern sums from scratch (once per search).
+    """
+    global _influence_cells
+    if radius not in _neighborhoods:
+        _neighborhoods[radius] = _build_neighborhood(radius)
+    _influence_cells = _neighborhoods[radius]
+    _influence[:] = array("b", bytes(CELL_COUNT))
+    _bits[:] = [0, 0, 0]
+    _pattern_total[:] = [0, 0, 0]
+    _center_total[:] = [0, 0, 0]
+    _five_lines[:] = [0, 0, 0]
+    if len(_code_scores) > CODE_SCORES_MAX_ENTRIES:
+        _code_scores.clear()
+    for line_id, line in enumerate(LINES):
+        code = len(line)
+        for pos, idx in enumerate(line):
+            code |= CELL_CODE[board[idx]] << (LINE_CODE_SHIFT + 2 * pos)
+        _line_scores[line_id] = [0, 0, 0]
+        _set_line_code(line_id, code)
+    for idx in range(CELL_COUNT):
+        if board[idx]:
+            _bits[board[idx]] |= CELL_BIT[idx]
+            for n in _influence_cells[idx]:
+                _influence[n] += 1
+            _center_total[board[idx]] += CENTER_BONUS[idx]
+
+
+def _place(board: array, idx: int, player: int):
+    """Play a stone and update bitboards, influence and pattern sums."""
+    board[idx] = player
+    _bits[player] ^= CELL_BIT[idx]
+    for n in _influence_cells[idx]:
+        _influence[n] += 1
+    _center_total[player] += CENTER_BONUS[idx]
+    code = CELL_CODE[player]
+    for line_id, shift in CELL_LINES[idx]:
+        _set_line_code(line_id, _line_codes[line_id] + (code << shift))
+
+
+def _remove(board: array, idx: int):
+    """Take back a stone played with _place."""
+    player = board[idx]
+    board[idx] = EMPTY
+    _bits[player] ^= CELL_BIT[idx]
+    for n in _influence_cells[idx]:
+        _influence[n] -= 1
+    _center_total[player] -= CENTER_BONUS[idx]
+    code = CELL_CODE[player]
+    for line_id, shift in CELL_LINES[idx]:
+        _set_line_code(line_id, _line_codes[line_id] - (code << shift))
+
+
+def _pattern_gain(idx: int, player: int) -> int:
+    """
+    How much player's pattern total would rise by playing on the empty
+    cell idx: the code delta of the (at most four) lines through it,
+    scored from _code_scores without touching the board.
+    """
+    cell = CELL_CODE[player]
+    gain = 0
+    for line_id, shift in CELL_LINES[idx]:
+        code = _line_codes[line_id] + (cell << shift)
+        scores = _code_scores.get(code)
+        if scores is None:
+            scores = _code_scores[code] = _score_code(code)
+        gain += scores[player] - _line_scores[line_id][player]
+    return gain
+
+
+def _evaluate_position(board: array, player: int, opponent: int) -> int:
     """
     Advanced evaluation: sum pattern scores for both players.
     Prioritizes threats and double-attacks.
+    Reads the state maintained by _load_search_state/_place/_remove.
     """
-    player_score = 0
-    opponent_score = 0
-
     # Check for immediate win/loss in evaluation
-    winner = _check_winner(board)
+    winner = _check_winner()
     if winner == player:
         return PATTERN_SCORES[WIN]
     if winner == opponent:
         return -PATTERN_SCORES[WIN]
 
-    # Scan board for patterns
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if board[r][c] == player:
-                for dr, dc in DIRS:
-                    pat, length = _scan_direction(board, player, r, c, dr, dc)
-                    if pat:
-                        player_score += PATTERN_SCORES[pat]
-            elif board[r][c] == opponent:
-                for dr, dc in DIRS:
-                    pat, length = _scan_direction(board, opponent, r, c, dr, dc)
-                    if pat:
-                        opponent_score += PATTERN_SCORES[pat]
+    player_score = _pattern_total[player]
+    opponent_score = _pattern_total[opponent]
 
     # Bonus for central control (early game)
-    stage = _get_game_stage(board)
-    if stage == 0:
-        center = BOARD_SIZE // 2
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if board[r][c] == player:
-                    dist = abs(r - center) + abs(c - center)
-                    player_score += max(0, 10 - dist)
+    if _get_game_stage(board) == 0:
+        player_score += _center_total[player]
+        opponent_score += _center_total[opponent]
 
     return player_score - opponent_score
 
@@ -222,59 +573,44 @@ def _evaluate_position(board: List[List[str]], player: str, opponent: str) -> in
 
 
 def _score_single_move(
-    board: List[List[str]], r: int, c: int, player: str, opponent: str
+    board: array, r: int, c: int, player: int, opponent: int
 ) -> int:
     """Static heuristic score for a single move (for move ordering)."""
-    board[r][c] = player
-    score = 0
+    idx = r * BOARD_SIZE + c
 
     # 1. Immediate win is highest priority
-    if _check_winner(board) == player:
-        board[r][c] = ""
+    if _has_five(_bits[player] | CELL_BIT[idx]):
         return 10**8
 
-    # 2. Check patterns created by this move
-    for dr, dc in DIRS:
-        # Forward direction
-        pat_f, _ = _scan_direction(board, player, r, c, dr, dc)
-        score += PATTERN_SCORES.get(pat_f, 0) // 10
-
-        # Backward direction
-        pat_b, _ = _scan_direction(board, player, r, c, -dr, -dc)
-        score += PATTERN_SCORES.get(pat_b, 0) // 10
+    # 2. Patterns created by this move, from the incremental line codes
+    score = _pattern_gain(idx, player) // 10
 
     # 3. History heuristic bonus
-    score += _history_table[r][c]
+    score += _history_table[idx]
 
-    board[r][c] = ""
     return score
 
 
 def _generate_moves(
-    board: List[List[str]],
-    player: str,
-    opponent: str,
-    radius: int,
+    board: array,
+    player: int,
+    opponent: int,
     max_candidates: int,
 ) -> List[Tuple[int, int, int]]:
     """
-    Generate candidate moves within radius of existing stones.
+    Generate candidate moves within the search radius of existing stones
+    (the empty cells with a non-zero _influence count).
     Returns list of (row, col, score) sorted by score descending.
     """
-    stones = [(r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE) if board[r][c]]
-    candidates = set()
-
-    if not stones:
+    if board.count(EMPTY) == CELL_COUNT:
         center = BOARD_SIZE // 2
         return [(center, center, 0)]
 
-    # Gather empty positions in influence area
-    for sr, sc in stones:
-        for dr in range(-radius, radius + 1):
-            for dc in range(-radius, radius + 1):
-                r, c = sr + dr, sc + dc
-                if _in_bounds(r, c) and board[r][c] == "":
-                    candidates.add((r, c))
+    candidates = [
+        divmod(idx, BOARD_SIZE)
+        for idx in range(CELL_COUNT)
+        if _influence[idx] and not board[idx]
+    ]
 
     # Score and sort moves
     scored = []
@@ -284,52 +620,107 @@ def _generate_moves(
         # Score from opponent perspective (for blocking priority)
         opp_score = _score_single_move(board, r, c, opponent, player)
         # Combined score: prioritize threats and blocks
-        total_score = max(ai_score, opp_score * 0.9)
+        total_score = max(ai_score, opp_score * 9 // 10)
         scored.append((r, c, total_score))
 
-    # Sort by score descending, then by proximity to center for ties
+    # Best max_candidates by score, then by proximity to center for ties
     center = BOARD_SIZE // 2
-    scored.sort(
-        key=lambda x: (x[2], -(abs(x[0] - center) + abs(x[1] - center))), reverse=True
+    return heapq.nlargest(
+        max_candidates,
+        scored,
+        key=lambda x: (x[2], -(abs(x[0] - center) + abs(x[1] - center))),
     )
 
-    return scored[:max_candidates]
+
+def _ordered_moves(
+    board: array,
+    player: int,
+    opponent: int,
+    max_candidates: int,
+    depth: int,
+    tt_move: Optional[Tuple[int, int]],
+):
+    """
+    Staged move generator: the TT move from a previous iteration first,
+    then the killers of this depth, and only then the pattern-scored
+    candidates of _generate_moves. Each stage is produced only if the
+    previous one did not cut off, so nodes refuted by the TT move or a
+    killer never pay for scoring their candidates.
+    Yields (row, col).
+    """
+    tried = set()
+    if tt_move is not None and board[tt_move[0] * BOARD_SIZE + tt_move[1]] == EMPTY:
+        tried.add(tt_move)
+        yield tt_move
+
+    slot = 2 * depth
+    for idx in (_killer_moves[slot], _killer_moves[slot + 1]):
+        if idx != NO_MOVE and board[idx] == EMPTY:
+            move = divmod(idx, BOARD_SIZE)
+            if move not in tried:
+                tried.add(move)
+                yield move
+
+    for r, c, _ in _generate_moves(board, player, opponent, max_candidates):
+        if (r, c) not in tried:
+            yield r, c
 
 
 # ==================== Core Search Algorithm ====================
 
 
+def _is_threat_move(
+    mover: int, other: int, mover_before: int, other_before: int
+) -> bool:
+    """
+    Whether the move just placed by mover made a four or blocked one of
+    other's, judged from the pattern totals before (*_before) and after.
+    """
+    return (
+        _pattern_total[mover] - mover_before >= LMR_THREAT_DELTA
+        or other_before - _pattern_total[other] >= LMR_THREAT_DELTA
+    )
+
+
 def _minimax(
-    board: List[List[str]],
+    board: array,
     depth: int,
     alpha: int,
     beta: int,
-    maximizing: bool,
-    player: str,
-    opponent: str,
+    player: int,
+    opponent: int,
     max_candidates: int,
-    radius: int,
     node_hash: int,
     ply: int,
+    allow_null: bool = True,
 ) -> Tuple[int, Optional[Tuple[int, int]]]:
     """
-    Alpha-beta search with transposition table, killer moves, and history heuristic.
+    Negamax principal-variation alpha-beta search with transposition table,
+    killer moves, and history heuristic. player is the side to move and
+    scores are from its point of view (a child's score is negated).
+    The first (best-ordered) move gets the full window, later moves a null
+    window re-searched only when they land inside (alpha, beta). Quiet
+    late moves are searched with a reduced depth first (LMR), and quiet
+    null-window nodes try a reduced null-move search (no zugzwang in
+    Gomoku: passing never helps).
     Returns (score, best_move).
     """
     # Transposition table probe
-    tt_entry = _transposition_table.get(node_hash)
+    tt_move = None
+    tt_entry = _tt_probe(node_hash)
     if tt_entry:
         tt_depth, tt_score, tt_flag, tt_move = tt_entry
         if tt_depth >= depth:
-            if tt_flag == 0:  # EXACT
+            if tt_flag == TT_EXACT:
                 return tt_score, tt_move
-            elif tt_flag == 1 and tt_score >= beta:  # LOWERBOUND
+            elif tt_flag == TT_LOWERBOUND and tt_score >= beta:
                 return tt_score, tt_move
-            elif tt_flag == 2 and tt_score <= alpha:  # UPPERBOUND
+            elif tt_flag == TT_UPPERBOUND and tt_score <= alpha:
                 return tt_score, tt_move
+    alpha_orig, beta_orig = alpha, beta
 
     # Terminal check
-    winner = _check_winner(board)
+    winner = _check_winner()
     if winner == player:
         return PATTERN_SCORES[WIN] - ply, None
     if winner == opponent:
@@ -339,145 +730,179 @@ def _minimax(
     if depth == 0:
         return _evaluate_position(board, player, opponent), None
 
+    # Null move: if passing still fails high, so would any real move.
+    # Only on null-window nodes, never twice in a row.
+    if (
+        allow_null
+        and depth >= NULL_MOVE_MIN_DEPTH
+        and beta - alpha == 1
+        and _pattern_total[opponent] < NULL_MOVE_MAX_THREAT
+    ):
+        null_score, _ = _minimax(
+            board,
+            depth - 1 - NULL_MOVE_R,
+            -beta,
+            -beta + 1,
+            opponent,
+            player,
+            max_candidates,
+            node_hash ^ _zobrist_pass,
+            ply + 1,
+            False,
+        )
+        if -null_score >= beta:
+            return beta, None
+
     # Generate and order moves
-    current_player = player if maximizing else opponent
-    current_opponent = opponent if maximizing else player
-    moves = _generate_moves(board, current_player, current_opponent, radius, max_candidates)
+    moves = _ordered_moves(board, player, opponent, max_candidates, depth, tt_move)
 
+    value = -INF
     best_move = None
-    flag = 2  # UPPERBOUND initially
-
-    if maximizing:
-        value = -math.inf
-        for r, c, _ in moves:
-            board[r][c] = player
-            child_hash = node_hash ^ _zobrist_keys[r][c][0]  # XOR for player O (AI)
+    for i, (r, c) in enumerate(moves):
+        idx = r * BOARD_SIZE + c
+        mover_before = _pattern_total[player]
+        other_before = _pattern_total[opponent]
+        _place(board, idx, player)
+        child_hash = node_hash ^ _zobrist_keys[3 * idx + 1 + player]
+        if i == 0:
             score, _ = _minimax(
                 board,
                 depth - 1,
-                alpha,
-                beta,
-                False,
-                player,
+                -beta,
+                -alpha,
                 opponent,
+                player,
                 max_candidates,
-                radius,
                 child_hash,
                 ply + 1,
             )
-            board[r][c] = ""
-
-            if score > value:
-                value = score
-                best_move = (r, c)
-                # Update killers (keep two best at each depth)
-                if depth not in _killer_moves:
-                    _killer_moves[depth] = [None, None]
-                if (r, c) not in _killer_moves[depth]:
-                    _killer_moves[depth][1] = _killer_moves[depth][0]
-                    _killer_moves[depth][0] = (r, c)
-
-            alpha = max(alpha, value)
-            if alpha >= beta:
-                # Beta cutoff: update history
-                _history_table[r][c] += depth * depth
-                break
-
-        flag = 0 if alpha > beta else 1  # EXACT or LOWERBOUND
-        result = (value, best_move)
-    else:
-        value = math.inf
-        for r, c, _ in moves:
-            board[r][c] = opponent
-            child_hash = node_hash ^ _zobrist_keys[r][c][1]  # XOR for player X (human)
+            score = -score
+        else:
+            reduced = (
+                i >= LMR_MIN_INDEX
+                and depth >= LMR_MIN_DEPTH
+                and not _is_threat_move(player, opponent, mover_before, other_before)
+            )
+            # Null window: only prove the move does not beat alpha
             score, _ = _minimax(
                 board,
-                depth - 1,
-                alpha,
-                beta,
-                True,
-                player,
+                depth - 1 - LMR_REDUCTION if reduced else depth - 1,
+                -alpha - 1,
+                -alpha,
                 opponent,
+                player,
                 max_candidates,
-                radius,
                 child_hash,
                 ply + 1,
             )
-            board[r][c] = ""
-
-            if score < value:
-                value = score
-                best_move = (r, c)
-
-            beta = min(beta, value)
-            if alpha >= beta:
-                _history_table[r][c] += depth * depth
-                break
-
-        flag = 0 if beta < alpha else 2  # EXACT or UPPERBOUND
-        result = (value, best_move)
+            score = -score
+            if reduced and score > alpha:
+                # Reduced search failed high: verify at full depth
+                score, _ = _minimax(
+                    board,
+                    depth - 1,
+                    -beta,
+                    -alpha,
+                    opponent,
+                    player,
+                    max_candidates,
+                    child_hash,
+                    ply + 1,
+                )
+                score = -score
+            elif alpha < score < beta:
+                score, _ = _minimax(
+                    board,
+                    depth - 1,
+                    -beta,
+                    -score,
+                    opponent,
+                    player,
+                    max_candidates,
+                    child_hash,
+                    ply + 1,
+                )
+                score = -score
+        _remove(board, idx)
+
+        if score > value:
+            value = score
+            best_move = (r, c)
+            # Update killers (keep two best at each depth)
+            slot = 2 * depth
+            if idx != _killer_moves[slot] and idx != _killer_moves[slot + 1]:
+                _killer_moves[slot + 1] = _killer_moves[slot]
+                _killer_moves[slot] = idx
+
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            # Beta cutoff: update history
+            _history_table[idx] += depth * depth
+            break
 
-    # Store in transposition table
-    if depth >= 2:  # Only store meaningful depths
-        _transposition_table[node_hash] = (depth, value, flag, best_move)
+    # Store in transposition table, bounded by the window we were given
+    if depth >= 2 and best_move is not None:  # Only store meaningful depths
+        if value <= alpha_orig:
+            flag = TT_UPPERBOUND
+        elif value >= beta_orig:
+            flag = TT_LOWERBOUND
+        else:
+            flag = TT_EXACT
+        _tt_store(node_hash, depth, value, flag, best_move)
 
-    return result
+    return value, best_move
 
 
 def _aspiration_search(
-    board: List[List[str]],
+    board: array,
     depth: int,
     prev_score: int,
-    player: str,
-    opponent: str,
+    player: int,
+    opponent: int,
     params: Dict,
     node_hash: int,
 ) -> Tuple[int, Optional[Tuple[int, int]]]:
-    """Search with aspiration window around prev_score."""
+    """
+    Search with aspiration window around prev_score. On a miss only the
+    failing side moves, re-anchored on the fail-soft score and widened by
+    a doubling margin; after ASPIRATION_MAX_WIDENINGS misses that side is
+    opened completely.
+    """
     margin = 500 if depth >= 4 else 1000
     alpha = prev_score - margin
     beta = prev_score + margin
 
-    score, move = _minimax(
-        board,
-        depth,
-        alpha,
-        beta,
-        True,
-        player,
-        opponent,
-        params["max_candidates"],
-        params["radius"],
-        node_hash,
-        0,
-    )
-
-    # If outside window, re-search with full window
-    if score <= alpha:
+    for attempt in range(ASPIRATION_MAX_WIDENINGS + 1):
         score, move = _minimax(
             board,
             depth,
-            -math.inf,
+            alpha,
             beta,
-            True,
             player,
             opponent,
             params["max_candidates"],
-            params["radius"],
             node_hash,
             0,
         )
-    elif score >= beta:
+        if alpha < score < beta:
+            break
+
+        margin *= 2
+        last_try = attempt >= ASPIRATION_MAX_WIDENINGS - 1
+        if score <= alpha:
+            alpha = -INF if last_try else score - margin
+        else:
+            beta = INF if last_try else score + margin
+    else:
+        # Missed on both sides in turn: settle it with the full window
         score, move = _minimax(
             board,
             depth,
-            alpha,
-            math.inf,
-            True,
+            -INF,
+            INF,
             player,
             opponent,
             params["max_candidates"],
-            params["radius"],
             node_hash,
             0,
         )
@@ -485,6 +910,137 @@ def _aspiration_search(
     return score, move
 
 
+# ==================== Parallel Root Search ====================
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Process pool reused across moves (starting processes is expensive)."""
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        _shutdown_executor()
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def _shutdown_executor():
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = 0
+
+
+def _search_root_move(
+    cells: bytes,
+    move: Tuple[int, int],
+    depth: int,
+    alpha: int,
+    player: int,
+    opponent: int,
+    max_candidates: int,
+    radius: int,
+    tt_age: int,
+) -> int:
+    """
+    Worker: score one root move with window (alpha, +inf), private TT.
+    The TT generation follows the parent's, so entries left by previous
+    moves' searches stay replaceable in the worker as well.
+    """
+    global _tt_age
+    _init_zobrist()
+    _tt_age = tt_age
+    board = array("b", cells)
+    _load_search_state(board, radius)
+    idx = move[0] * BOARD_SIZE + move[1]
+    node_hash = _zobrist_hash(board) ^ _zobrist_keys[3 * idx + 1 + player]
+    _place(board, idx, player)
+    score, _ = _minimax(
+        board,
+        depth - 1,
+        -INF,
+        -alpha,
+        opponent,
+        player,
+        max_candidates,
+        node_hash,
+        1,
+    )
+    return -score
+
+
+def _parallel_root(
+    board: array,
+    depth: int,
+    player: int,
+    opponent: int,
+    params: Dict,
+    node_hash: int,
+) -> Optional[Tuple[int, Tuple[int, int]]]:
+    """
+    Young-brothers-wait root split: the first (TT-ordered) root move is
+    searched here to get alpha, then the remaining moves are scored in
+    parallel against that alpha.
+    Returns (score, move), or None to fall back to the sequential search.
+    """
+    tt_entry = _tt_probe(node_hash)
+    tt_move = tt_entry[3] if tt_entry else None
+    moves = list(
+        _ordered_moves(board, player, opponent, params["max_candidates"], depth, tt_move)
+    )
+    workers = min(PARALLEL_WORKERS, len(moves) - 1)
+    if workers < 2:
+        return None
+
+    best_move = moves[0]
+    idx = best_move[0] * BOARD_SIZE + best_move[1]
+    _place(board, idx, player)
+    best_score, _ = _minimax(
+        board,
+        depth - 1,
+        -INF,
+        INF,
+        opponent,
+        player,
+        params["max_candidates"],
+        node_hash ^ _zobrist_keys[3 * idx + 1 + player],
+        1,
+    )
+    best_score = -best_score
+    _remove(board, idx)
+
+    try:
+        scores = list(
+            _get_executor(workers).map(
+                _search_root_move,
+                repeat(board.tobytes()),
+                moves[1:],
+                repeat(depth),
+                repeat(best_score),
+                repeat(player),
+                repeat(opponent),
+                repeat(params["max_candidates"]),
+                repeat(params["radius"]),
+                repeat(_tt_age),
+            )
+        )
+    except Exception:
+        # Broken pool / module not importable in the worker
+        _shutdown_executor()
+        return None
+
+    for move, score in zip(moves[1:], scores):
+        if score > best_score:
+            best_score, best_move = score, move
+
+    # Every score above the first move's is exact (window (alpha, +inf))
+    _tt_store(node_hash, depth, best_score, TT_EXACT, best_move)
+    return best_score, best_move
+
+
 # ==================== Public API ====================
 Cell = str
 Board = List[List[Cell]]
@@ -498,14 +1054,15 @@ def choose_best_move(board: Board, difficulty: str = "standard") -> Optional[dic
     """
     # Initialize module state if needed
     _init_zobrist()
-    global _transposition_table, _killer_moves
 
     # Validate inputs
     if difficulty not in DIFFICULTY_PARAMS:
         difficulty = "standard"
 
     params = DIFFICULTY_PARAMS[difficulty]
-    player, opponent = "O", "X"
+    player, opponent = O, X
+    board = _to_flat(board)
+    _load_search_state(board, params["radius"])
 
     # Quick exit: immediate win
     win_move = _find_immediate_win(board, player)
@@ -522,32 +1079,34 @@ def choose_best_move(board: Board, difficulty: str = "standard") -> Optional[dic
             "depth": 0,
         }
 
-    # Reset transposition table for fresh searches (prevent memory bloat)
-    # Keep it small: clear if too many entries
-    if len(_transposition_table) > 500_000:
-        _transposition_table.clear()
-        _killer_moves.clear()
+    # New TT generation: entries of previous moves stay usable but are
+    # overwritten first (the table never grows, so it never needs clearing)
+    _tt_new_search()
 
     # Iterative deepening with aspiration windows
     node_hash = _zobrist_hash(board)
     best_move = None
-    best_score = -math.inf
+    best_score = -INF
     start_time = time.time()
 
     for depth in range(1, params["max_depth"] + 1):
         try:
+            result = None
+            if depth >= PARALLEL_MIN_DEPTH and PARALLEL_WORKERS > 1:
+                result = _parallel_root(board, depth, player, opponent, params, node_hash)
+
             # Use aspiration window except at depth 1
-            if depth == 1:
+            if result is not None:
+                score, move = result
+            elif depth == 1:
                 score, move = _minimax(
                     board,
                     depth,
-                    -math.inf,
-                    math.inf,
-                    True,
+                    -INF,
+                    INF,
                     player,
                     opponent,
                     params["max_candidates"],
-                    params["radius"],
                     node_hash,
                     0,
                 )
@@ -573,7 +1132,7 @@ def choose_best_move(board: Board, difficulty: str = "standard") -> Optional[dic
 
     if not best_move:
         # Emergency fallback: pick highest-scored candidate
-        moves = _generate_moves(board, player, opponent, params["radius"], params["max_candidates"])
+        moves = _generate_moves(board, player, opponent, params["max_candidates"])
         if not moves:
             return None
         best_move = (moves[0][0], moves[0][1])
@@ -3,6 +3,14 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 import json
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+try:
+    # Optional: orjson parses websocket frames 2-3x faster
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
 class GameConsumer(AsyncWebsocketConsumer):
     """
     Legacy room realtime: ws://<host>/ws/game/<room_name>/
@@ -20,16 +28,17 @@ class GameConsumer(AsyncWebsocketConsumer):
         if not text_data:
             return
         try:
-            data = json.loads(text_data)
-        except json.JSONDecodeError:
+            _json_loads(text_data)
+        except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
             return
+        # Valid JSON is relayed as received: nothing to re-encode per consumer
         await self.channel_layer.group_send(self.group_name, {
             "type": "broadcast",
-            "payload": data
+            "text": text_data,
         })
 
     async def broadcast(self, event):
-        await self.send(text_data=json.dumps(event["payload"]))
+        await self.send(text_data=event["text"])
 
 
 
@@ -76,47 +85,66 @@ class LobbyConsumer(AsyncJsonWebsocketConsumer):
         - game.join (subscribe to pvp_game_<id>)
         - game.leave
         """
-        msg_type = content.get("type")
-
-        if msg_type == "ping":
-            await self.send_json({"type": "pong"})
+        handler = self._HANDLERS.get(content.get("type"))
+        if handler is not None:
+            await handler(self, content)
+
+    @staticmethod
+    def _game_id(content) -> int | None:
+        """game_id as an int (JSON number or digit string), None if missing/invalid."""
+        game_id = content.get("game_id")
+        if isinstance(game_id, str):
+            return int(game_id) if game_id.isdecimal() else None
+        if isinstance(game_id, int) and not isinstance(game_id, bool):
+            return game_id
+        return None
+
+    async def _handle_ping(self, content):
+        await self.send_json({"type": "pong"})
+
+    async def _handle_game_join(self, content):
+        game_id = self._game_id(content)
+        if not game_id:
+            await self.send_json({"type": "error", "detail": "Missing game_id"})
             return
 
-        if msg_type == "game.join":
-            game_id = content.get("game_id")
-            if not game_id:
-                await self.send_json({"type": "error", "detail": "Missing game_id"})
-                return
+        await self.channel_layer.group_add(f"pvp_game_{game_id}", self.channel_name)
+        await self.send_json({"type": "game.joined", "game_id": game_id})
 
-            group = f"pvp_game_{int(game_id)}"
-            await self.channel_layer.group_add(group, self.channel_name)
-
-            await self.send_json({"type": "game.joined", "game_id": int(game_id)})
+    async def _handle_game_leave(self, content):
+        game_id = self._game_id(content)
+        if not game_id:
             return
 
-        if msg_type == "game.leave":
-            game_id = content.get("game_id")
-            if not game_id:
-                return
+        await self.channel_layer.group_discard(f"pvp_game_{game_id}", self.channel_name)
 
-            group = f"pvp_game_{int(game_id)}"
-            await self.channel_layer.group_discard(group, self.channel_name)
-            return
+    _HANDLERS = {
+        "ping": _handle_ping,
+        "game.join": _handle_game_join,
+        "game.leave": _handle_game_leave,
+    }
 
     # -------- events from server (group_send) --------
 
     async def queue_event(self, event):
         """
         Server -> user_<id> group notifications (match found, queue updates).
-        event = {"type":"queue_event","payload": {...}}
+        event = {"type":"queue_event","payload": {...}, "text": "<payload JSON>"}
         """
-        payload = event.get("payload") or {}
-        await self.send_json(payload)
+        await self._send_event(event)
 
     async def game_event(self, event):
         """
         Server -> pvp_game_<id> group notifications (moves, turns, ended).
-        event = {"type":"game_event","payload": {...}}
+        event = {"type":"game_event","payload": {...}, "text": "<payload JSON>"}
         """
+        await self._send_event(event)
+
+    async def _send_event(self, event):
+        # Prefer the text pre-encoded by the publisher (ws_notify)
+        text = event.get("text")
+        if text is not None:
+            await self.send(text_data=text)
+            return
         payload = event.get("payload") or {}
         await self.send_json(payload)
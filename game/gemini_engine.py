@@ -7,6 +7,10 @@ import logging
 import os
 import random
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain, repeat
 from typing import Any, Final
 
 import google.generativeai as genai
@@ -18,8 +22,138 @@ except ImportError:  # pragma: no cover - au cas où la dépendance change
     GoogleAPICallError = Exception  # type: ignore
     ResourceExhausted = Exception  # type: ignore
 
+try:
+    # Optionnel : orjson parse les petites réponses JSON 2-3x plus vite
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - on retombe sur la stdlib
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Clôtures Markdown ```json ... ``` éventuelles autour de la réponse (une passe)
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+
+# Code 2 bits par case : 00 vide, 01 X, 10 O ; toute autre valeur ("" ou
+# inattendue) compte comme vide
+_CELL_CODE: Final[dict[str, int]] = {"X": 1, "O": 2}
+
+# Texte de prompt des 4 cases d'un octet packé (case 0 dans les bits de poids faible)
+_BYTE_TEXT: Final[tuple[str, ...]] = tuple(
+    "".join(".XO."[(byte >> shift) & 3] for shift in (0, 2, 4, 6)) for byte in range(256)
+)
+
+# Coups Gemini déjà obtenus, par (modèle, symbole IA, position canonique packée) ->
+# index à plat du coup dans la position canonique. LRU borné.
+MOVE_CACHE_MAX_ENTRIES: Final[int] = 10_000
+_MOVE_CACHE: OrderedDict[tuple[str, str, bytes], int] = OrderedDict()
+_MOVE_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _symmetry_perms(n: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Les 8 symétries du plateau n x n (rotations et réflexions), chacune sous
+    forme de permutation perm[index_image] = index_origine (index r * n + c).
+    """
+    m = n - 1
+    maps = (
+        lambda r, c: (r, c),
+        lambda r, c: (c, m - r),
+        lambda r, c: (m - r, m - c),
+        lambda r, c: (m - c, r),
+        lambda r, c: (r, m - c),
+        lambda r, c: (m - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (m - c, m - r),
+    )
+    perms = []
+    for f in maps:
+        perm = [0] * (n * n)
+        for r in range(n):
+            for c in range(n):
+                rr, cc = f(r, c)
+                perm[rr * n + cc] = r * n + c
+        perms.append(tuple(perm))
+    return tuple(perms)
+
+
+def _board_codes(board: Board) -> bytes:
+    """Codes de case (0 vide, 1 X, 2 O) à plat, un octet par case."""
+    return bytes(map(_CELL_CODE.get, chain.from_iterable(board), repeat(0)))
+
+
+def _pack_codes(codes: bytes) -> bytes:
+    """Packe les codes à 2 bits par case, 4 cases par octet (57 octets en 15x15)."""
+    codes += bytes(-len(codes) % 4)
+    return bytes(
+        codes[i] | codes[i + 1] << 2 | codes[i + 2] << 4 | codes[i + 3] << 6
+        for i in range(0, len(codes), 4)
+    )
+
+
+def _pack_board(board: Board) -> bytes:
+    return _pack_codes(_board_codes(board))
+
+
+def _canonical_board(codes: bytes, n: int) -> tuple[bytes, tuple[int, ...]]:
+    """
+    Forme canonique (plus petite image par symétrie) des codes à plat, avec
+    la permutation utilisée : le coup canonique i est perm[i] à l'origine.
+    """
+    return min((bytes(map(codes.__getitem__, perm)), perm) for perm in _symmetry_perms(n))
+
+
+def _cache_move(key: tuple[str, str, bytes], canonical_index: int) -> None:
+    with _MOVE_CACHE_LOCK:
+        _MOVE_CACHE[key] = canonical_index
+        _MOVE_CACHE.move_to_end(key)
+        if len(_MOVE_CACHE) > MOVE_CACHE_MAX_ENTRIES:
+            _MOVE_CACHE.popitem(last=False)
+
+
+@lru_cache(maxsize=4)
+def _system_instruction(ai_symbol: str, human_symbol: str) -> str:
+    """
+    Prompt système pour Gemini.
+
+    Remarque: On demande à Gemini de raisonner étape par étape INTERNEMENT,
+    mais de NE renvoyer que l'objet JSON final. Ceci exploite sa "Chain of Thought"
+    interne sans la faire apparaître dans la réponse (ce qui limite la taille et
+    accélère le parsing).
+    """
+    return (
+        "You are a very strong Gomoku (five-in-a-row) AI.\n"
+        "- Board size: 15x15.\n"
+        "- Cells contain 'X', 'O', or '.' for empty.\n"
+        f"- You play as '{ai_symbol}'. The human plays as '{human_symbol}'.\n"
+        "- Goal: make a line of AT LEAST 5 stones in a row horizontally, vertically or diagonally.\n"
+        "- You must ALWAYS play on an empty cell ('.').\n"
+        "- You should internally think through the position carefully (threats, immediate wins, blocks), "
+        "but your final output MUST ONLY be JSON.\n"
+        "\n"
+        "Move selection priority (in order):\n"
+        "  1) Immediate win (create a line of 5 or more).\n"
+        "  2) Block the opponent from creating a line of 5.\n"
+        "  3) Create or extend strong threats (open lines of 3 or 4, central control).\n"
+        "\n"
+        "CRITICAL FORMATTING RULE:\n"
+        "Respond with a SINGLE JSON object with exactly two integer fields:\n"
+        '{\"row\": <zero_based_row>, \"col\": <zero_based_col>}.\n'
+        "Do NOT include any explanation, comments, or extra fields."
+    )
+
+
+# Parties fixes du prompt utilisateur, autour du plateau
+_USER_PROMPT_HEAD: Final[str] = "Here is the current 15x15 Gomoku board, one row per line:\n"
+_USER_PROMPT_TAIL: Final[str] = (
+    "\n\n"
+    "It is your turn. Choose a strong move (try to win or block) and answer ONLY "
+    "with a JSON object like:\n"
+    '{"row": 7, "col": 8}'
+)
+
 
 Board = list[list[str]]
 Move = tuple[int, int] | None
@@ -44,6 +178,14 @@ class GeminiGomokuAI:
     """
 
     DEFAULT_MODEL: Final[str] = "gemini-2.5-flash"
+    # gRPC (HTTP/2) : une connexion multiplexée et gardée ouverte, partagée
+    # par tous les appels du processus, au lieu de requêtes REST successives.
+    # Pas de gzip/brotli : réponses de quelques dizaines d'octets de JSON, où
+    # l'aller-retour domine ; HTTP/2 compresse déjà les en-têtes (HPACK).
+    # genai.configure est global au processus : transport et endpoint sont
+    # donc des constantes de classe, pas des paramètres d'instance.
+    TRANSPORT: Final[str] = "grpc"
+    API_ENDPOINT: Final[str] = "generativelanguage.googleapis.com:443"
 
     def __init__(
         self,
@@ -52,12 +194,18 @@ class GeminiGomokuAI:
         max_retries: int = 3,
         base_retry_delay: float = 0.5,
         temperature: float = 0.3,
+        request_timeout: float = 20.0,
+        center_opening: bool = True,
     ) -> None:
         self._api_key: str | None = api_key or os.getenv("GOOGLE_API_KEY")
         self._model_name: str = model_name
         self._max_retries: int = max_retries
         self._base_retry_delay: float = base_retry_delay
         self._temperature: float = temperature
+        self._request_timeout: float = request_timeout
+        # Plateau vide -> centre, sans appel Gemini (désactiver pour une
+        # ouverture choisie par le modèle)
+        self._center_opening: bool = center_opening
 
         self._enabled: bool = self._api_key is not None
 
@@ -70,7 +218,11 @@ class GeminiGomokuAI:
             return
 
         # Configuration du client Gemini – effectué une seule fois
-        genai.configure(api_key=self._api_key)
+        genai.configure(
+            api_key=self._api_key,
+            transport=self.TRANSPORT,
+            client_options={"api_endpoint": self.API_ENDPOINT},
+        )
         self._model = genai.GenerativeModel(self._model_name)
 
         # Config de génération : JSON strict pour limiter les hallucinations de format
@@ -102,13 +254,34 @@ class GeminiGomokuAI:
             logger.error("[GeminiGomokuAI] Board vide ou mal formé.")
             return None
 
+        # Premier coup de la partie : le centre, inutile de demander au modèle
+        if self._center_opening and not any(cell for row in board for cell in row):
+            center = (len(board) // 2, len(board) // 2)
+            logger.info("[GeminiGomokuAI] Plateau vide -> centre %s", center)
+            return center
+
         # Si pas de clé API, on utilise directement le fallback.
         if not self._enabled or self._model is None:
             logger.info("[GeminiGomokuAI] IA désactivée -> fallback immédiat.")
             return self._select_fallback_move(board, ai_symbol, human_symbol)
 
+        # Position déjà jouée (à une symétrie près) -> coup en cache, sans appel
+        n = len(board)
+        codes = _board_codes(board)
+        canonical, perm = _canonical_board(codes, n)
+        cache_key = (self._model_name, ai_symbol, _pack_codes(canonical))
+        with _MOVE_CACHE_LOCK:
+            cached = _MOVE_CACHE.get(cache_key)
+            if cached is not None:
+                _MOVE_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            row, col = divmod(perm[cached], n)
+            if board[row][col] == "":
+                logger.info("[GeminiGomokuAI] Coup en cache: %s", (row, col))
+                return (row, col)
+
         system_instruction = self._build_system_instruction(ai_symbol, human_symbol)
-        user_prompt = self._build_user_prompt(board)
+        user_prompt = self._build_user_prompt(_pack_codes(codes), n)
 
         try:
             response = await self._call_model_with_retry(system_instruction, user_prompt)
@@ -118,6 +291,7 @@ class GeminiGomokuAI:
             move = self._parse_and_validate_move(raw_json, board)
             if move is not None:
                 logger.info("[GeminiGomokuAI] Coup choisi par Gemini: %s", move)
+                _cache_move(cache_key, perm.index(move[0] * n + move[1]))
                 return move
 
             logger.warning(
@@ -134,44 +308,11 @@ class GeminiGomokuAI:
     # Construction du prompt
     # -------------------------------------------------------------------------
     def _build_system_instruction(self, ai_symbol: str, human_symbol: str) -> str:
-        """
-        Prompt système pour Gemini.
-
-        Remarque: On demande à Gemini de raisonner étape par étape INTERNEMENT,
-        mais de NE renvoyer que l'objet JSON final. Ceci exploite sa "Chain of Thought"
-        interne sans la faire apparaître dans la réponse (ce qui limite la taille et
-        accélère le parsing).
-        """
-        return (
-            "You are a very strong Gomoku (five-in-a-row) AI.\n"
-            "- Board size: 15x15.\n"
-            "- Cells contain 'X', 'O', or '.' for empty.\n"
-            f"- You play as '{ai_symbol}'. The human plays as '{human_symbol}'.\n"
-            "- Goal: make a line of AT LEAST 5 stones in a row horizontally, vertically or diagonally.\n"
-            "- You must ALWAYS play on an empty cell ('.').\n"
-            "- You should internally think through the position carefully (threats, immediate wins, blocks), "
-            "but your final output MUST ONLY be JSON.\n"
-            "\n"
-            "Move selection priority (in order):\n"
-            "  1) Immediate win (create a line of 5 or more).\n"
-            "  2) Block the opponent from creating a line of 5.\n"
-            "  3) Create or extend strong threats (open lines of 3 or 4, central control).\n"
-            "\n"
-            "CRITICAL FORMATTING RULE:\n"
-            "Respond with a SINGLE JSON object with exactly two integer fields:\n"
-            '{\"row\": <zero_based_row>, \"col\": <zero_based_col>}.\n'
-            "Do NOT include any explanation, comments, or extra fields."
-        )
+        """Prompt système pour Gemini (voir `_system_instruction`, mis en cache)."""
+        return _system_instruction(ai_symbol, human_symbol)
 
-    def _build_user_prompt(self, board: Board) -> str:
-        board_text = self._board_to_text(board)
-        return (
-            "Here is the current 15x15 Gomoku board, one row per line:\n"
-            f"{board_text}\n\n"
-            "It is your turn. Choose a strong move (try to win or block) and answer ONLY "
-            "with a JSON object like:\n"
-            '{"row": 7, "col": 8}'
-        )
+    def _build_user_prompt(self, packed: bytes, n: int) -> str:
+        return _USER_PROMPT_HEAD + self._board_to_text(packed, n) + _USER_PROMPT_TAIL
 
     # -------------------------------------------------------------------------
     # Appel modèle + Retry
@@ -196,13 +337,22 @@ class GeminiGomokuAI:
                     attempt + 1,
                     self._max_retries,
                 )
-                # On déporte l'appel bloquant dans un thread pour ne pas bloquer
-                # la boucle d'événements asyncio.
-                response = await asyncio.to_thread(
-                    self._model.generate_content,
-                    [system_instruction, user_prompt],
-                    generation_config=self._generation_config,
-                )
+                generate_async = getattr(self._model, "generate_content_async", None)
+                if generate_async is not None:
+                    # Client asyncio natif du SDK : pas de passage par un thread
+                    response = await generate_async(
+                        [system_instruction, user_prompt],
+                        generation_config=self._generation_config,
+                        request_options={"timeout": self._request_timeout},
+                    )
+                else:
+                    # Ancien SDK sans API async : on déporte l'appel bloquant dans
+                    # un thread pour ne pas bloquer la boucle d'événements.
+                    response = await asyncio.to_thread(
+                        self._model.generate_content,
+                        [system_instruction, user_prompt],
+                        generation_config=self._generation_config,
+                    )
                 return response
 
             except ResourceExhausted as exc:  # quota ou surcharge
@@ -268,8 +418,8 @@ class GeminiGomokuAI:
         - la case est vide
         """
         try:
-            data = json.loads(raw_json)
-        except json.JSONDecodeError:
+            data = _json_loads(raw_json)
+        except ValueError:  # json.JSONDecodeError et orjson.JSONDecodeError
             logger.error("[GeminiGomokuAI] JSON invalide: %s", raw_json)
             return None
 
@@ -329,29 +479,35 @@ class GeminiGomokuAI:
             logger.info("[GeminiGomokuAI] Aucun coup possible (plateau plein).")
             return None
 
-        # Plateau complètement vide ?
-        if all(board[r][c] == "" for r in range(n) for c in range(n)):
+        # Plateau complètement vide ? (déjà connu du premier parcours)
+        if len(empty_cells) == n * n:
             center = (n // 2, n // 2)
             logger.info("[GeminiGomokuAI] Fallback: plateau vide -> centre %s", center)
             return center
 
-        def has_neighbor_stone(r: int, c: int) -> bool:
-            for dr in (-1, 0, 1):
-                for dc in (-1, 0, 1):
-                    if dr == 0 and dc == 0:
-                        continue
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < n and 0 <= nc < n:
-                        if board[nr][nc] in (ai_symbol, human_symbol):
-                            return True
-            return False
-
-        candidate_cells: list[tuple[int, int]] = [
-            (r, c) for (r, c) in empty_cells if has_neighbor_stone(r, c)
-        ]
+        # Dilatation 3x3 des pierres : l'ensemble des cases à distance <= 1
+        # d'une pierre, construit une fois au lieu de tester 8 voisins par case
+        # vide. Les voisins hors plateau ne sont jamais dans `empty_cells`.
+        near_stones: set[tuple[int, int]] = {
+            (r + dr, c + dc)
+            for r, row in enumerate(board)
+            for c, cell in enumerate(row)
+            if cell in (ai_symbol, human_symbol)
+            for dr in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+        }
 
-        if candidate_cells:
-            move = random.choice(candidate_cells)
+        # Tirage uniforme parmi les cases adjacentes par réservoir (k=1), sans
+        # construire la liste des candidates
+        move: Move = None
+        seen = 0
+        for cell in empty_cells:
+            if cell in near_stones:
+                seen += 1
+                if random.randrange(seen) == 0:
+                    move = cell
+
+        if move is not None:
             logger.info("[GeminiGomokuAI] Fallback: case adjacente -> %s", move)
             return move
 
@@ -370,15 +526,13 @@ class GeminiGomokuAI:
     # Utilitaires statiques
     # -------------------------------------------------------------------------
     @staticmethod
-    def _board_to_text(board: Board) -> str:
+    def _board_to_text(packed: bytes, n: int) -> str:
         """
-        Transforme la grille en texte compact X/O/. pour le prompt.
+        Transforme le plateau packé (`_pack_board`) en texte compact X/O/.
+        pour le prompt : une chaîne de 4 cases par octet, puis découpe en lignes.
         """
-        lines: list[str] = []
-        for row in board:
-            line = "".join(cell if cell in ("X", "O") else "." for cell in row)
-            lines.append(line)
-        return "\n".join(lines)
+        flat = "".join(map(_BYTE_TEXT.__getitem__, packed))
+        return "\n".join(flat[r * n : (r + 1) * n] for r in range(n))
 
     @staticmethod
     def _clean_json_text(text: str) -> str:
@@ -386,16 +540,48 @@ class GeminiGomokuAI:
         Nettoie d'éventuels ```json ... ``` autour de la réponse.
         Utile si le modèle 'oublie' la contrainte MIME type.
         """
-        text = text.strip()
-        text = re.sub(r"^```json", "", text, flags=re.IGNORECASE).strip()
-        text = re.sub(r"^```", "", text).strip()
-        text = re.sub(r"```$", "", text).strip()
-        return text
+        return _FENCE_RE.sub("", text).strip()
 
 
 # -------------------------------------------------------------------------
 # Optionnel : fonction de compatibilité synchrone
 # -------------------------------------------------------------------------
+_DEFAULT_AI: GeminiGomokuAI | None = None
+_DEFAULT_AI_LOCK = threading.Lock()
+_SYNC_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_default_ai() -> GeminiGomokuAI:
+    """
+    Instance partagée (créée au premier appel) : `genai.configure` et le
+    GenerativeModel, avec son canal HTTP/gRPC, ne sont construits qu'une fois.
+    """
+    global _DEFAULT_AI
+    if _DEFAULT_AI is None:
+        with _DEFAULT_AI_LOCK:
+            if _DEFAULT_AI is None:
+                _DEFAULT_AI = GeminiGomokuAI()
+    return _DEFAULT_AI
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """
+    Boucle asyncio persistante (thread démon) pour l'API synchrone. Le client
+    async du SDK reste lié à la boucle où il a été créé : un `asyncio.run` par
+    appel le casserait dès le deuxième coup.
+    """
+    global _SYNC_LOOP
+    if _SYNC_LOOP is None:
+        with _DEFAULT_AI_LOCK:
+            if _SYNC_LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="gemini-sync-loop", daemon=True
+                ).start()
+                _SYNC_LOOP = loop
+    return _SYNC_LOOP
+
+
 def gemini_best_move(
     board: Board,
     ai_symbol: str = "O",
@@ -408,9 +594,19 @@ def gemini_best_move(
     Dans un serveur async (FastAPI, Django async, etc.), il vaut mieux créer
     une instance de `GeminiGomokuAI` et appeler directement `await get_best_move`.
     """
-    ai = GeminiGomokuAI()
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "gemini_best_move() appelé depuis une boucle asyncio active : "
+            "utiliser `await GeminiGomokuAI().get_best_move(...)`."
+        )
 
-    async def _run() -> Move:
-        return await ai.get_best_move(board, ai_symbol, human_symbol)
+    ai = _get_default_ai()
 
-    return asyncio.run(_run())
+    future = asyncio.run_coroutine_threadsafe(
+        ai.get_best_move(board, ai_symbol, human_symbol), _get_sync_loop()
+    )
+    return future.result()
@@ -1,37 +1,94 @@
+import select
 import time
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.utils import timezone
-from datetime import timedelta
-from game.models import PvPGame
-from game.services.ws_notify import notify_game
+from game.services.pvp_timeouts import (
+    TIMEOUT_CHANNEL,
+    due_games,
+    finalize_timeout,
+    next_deadline,
+    timeout_result,
+)
+from game.services.ws_notify import notify_games
+
+# Longest sleep without any deadline or wake-up (safety net for missed notifies)
+MAX_SLEEP_SEC = 30
+# Margin past a deadline so the game is strictly overdue when we wake
+DEADLINE_SLACK_SEC = 0.05
+
 
 class Command(BaseCommand):
-    help = "PvP timeout worker (dev). Checks active games and ends on timeout."
+    help = (
+        "PvP timeout worker. Sleeps until the next turn deadline (woken early "
+        "by LISTEN/NOTIFY on Postgres) and ends games on timeout."
+    )
 
     def handle(self, *args, **options):
         self.stdout.write("PvP timeout worker started…")
+        listening = self._listen()
         while True:
             now = timezone.now()
-            active = PvPGame.objects.filter(status=PvPGame.Status.ACTIVE)
-
-            for g in active:
-                last = g.last_move_at or g.started_at
-                if (now - last).total_seconds() > g.turn_timeout_sec:
-                    # current turn player times out -> other wins
-                    g.status = PvPGame.Status.FINISHED
-                    g.ended_at = now
-                    if g.turn == "X":
-                        g.result = PvPGame.Result.P2_WIN
-                    else:
-                        g.result = PvPGame.Result.P1_WIN
-                    g.save()
-
-                    notify_game(g.id, {
+            ended = []
+            with transaction.atomic():
+                for game_id, turn in due_games(now):
+                    if not finalize_timeout(game_id, turn, now):
+                        continue
+                    ended.append((game_id, {
                         "type": "game.ended",
-                        "game_id": g.id,
-                        "result": g.result,
+                        "game_id": game_id,
+                        "result": timeout_result(turn),
                         "reason": "timeout",
-                        "turn": g.turn,
-                    })
+                        "turn": turn,
+                    }))
+            # One flush per tick for a burst of timeouts (e.g. after a restart)
+            notify_games(ended)
+
+            deadline = next_deadline()
+            if deadline is None:
+                timeout = MAX_SLEEP_SEC
+            else:
+                timeout = (deadline - timezone.now()).total_seconds() + DEADLINE_SLACK_SEC
+                timeout = min(max(timeout, DEADLINE_SLACK_SEC), MAX_SLEEP_SEC)
+            self._wait(timeout, listening)
+
+    def _listen(self) -> bool:
+        """LISTEN on the timeout channel; False if the backend cannot."""
+        if connection.vendor != "postgresql":
+            self.stdout.write("Not on Postgres: polling every deadline, no wake-ups.")
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {TIMEOUT_CHANNEL}")
+        pg = connection.connection
+        if callable(getattr(pg, "notifies", None)):  # psycopg 3
+            # Notifications that arrive while the tick's own queries run are
+            # only handed to handlers, never to a later notifies() call
+            self._woken = False
+            pg.add_notify_handler(self._on_notify)
+        return True
+
+    def _on_notify(self, notify) -> None:
+        self._woken = True
 
-            time.sleep(2)
+    def _wait(self, timeout: float, listening: bool) -> None:
+        """
+        Sleep up to `timeout` seconds, returning early on a notification.
+        Notifications received during the tick's queries were already read
+        off the socket by the driver, so they are drained first: waiting on
+        the socket alone would miss them.
+        """
+        if not listening:
+            time.sleep(timeout)
+            return
+        pg = connection.connection
+        if callable(getattr(pg, "notifies", None)):  # psycopg 3
+            if not self._woken:
+                for _ in pg.notifies(timeout=timeout, stop_after=1):
+                    pass
+            self._woken = False
+            return
+        # psycopg2: poll() moves anything already buffered into pg.notifies
+        pg.poll()
+        if not pg.notifies and select.select([pg], [], [], timeout)[0]:
+            pg.poll()
+        pg.notifies.clear()
@@ -0,0 +1,18 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0012_pvpgame_winning_line"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="pvpgame",
+            index=models.Index(fields=["status", "last_move_at"], name="pvp_status_lastmove_idx"),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0013_pvpgame_pvp_status_lastmove_idx"),
+    ]
+
+    operations = [
+        # Build the partial unique index first, without blocking writes, so
+        # invite codes stay unique while the old full index is dropped.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="pvpgame",
+                    constraint=models.UniqueConstraint(
+                        condition=models.Q(invite_code__isnull=False),
+                        fields=("invite_code",),
+                        name="uniq_active_invite_code",
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uniq_active_invite_code "
+                        "ON game_pvpgame (invite_code) WHERE invite_code IS NOT NULL"
+                    ),
+                    reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS uniq_active_invite_code",
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="pvpgame",
+            name="invite_code",
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+    ]
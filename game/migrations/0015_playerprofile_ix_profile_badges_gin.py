@@ -0,0 +1,21 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0014_pvpgame_uniq_active_invite_code"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="playerprofile",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["badges"], name="ix_profile_badges_gin", opclasses=["jsonb_path_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def pack_existing_moves(apps, schema_editor):
+    PvPGame = apps.get_model("game", "PvPGame")
+    PvPMove = apps.get_model("game", "PvPMove")
+    packed = {}
+    moves = PvPMove.objects.order_by("game_id", "move_number").values_list("game_id", "row", "col")
+    for game_id, row, col in moves.iterator(chunk_size=2000):
+        packed.setdefault(game_id, bytearray()).extend((row, col))
+    for game_id, blob in packed.items():
+        PvPGame.objects.filter(pk=game_id).update(moves_packed=bytes(blob))
+
+
+class Migration(migrations.Migration):
+    # ADD COLUMN with a constant default is metadata-only; running the backfill
+    # outside the migration transaction keeps its ACCESS EXCLUSIVE lock short
+    atomic = False
+
+    dependencies = [
+        ("game", "0015_playerprofile_ix_profile_badges_gin"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pvpgame",
+            name="moves_packed",
+            field=models.BinaryField(default=b""),
+        ),
+        migrations.RunPython(pack_existing_moves, migrations.RunPython.noop),
+    ]
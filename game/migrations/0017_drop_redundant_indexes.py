@@ -0,0 +1,46 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0016_pvpgame_moves_packed"),
+    ]
+
+    operations = [
+        # Game: per-player queries use (user, created_at); the global counts
+        # match almost every row (seq scan), except active (see 0026)
+        RemoveIndexConcurrently(model_name="game", name="game_game_status_9bfe99_idx"),
+        RemoveIndexConcurrently(model_name="game", name="game_game_result_faa688_idx"),
+        RemoveIndexConcurrently(model_name="game", name="game_game_mode_6eea58_idx"),
+        # PvPMove: duplicates of the uniq_pvp_game_* constraint indexes
+        RemoveIndexConcurrently(model_name="pvpmove", name="game_pvpmov_game_id_1ca951_idx"),
+        RemoveIndexConcurrently(model_name="pvpmove", name="game_pvpmov_game_id_ec86d6_idx"),
+        # FK indexes that are prefixes of the composite ones above
+        migrations.AlterField(
+            model_name="game",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="pvpmove",
+            name="game",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="moves",
+                to="game.pvpgame",
+            ),
+        ),
+    ]
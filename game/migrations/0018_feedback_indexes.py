@@ -0,0 +1,22 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0017_drop_redundant_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="feedback",
+            index=models.Index(fields=["status", "created_at"], name="feedback_status_created_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="feedback",
+            index=models.Index(fields=["type", "created_at"], name="feedback_type_created_idx"),
+        ),
+    ]
@@ -0,0 +1,27 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0018_feedback_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="game",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="game_created_brin", pages_per_range=32
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="game",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["ended_at"], name="game_ended_brin", pages_per_range=32
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # (CREATE|DROP) INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0019_game_brin_indexes"),
+    ]
+
+    operations = [
+        # Build the replacement first so matchmaking never runs unindexed
+        AddIndexConcurrently(
+            model_name="matchqueueentry",
+            index=models.Index(
+                condition=models.Q(status="waiting"),
+                fields=["mode", "elo_snapshot"],
+                include=("user", "created_at"),
+                name="ix_mqe_match",
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="matchqueueentry",
+            name="game_matchq_mode_e3a0b2_idx",
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+import game.models
+
+
+class Migration(migrations.Migration):
+    # Python-side decoder only: no schema change
+    dependencies = [
+        ("game", "0020_matchqueueentry_ix_mqe_match"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="matchqueueentry",
+            name="preferences",
+            field=game.models.FastJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="playerprofile",
+            name="badges",
+            field=game.models.FastJSONField(blank=True, default=list),
+        ),
+        migrations.AlterField(
+            model_name="pvpgame",
+            name="time_control",
+            field=game.models.FastJSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="pvpgame",
+            name="winning_line",
+            field=game.models.FastJSONField(blank=True, null=True),
+        ),
+    ]
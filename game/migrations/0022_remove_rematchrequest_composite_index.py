@@ -0,0 +1,19 @@
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0021_fast_json_fields"),
+    ]
+
+    operations = [
+        # Pending lookups use uniq_pending_rematch_per_game (partial on status='pending')
+        RemoveIndexConcurrently(
+            model_name="rematchrequest",
+            name="game_rematc_game_id_33dca5_idx",
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0022_remove_rematchrequest_composite_index"),
+    ]
+
+    # A column cannot be altered into a generated one: drop and re-add it,
+    # Postgres computes every row's tier from rating on ADD COLUMN.
+    operations = [
+        migrations.RemoveField(
+            model_name="playerprofile",
+            name="skill_tier",
+        ),
+        migrations.AddField(
+            model_name="playerprofile",
+            name="skill_tier",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(rating__gte=2000, then=models.Value("expert")),
+                    models.When(rating__gte=1700, then=models.Value("intermediate")),
+                    default=models.Value("beginner"),
+                ),
+                output_field=models.CharField(
+                    choices=[("beginner", "Beginner"), ("intermediate", "Intermediate"), ("expert", "Expert")],
+                    max_length=20,
+                ),
+            ),
+        ),
+    ]
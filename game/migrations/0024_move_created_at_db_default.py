@@ -0,0 +1,22 @@
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # SET DEFAULT only: existing rows are untouched
+    dependencies = [
+        ("game", "0023_playerprofile_generated_skill_tier"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="move",
+            name="created_at",
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name="pvpmove",
+            name="created_at",
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+    ]
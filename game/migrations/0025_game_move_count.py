@@ -0,0 +1,31 @@
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_move_count(apps, schema_editor):
+    Game = apps.get_model("game", "Game")
+    Move = apps.get_model("game", "Move")
+    last_move = (
+        Move.objects.filter(game=OuterRef("pk"))
+        .values("game")
+        .annotate(last=Max("move_number"))
+        .values("last")
+    )
+    Game.objects.update(move_count=Coalesce(Subquery(last_move), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0024_move_created_at_db_default"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="move_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_move_count, migrations.RunPython.noop),
+    ]
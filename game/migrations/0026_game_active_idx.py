@@ -0,0 +1,22 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("game", "0025_game_move_count"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="game",
+            index=models.Index(
+                fields=["status"],
+                name="game_active_idx",
+                condition=models.Q(status="active"),
+            ),
+        ),
+    ]
@@ -1,10 +1,32 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.contrib.auth.models import AbstractUser
 import secrets
 import string
 
+from django.db.models.functions import Coalesce, Now
 from django.utils import timezone
+
+try:
+    # Optional: orjson decodes JSON columns 2-5x faster than the stdlib
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+class FastJSONField(models.JSONField):
+    """JSONField whose values are decoded with orjson when it is installed."""
+
+    def from_db_value(self, value, expression, connection):
+        if orjson is None or self.decoder is not None or not isinstance(value, (str, bytes)):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+
+
 # ==========================
 # CUSTOM USER (HvM player)
 # ==========================
@@ -263,7 +285,26 @@ class Subscription(models.Model):
 # STATS
 # ==========================
 
-class Stats(models.Model):
+class CounterUpdateMixin:
+    """
+    Per-user counters. Bump them with `increment()` (one UPDATE, col = col + n
+    in SQL) rather than `obj.col += 1; obj.save()`, which reads first and
+    loses increments under concurrent games.
+    """
+
+    @classmethod
+    def increment(cls, user, *, set_fields: dict | None = None, **deltas) -> int:
+        """
+        Add each `deltas` value to its counter and assign `set_fields`
+        (values or expressions) in the same UPDATE; returns the row count.
+        """
+        values = {name: models.F(name) + delta for name, delta in deltas.items()}
+        values.update(set_fields or {})
+        values["updated_at"] = timezone.now()  # auto_now is skipped by update()
+        return cls.objects.filter(user=user).update(**values)
+
+
+class Stats(CounterUpdateMixin, models.Model):
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -286,6 +327,15 @@ class Stats(models.Model):
 
 # game/models.py
 
+class PlayerProfileQuerySet(models.QuerySet):
+    def with_stats(self):
+        """Annotate the Stats counters of leaderboard rows (0 without Stats)."""
+        return self.annotate(**{
+            name: Coalesce(f"user__stats__{name}", 0)
+            for name in ("games_played", "wins_engine", "wins_gemini", "losses", "best_streak")
+        })
+
+
 class PlayerProfile(models.Model):
     """Represents a player in HvM (human or AI agent)."""
 
@@ -324,19 +374,34 @@ class PlayerProfile(models.Model):
 
     # Rating / tier
     rating = models.IntegerField(default=1200)  # ELO-like score
-    skill_tier = models.CharField(
-        max_length=20, choices=SKILL_CHOICES, default=SKILL_BEGINNER
+    # Derived by Postgres from rating (STORED column): never written by the app
+    skill_tier = models.GeneratedField(
+        expression=models.Case(
+            models.When(rating__gte=2000, then=models.Value(SKILL_EXPERT)),
+            models.When(rating__gte=1700, then=models.Value(SKILL_INTERMEDIATE)),
+            default=models.Value(SKILL_BEGINNER),
+        ),
+        output_field=models.CharField(max_length=20, choices=SKILL_CHOICES),
+        db_persist=True,
     )
 
     # JSON list of badge IDs: ["fire_streak", "legend", ...]
-    badges = models.JSONField(default=list, blank=True)
+    # Bounded by the badge catalogue, so kept inline (GIN-indexed, see Meta)
+    # rather than in a through-table
+    badges = FastJSONField(default=list, blank=True)
     current_streak = models.PositiveIntegerField(default=0)
     last_played = models.DateTimeField(null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = PlayerProfileQuerySet.as_manager()
+
     class Meta:
         ordering = ["-rating"]
+        indexes = [
+            # badge lookups: filter(badges__contains=["legend"]) (jsonb @>)
+            GinIndex(fields=["badges"], name="ix_profile_badges_gin", opclasses=["jsonb_path_ops"]),
+        ]
 
     def __str__(self):
         return self.display_name
@@ -365,7 +430,11 @@ class Game(models.Model):
     ]
 
     user = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,  # covered by the (user, created_at) index
     )
 
     # Game config
@@ -383,14 +452,36 @@ class Game(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     ended_at = models.DateTimeField(null=True, blank=True)
 
+    # Number of the last move played; bumped by next_move_number()
+    move_count = models.PositiveIntegerField(default=0)
+
     def __str__(self):
         return f"Game#{self.id} {self.mode}/{self.difficulty} {self.result}"
+
+    def next_move_number(self) -> int:
+        """
+        Reserve the next move number with one UPDATE of move_count. Call it
+        inside the transaction that inserts the move: the row lock serializes
+        concurrent moves and a rollback releases the number.
+        """
+        Game.objects.filter(pk=self.pk).update(move_count=models.F("move_count") + 1)
+        self.refresh_from_db(fields=["move_count"])
+        return self.move_count
     class Meta:
         indexes = [
+            # every per-player query is scoped by user first
             models.Index(fields=["user", "created_at"]),
-            models.Index(fields=["status", "created_at"]),
-            models.Index(fields=["result", "created_at"]),
-            models.Index(fields=["mode", "created_at"]),
+            # global time ranges (admin 7-day count, leaderboard periods): rows
+            # are appended in time order, so a BRIN is tiny and cheap to insert
+            BrinIndex(fields=["created_at"], name="game_created_brin", pages_per_range=32),
+            BrinIndex(fields=["ended_at"], name="game_ended_brin", pages_per_range=32),
+            # admin overview counts active games across all users; they are a
+            # small slice of the table, so only those rows are indexed
+            models.Index(
+                fields=["status"],
+                name="game_active_idx",
+                condition=models.Q(status="active"),
+            ),
         ]
 
 class Move(models.Model):
@@ -403,7 +494,7 @@ class Move(models.Model):
     player = models.CharField(max_length=1)  # "X" or "O"
     row = models.IntegerField()
     col = models.IntegerField()
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)  # filled by Postgres
 
     class Meta:
         db_table = "game_move"
@@ -416,13 +507,12 @@ class Move(models.Model):
 
     def __str__(self):
         return f"Move#{self.move_number} {self.player}@({self.row},{self.col})"
-        indexes = [
-            models.Index(fields=["game", "move_number"]),
-            models.Index(fields=["game", "row", "col"]),
-        ]
-        constraints = [
-            models.UniqueConstraint(fields=["game", "row", "col"], name="uniq_game_cell"),
-        ]
+
+
+class FeedbackQuerySet(models.QuerySet):
+    def with_context(self):
+        """Join the author and game shown in feedback listings."""
+        return self.select_related("user", "game")
 
 
 class Feedback(models.Model):
@@ -467,22 +557,23 @@ class Feedback(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = FeedbackQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # admin list: filtered by status and/or type, newest first
+            models.Index(fields=["status", "created_at"], name="feedback_status_created_idx"),
+            models.Index(fields=["type", "created_at"], name="feedback_type_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Feedback({self.id}) {self.type} {self.status}"
-        ordering = ["-created_at"]
-        indexes = [
-            models.Index(fields=["status", "created_at"]),
-            models.Index(fields=["user", "created_at"]),
-            models.Index(fields=["type", "created_at"]),
-        ]
 
 # game/models.py
 
 
-class PlayerRating(models.Model):
+class PlayerRating(CounterUpdateMixin, models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="rating")
 
     elo_ranked = models.IntegerField(default=1200)
@@ -515,7 +606,7 @@ class MatchQueueEntry(models.Model):
     status = models.CharField(max_length=16, choices=Status.choices, default=Status.WAITING)
 
     elo_snapshot = models.IntegerField(default=1200)
-    preferences = models.JSONField(null=True, blank=True)
+    preferences = FastJSONField(null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     matched_at = models.DateTimeField(null=True, blank=True)
@@ -524,13 +615,39 @@ class MatchQueueEntry(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["mode", "status", "created_at"]),
-            models.Index(fields=["mode", "status", "elo_snapshot"]),
+            # matchmaker candidates: waiting entries of a mode by ELO range
+            models.Index(
+                fields=["mode", "elo_snapshot"],
+                include=["user", "created_at"],
+                condition=models.Q(status="waiting"),
+                name="ix_mqe_match",
+            ),
         ]
 
     def __str__(self):
         return f"QueueEntry(user={self.user_id}, mode={self.mode}, status={self.status})"
 
 
+class PvPGameQuerySet(models.QuerySet):
+    def with_players(self):
+        """Join p1/p2 for views that render both usernames."""
+        return self.select_related("p1", "p2")
+
+    def flip_turn(self, game_id: int, expected_turn: str, **fields) -> int:
+        """
+        Hand the turn to the other player in one UPDATE, only while it is
+        still `expected_turn`; `fields` are written in the same statement.
+        Returns the updated row count (0: someone else moved first).
+        """
+        next_turn = "O" if expected_turn == "X" else "X"
+        return self.filter(pk=game_id, turn=expected_turn).update(turn=next_turn, **fields)
+
+
+# Collisions are 1 in 36^10 per try: a few attempts are plenty
+INVITE_CODE_ATTEMPTS = 8
+_INVITE_ALPHABET = (string.ascii_uppercase + string.digits).encode()
+
+
 class PvPGame(models.Model):
     class Mode(models.TextChoices):
         CASUAL = "casual", "Casual"
@@ -565,9 +682,9 @@ class PvPGame(models.Model):
     mode = models.CharField(max_length=16, choices=Mode.choices)
     status = models.CharField(max_length=16, choices=Status.choices, default=Status.WAITING)
     result = models.CharField(max_length=16, choices=Result.choices, default=Result.ONGOING)
-    winning_line = models.JSONField(null=True, blank=True)
+    winning_line = FastJSONField(null=True, blank=True)
     is_private = models.BooleanField(default=False)
-    invite_code = models.CharField(max_length=16, unique=True, db_index=True, null=True, blank=True)
+    invite_code = models.CharField(max_length=16, null=True, blank=True)  # unique: see Meta
     invite_created_at = models.DateTimeField(null=True, blank=True)
     invite_expires_at = models.DateTimeField(null=True, blank=True)
     invite_used_at = models.DateTimeField(null=True, blank=True)
@@ -580,44 +697,105 @@ class PvPGame(models.Model):
     ended_at = models.DateTimeField(null=True, blank=True)
 
     turn_timeout_sec = models.IntegerField(default=30)  # ranked/casual can override later
-    time_control = models.JSONField(null=True, blank=True)
+    time_control = FastJSONField(null=True, blank=True)
+
+    # Moves in play order, 2 bytes each (row, col); X moves first and players
+    # alternate, so the player is the move's parity. PvPMove keeps the audit
+    # rows (timestamps); the move hot path only reads this column.
+    MAX_BOARD_SIZE = 255
+    moves_packed = models.BinaryField(default=b"", editable=False)
+
+    objects = PvPGameQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            # partial: only games holding an invite are indexed
+            models.UniqueConstraint(
+                fields=["invite_code"],
+                condition=models.Q(invite_code__isnull=False),
+                name="uniq_active_invite_code",
+            ),
+        ]
+        indexes = [
+            # timeout worker scan: active games by turn start
+            models.Index(fields=["status", "last_move_at"], name="pvp_status_lastmove_idx"),
+        ]
 
     def __str__(self):
         return f"PvPGame(id={self.id}, mode={self.mode}, status={self.status})"
 
+    @staticmethod
+    def pack_move(row: int, col: int) -> bytes:
+        return bytes((row, col))
+
+    def board_from_moves(self) -> list[list[str]]:
+        """Board rebuilt from moves_packed, without querying PvPMove."""
+        n = self.board_size
+        board = [["" for _ in range(n)] for _ in range(n)]
+        packed = bytes(self.moves_packed)  # memoryview on Postgres
+        for i in range(0, len(packed), 2):
+            board[packed[i]][packed[i + 1]] = "X" if i % 4 == 0 else "O"
+        return board
+
+    @property
+    def move_count(self) -> int:
+        return len(self.moves_packed) // 2
+
     @classmethod
-    def generate_unique_invite_code(cls, length: int = 10) -> str:
+    def generate_invite_code(cls, length: int = 10) -> str:
+        """Random invite code candidate; uniqueness is left to the DB constraint."""
         if length < 8:
             length = 8
         if length > 12:
             length = 12
-        alphabet = string.ascii_uppercase + string.digits
-        for _ in range(64):
-            code = "".join(secrets.choice(alphabet) for _ in range(length))
-            if not cls.objects.filter(invite_code=code).exists():
-                return code
+        # One CSPRNG read per batch instead of one secrets.choice per char;
+        # bytes >= 252 are rejected so every character stays equally likely
+        code = b""
+        while len(code) < length:
+            raw = secrets.token_bytes(2 * length)
+            code += bytes(_INVITE_ALPHABET[b % 36] for b in raw if b < 252)
+        return code[:length].decode()
+
+    @classmethod
+    def create_with_invite_code(cls, **fields) -> "PvPGame":
+        """
+        Create a game with a fresh invite code: one INSERT, retried with a
+        new code when the unique index reports a collision.
+        """
+        for _ in range(INVITE_CODE_ATTEMPTS):
+            code = cls.generate_invite_code()
+            try:
+                with transaction.atomic():
+                    return cls.objects.create(invite_code=code, **fields)
+            except IntegrityError:
+                # Only retry on an actual code collision
+                if not cls.objects.filter(invite_code=code).exists():
+                    raise
         raise RuntimeError("Unable to generate unique invite code.")
 
 
 class PvPMove(models.Model):
-    game = models.ForeignKey(PvPGame, on_delete=models.CASCADE, related_name="moves")
+    """
+    Append-only audit row per PvP move. Live play reads PvPGame.moves_packed;
+    only the state view lists these rows, through the (game, move_number)
+    unique index, which already keeps each game's moves together.
+    """
+
+    # indexed through the (game, ...) unique constraints
+    game = models.ForeignKey(PvPGame, on_delete=models.CASCADE, related_name="moves", db_index=False)
 
     move_number = models.IntegerField()
     player = models.CharField(max_length=1)  # "X" or "O"
     row = models.IntegerField()
     col = models.IntegerField()
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)  # filled by Postgres
 
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=["game", "row", "col"], name="uniq_pvp_game_cell"),
             models.UniqueConstraint(fields=["game", "move_number"], name="uniq_pvp_game_move_number"),
         ]
-        indexes = [
-            models.Index(fields=["game", "move_number"]),
-            models.Index(fields=["game", "row", "col"]),
-        ]
 
     def __str__(self):
         return f"PvPMove(game={self.game_id}, n={self.move_number}, p={self.player}, {self.row},{self.col})"
@@ -653,9 +831,6 @@ class RematchRequest(models.Model):
                 name="uniq_pending_rematch_per_game",
             ),
         ]
-        indexes = [
-            models.Index(fields=["game", "status", "created_at"]),
-        ]
 
     def __str__(self):
         return f"RematchRequest(game={self.game_id}, requester={self.requester_id}, status={self.status})"
@@ -1,19 +1,31 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from .models import Game, Move, Stats, PlayerProfile,Feedback,Game
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
+from .models import Game, Move, PlayerProfile,Feedback,Game
 import uuid
+from bisect import bisect_right
 
 User = get_user_model()
 
 
-def generate_username_from_email(email: str) -> str:
-    base = email.split("@")[0][:20]
-    candidate = base
+USERNAME_CANDIDATES = 8
+USERNAME_ATTEMPTS = 3
 
-    while User.objects.filter(username=candidate).exists():
-        candidate = f"{base}_{uuid.uuid4().hex[:4]}"
 
-    return candidate
+def generate_username_from_email(email: str) -> str:
+    base = email.split("@")[0][:20]
+    # Un lot de candidats vérifié en une seule requête
+    candidates = [base] + [
+        f"{base}_{uuid.uuid4().hex[:4]}" for _ in range(USERNAME_CANDIDATES - 1)
+    ]
+    taken = set(
+        User.objects.filter(username__in=candidates).values_list("username", flat=True)
+    )
+    return next(
+        (c for c in candidates if c not in taken),
+        f"{base}_{uuid.uuid4().hex[:8]}",
+    )
 
 
 class SignupSerializer(serializers.ModelSerializer):
@@ -47,8 +59,18 @@ class SignupSerializer(serializers.ModelSerializer):
         )
 
         user.set_password(password)
-        user.save()
-        return user
+        # username est unique en base : en cas de collision concurrente,
+        # on retente avec un nouveau lot de candidats
+        for attempt in range(USERNAME_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    user.save()
+                return user
+            except IntegrityError:
+                taken = User.objects.filter(username=user.username).exists()
+                if not taken or attempt == USERNAME_ATTEMPTS - 1:
+                    raise
+                user.username = generate_username_from_email(email)
 
 class MeSerializer(serializers.ModelSerializer):
     class Meta:
@@ -101,14 +123,15 @@ class MoveCreateSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         game: Game = self.context["game"]
-        move_number = game.moves.count() + 1
-        return Move.objects.create(
-            game=game,
-            move_number=move_number,
-            row=validated_data["row"],
-            col=validated_data["col"],
-            player=validated_data["player"],
-        )
+        # Numéro réservé par un UPDATE atomique de move_count (pas de COUNT)
+        with transaction.atomic():
+            return Move.objects.create(
+                game=game,
+                move_number=game.next_move_number(),
+                row=validated_data["row"],
+                col=validated_data["col"],
+                player=validated_data["player"],
+            )
 
 
 class GameEndSerializer(serializers.Serializer):
@@ -138,15 +161,21 @@ class DashboardSerializer(serializers.Serializer):
 
 # game/serializers.py
 
+# Paliers de badge : bronze < 1600 <= silver < 1900 <= gold < 2200 <= legend
+BADGE_BOUNDS = (1600, 1900, 2200)
+BADGE_NAMES = ("bronze", "silver", "gold", "legend")
+
+
 class LeaderboardEntrySerializer(serializers.ModelSerializer):
     username = serializers.CharField(source="display_name")
 
-    # Stats globales (via Stats)
-    games_played = serializers.SerializerMethodField()
-    wins_engine = serializers.SerializerMethodField()
-    wins_gemini = serializers.SerializerMethodField()
-    losses = serializers.SerializerMethodField()
-    best_streak = serializers.SerializerMethodField()
+    # Stats globales (annotées par PlayerProfile.objects.with_stats() : une
+    # jointure pour toute la page au lieu de user puis stats par ligne)
+    games_played = serializers.IntegerField(read_only=True)
+    wins_engine = serializers.IntegerField(read_only=True)
+    wins_gemini = serializers.IntegerField(read_only=True)
+    losses = serializers.IntegerField(read_only=True)
+    best_streak = serializers.IntegerField(read_only=True)
 
     # Stats filtrées par période (annotées dans la queryset)
     games_in_period = serializers.IntegerField(read_only=True)
@@ -173,47 +202,11 @@ class LeaderboardEntrySerializer(serializers.ModelSerializer):
             "wins_in_period",
         ]
 
-    def _get_stats(self, obj: PlayerProfile) -> Stats | None:
-        if not obj.user_id:
-            return None
-        try:
-            return obj.user.stats
-        except Stats.DoesNotExist:
-            return None
-
-    def get_games_played(self, obj):
-        stats = self._get_stats(obj)
-        return stats.games_played if stats else 0
-
-    def get_wins_engine(self, obj):
-        stats = self._get_stats(obj)
-        return stats.wins_engine if stats else 0
-
-    def get_wins_gemini(self, obj):
-        stats = self._get_stats(obj)
-        return stats.wins_gemini if stats else 0
-
-    def get_losses(self, obj):
-        stats = self._get_stats(obj)
-        return stats.losses if stats else 0
-
-    def get_best_streak(self, obj):
-        stats = self._get_stats(obj)
-        return stats.best_streak if stats else 0
-
     def get_badge(self, obj):
         """
         Mappe le rating vers un badge symbolique.
         """
-        rating = obj.rating or 0
-        if rating >= 2200:
-            return "legend"
-        elif rating >= 1900:
-            return "gold"
-        elif rating >= 1600:
-            return "silver"
-        else:
-            return "bronze"
+        return BADGE_NAMES[bisect_right(BADGE_BOUNDS, obj.rating or 0)]
 # game/serializers.py
 
 class RecentGameV2Serializer(serializers.Serializer):
@@ -331,6 +324,18 @@ class MoveStateSerializer(serializers.ModelSerializer):
 class GameStateSerializer(serializers.ModelSerializer):
     moves = MoveStateSerializer(many=True, read_only=True)
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        # Coups chargés en une requête pour toutes les parties (pas de N+1)
+        return queryset.prefetch_related(
+            Prefetch(
+                "moves",
+                queryset=Move.objects.only(
+                    "game", "move_number", "player", "row", "col", "created_at"
+                ).order_by("move_number"),
+            )
+        )
+
     class Meta:
         model = Game
         fields = [
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from django.db.models import QuerySet
 from .models import Game, Stats, User, PlayerProfile, Move
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Q
+from django.db.models.functions import Greatest
 
 
 from datetime import timedelta
@@ -12,6 +13,9 @@ from django.conf import settings
 
 from typing import Dict, Any, List
 
+# Game n'a pas (encore) de champ duration_sec : résolu une fois à l'import
+HAS_DURATION = hasattr(Game, "duration_sec")
+
 
 def recompute_stats_for_user(user: User) -> Stats:
     """
@@ -20,15 +24,19 @@ def recompute_stats_for_user(user: User) -> Stats:
     """
     qs: QuerySet[Game] = Game.objects.filter(player=user).exclude(result="ongoing")
 
-    games_played = qs.count()
-
-    wins_engine = qs.filter(mode="engine", result="win").count()
-    wins_gemini = qs.filter(mode="gemini", result="win").count()
-    losses = qs.filter(result="lose").count()
-    draws = qs.filter(result="draw").count()
+    # Tous les compteurs en une seule requête (COUNT ... FILTER)
+    counts = qs.aggregate(
+        games_played=Count("id"),
+        wins_engine=Count("id", filter=Q(mode="engine", result="win")),
+        wins_gemini=Count("id", filter=Q(mode="gemini", result="win")),
+        losses=Count("id", filter=Q(result="lose")),
+        draws=Count("id", filter=Q(result="draw")),
+    )
 
-    # Streaks : on parcourt les games dans l'ordre chronologique
-    ordered_results = qs.order_by("started_at").values_list("result", flat=True)
+    # Streaks : on parcourt les games dans l'ordre chronologique, par lots
+    ordered_results = (
+        qs.order_by("started_at").values_list("result", flat=True).iterator(chunk_size=2000)
+    )
 
     best_streak = 0
     current_streak = 0
@@ -40,11 +48,8 @@ def recompute_stats_for_user(user: User) -> Stats:
             current_streak = 0
 
     stats, _ = Stats.objects.get_or_create(user=user)
-    stats.games_played = games_played
-    stats.wins_engine = wins_engine
-    stats.wins_gemini = wins_gemini
-    stats.losses = losses
-    stats.draws = draws
+    for name, value in counts.items():
+        setattr(stats, name, value)
     stats.best_streak = best_streak
     stats.current_streak = current_streak
     stats.save()
@@ -89,19 +94,27 @@ def get_detailed_dashboard_payload(user: User) -> dict:
 
     qs = Game.objects.filter(player=user).exclude(result="ongoing")
 
-    # ---- Stats par mode ----
+    # ---- Stats par mode : une requête GROUP BY mode pour tous les compteurs ----
+    grouped = {
+        row["mode"]: row
+        for row in qs.values("mode").order_by().annotate(
+            games=Count("id"),
+            wins=Count("id", filter=Q(result="win")),
+            losses=Count("id", filter=Q(result="lose")),
+            draws=Count("id", filter=Q(result="draw")),
+        )
+    }
+
     def mode_block(mode: str) -> dict:
-        qsm = qs.filter(mode=mode)
-        games = qsm.count()
-        wins = qsm.filter(result="win").count()
-        losses = qsm.filter(result="lose").count()
-        draws = qsm.filter(result="draw").count()
+        row = grouped.get(mode, {})
+        games = row.get("games", 0)
+        wins = row.get("wins", 0)
         winrate = round((wins / games) * 100, 1) if games > 0 else 0.0
         return {
             "games": games,
             "wins": wins,
-            "losses": losses,
-            "draws": draws,
+            "losses": row.get("losses", 0),
+            "draws": row.get("draws", 0),
             "winrate": winrate,
         }
 
@@ -110,40 +123,32 @@ def get_detailed_dashboard_payload(user: User) -> dict:
         "gemini": mode_block("gemini"),
     }
 
-    # ---- Durées : on calcule en Python à partir de started_at / ended_at ----
-    def avg_duration(qs_subset) -> int:
-        durations = []
-        for g in qs_subset:
-            if g.started_at and g.ended_at:
-                delta = g.ended_at - g.started_at
-                durations.append(delta.total_seconds())
-        if not durations:
-            return 0
-        return int(sum(durations) / len(durations))
+    # ---- Durées : moyennes calculées par la base (NULL ignoré par AVG) ----
+    duration = ExpressionWrapper(F("ended_at") - F("started_at"), output_field=DurationField())
+    avgs = qs.aggregate(
+        all=Avg(duration),
+        win=Avg(duration, filter=Q(result="win")),
+        loss=Avg(duration, filter=Q(result="lose")),
+    )
+
+    def avg_seconds(value) -> int:
+        return int(value.total_seconds()) if value is not None else 0
 
     durations = {
-        "average_duration_sec": avg_duration(qs),
-        "average_win_duration_sec": avg_duration(qs.filter(result="win")),
-        "average_loss_duration_sec": avg_duration(qs.filter(result="lose")),
+        "average_duration_sec": avg_seconds(avgs["all"]),
+        "average_win_duration_sec": avg_seconds(avgs["win"]),
+        "average_loss_duration_sec": avg_seconds(avgs["loss"]),
     }
 
-    # ---- 10 dernières parties ----
-    recent_games_qs = qs.order_by("-started_at")[:10]
-    recent_games = [
-        {
-            "id": g.id,
-            "mode": g.mode,
-            "result": g.result,
-            "duration_sec": (
-                (g.ended_at - g.started_at).total_seconds()
-                if g.started_at and g.ended_at
-                else None
-            ),
-            "started_at": g.started_at,
-            "ended_at": g.ended_at,
-        }
-        for g in recent_games_qs
-    ]
+    # ---- 10 dernières parties : dicts via values(), durée calculée en SQL ----
+    recent_games = list(
+        qs.annotate(duration=duration)
+        .order_by("-started_at")
+        .values("id", "mode", "result", "started_at", "ended_at", "duration")[:10]
+    )
+    for g in recent_games:
+        d = g.pop("duration")
+        g["duration_sec"] = d.total_seconds() if d is not None else None
 
     return {
         "summary": summary,
@@ -192,14 +197,6 @@ def _get_or_create_stats_and_profile(user: User) -> tuple[Stats, PlayerProfile]:
     return stats, profile
 
 
-def _skill_from_rating(rating: int) -> str:
-    if rating >= 2000:
-        return PlayerProfile.SKILL_EXPERT
-    if rating >= 1700:
-        return PlayerProfile.SKILL_INTERMEDIATE
-    return PlayerProfile.SKILL_BEGINNER
-
-
 def _elo_update(current_rating: int, opponent_rating: int, score: float) -> int:
     if current_rating < 1800:
         k = 32
@@ -220,29 +217,27 @@ def update_stats_for_finished_game(game: Game) -> None:
 
     stats, profile = _get_or_create_stats_and_profile(user)
 
-    # 1) Stats globales
-    stats.games_played += 1
-
+    # 1) Stats globales : un seul UPDATE atomique (col = col + 1 côté SQL)
+    deltas = {"games_played": 1}
     if game.result == "win":
         if game.mode == "engine":
-            stats.wins_engine += 1
+            deltas["wins_engine"] = 1
         elif game.mode == "gemini":
-            stats.wins_gemini += 1
-
-        stats.current_streak += 1
-        if stats.current_streak > stats.best_streak:
-            stats.best_streak = stats.current_streak
-
-    elif game.result == "lose":
-        stats.losses += 1
-        stats.current_streak = 0
-
-    elif game.result == "draw":
-        stats.draws += 1
-        stats.current_streak = 0
+            deltas["wins_gemini"] = 1
+        streak = {
+            "current_streak": F("current_streak") + 1,
+            "best_streak": Greatest("best_streak", F("current_streak") + 1),
+        }
+        current_streak = stats.current_streak + 1
+    elif game.result in ("lose", "draw"):
+        deltas["losses" if game.result == "lose" else "draws"] = 1
+        streak = {"current_streak": 0}
+        current_streak = 0
+    else:
+        streak = {}
+        current_streak = stats.current_streak
 
-    stats.updated_at = timezone.now()
-    stats.save()
+    Stats.increment(user, set_fields=streak, **deltas)
 
     # 2) Elo global
     if game.mode == "engine":
@@ -261,8 +256,7 @@ def update_stats_for_finished_game(game: Game) -> None:
 
     new_rating = _elo_update(profile.rating, opp_rating, score)
     profile.rating = new_rating
-    profile.skill_tier = _skill_from_rating(new_rating)
-    profile.current_streak = stats.current_streak
+    profile.current_streak = current_streak
     profile.last_played = timezone.now()
     profile.save()
 # game/services.py
@@ -320,15 +314,27 @@ def get_detailed_dashboard_v2(user: Optional[User]) -> Dict[str, Any]:
         .select_related("player")
     )
 
-    games_played = games_qs.count()
-
-    engine_games = games_qs.filter(mode="engine")
-    gemini_games = games_qs.filter(mode="gemini")
+    # Tous les compteurs en une seule requête (agrégats conditionnels)
+    aggregates = {
+        "games_played": Count("id"),
+        "engine_games": Count("id", filter=Q(mode="engine")),
+        "gemini_games": Count("id", filter=Q(mode="gemini")),
+        "wins_engine": Count("id", filter=Q(mode="engine", result="win")),
+        "wins_gemini": Count("id", filter=Q(mode="gemini", result="win")),
+        "losses": Count("id", filter=Q(result="lose")),
+        "draws": Count("id", filter=Q(result="draw")),
+    }
+    # Durée moyenne (si le champ existe)
+    if HAS_DURATION:
+        aggregates["avg_duration"] = Avg("duration_sec")
+    agg = games_qs.aggregate(**aggregates)
 
-    wins_engine = engine_games.filter(result="win").count()
-    wins_gemini = gemini_games.filter(result="win").count()
-    losses = games_qs.filter(result="lose").count()
-    draws = games_qs.filter(result="draw").count()
+    games_played = agg["games_played"]
+    wins_engine = agg["wins_engine"]
+    wins_gemini = agg["wins_gemini"]
+    losses = agg["losses"]
+    draws = agg["draws"]
+    avg_duration = agg.get("avg_duration")
 
     total_wins = wins_engine + wins_gemini
 
@@ -339,40 +345,27 @@ def get_detailed_dashboard_v2(user: Optional[User]) -> Dict[str, Any]:
 
     # Winrates
     winrate = _safe_winrate(total_wins, games_played)
-    engine_winrate = _safe_winrate(wins_engine, engine_games.count())
-    gemini_winrate = _safe_winrate(wins_gemini, gemini_games.count())
-
-    # Durée moyenne (si le champ existe)
-    avg_duration = None
-    if hasattr(Game, "duration_sec"):
-        avg_duration = games_qs.aggregate(
-            avg_duration=Avg("duration_sec")
-        )["avg_duration"]
+    engine_winrate = _safe_winrate(wins_engine, agg["engine_games"])
+    gemini_winrate = _safe_winrate(wins_gemini, agg["gemini_games"])
 
     # Pour l'instant on ne remonte PAS les stats IA (eval_score / depth)
     avg_eval_score = None
     avg_depth = None
 
-    # Parties récentes (on envoie tout ce qu’il faut pour le front)
-    recent_qs = games_qs[:20]
-
-    recent_games: List[Dict[str, Any]] = []
-    for g in recent_qs:
-        recent_games.append(
-            {
-                "id": g.id,
-                "mode": g.mode,          # "engine" | "gemini"
-                "result": g.result,      # "win" | "lose" | "draw"
-                "duration_sec": getattr(g, "duration_sec", None),
-                "avg_eval_score": None,  # à remplir plus tard quand on remettra Move
-                "avg_depth": None,       # idem
-                "started_at": (
-                    g.started_at.isoformat()
-                    if getattr(g, "started_at", None)
-                    else None
-                ),
-            }
-        )
+    # Parties récentes (on envoie tout ce qu’il faut pour le front) :
+    # dicts via values(), les dates sont formatées en ISO par DRF
+    recent_fields = ["id", "mode", "result", "started_at"]
+    if HAS_DURATION:
+        recent_fields.append("duration_sec")
+    recent_games: List[Dict[str, Any]] = [
+        {
+            "duration_sec": None,
+            **g,                     # mode "engine" | "gemini", result "win" | "lose" | "draw"
+            "avg_eval_score": None,  # à remplir plus tard quand on remettra Move
+            "avg_depth": None,       # idem
+        }
+        for g in games_qs.values(*recent_fields)[:20]
+    ]
 
     return {
         "games_played": games_played,
@@ -3,11 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import timedelta
 
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils import timezone
 
 from game.models import MatchQueueEntry, PvPGame, PlayerRating
-from game.services.ws_notify import notify_user
+from game.services.pvp_timeouts import wake_timeout_worker
+from game.services.ws_notify import notify_users
 
 
 @dataclass
@@ -41,12 +42,31 @@ def _ensure_rating(user, mode: str) -> int:
     return rating.elo_ranked
 
 
+def _lock_queue(entry_id: int) -> None:
+    """
+    Serialize matchers of the entry's mode with a transaction-scoped
+    advisory lock, taken before any queue row is locked. Two players
+    joining at once are then matched by whichever attempt runs second,
+    instead of each skipping (or deadlocking on) the other's locked row.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext('matchmaking:' || mode)) "
+            f"FROM {MatchQueueEntry._meta.db_table} WHERE id = %s",
+            [entry_id],
+        )
+
+
 def try_match(entry_id: int) -> MatchResult:
     """
     Attempt to match the given waiting entry.
     Must be concurrency-safe (atomic + re-check status).
     """
     with transaction.atomic():
+        _lock_queue(entry_id)
+
         entry = (
             MatchQueueEntry.objects
             .select_for_update()
@@ -61,14 +81,22 @@ def try_match(entry_id: int) -> MatchResult:
             return MatchResult(matched=False)
 
         waited_a = _waited_seconds(entry)
+        # The partner's window uses min(waited_a, waited_b), so it is never
+        # wider than ours: our window alone bounds the ELO gap
         window = _elo_window(waited_a)
+        elo = entry.elo_snapshot or 1200
 
+        # ELO range filtered in SQL (ix_mqe_match covers mode + ELO on waiting
+        # rows). No skip_locked: a row locked by a concurrent join is exactly
+        # the partner that join is waiting for; _lock_queue keeps matchers of
+        # a mode from holding each other's rows in the first place.
         candidates = (
             MatchQueueEntry.objects
             .select_for_update()
             .filter(
                 mode=entry.mode,
                 status=MatchQueueEntry.Status.WAITING,
+                elo_snapshot__range=(elo - window, elo + window),
             )
             .exclude(user_id=entry.user_id)
             .order_by("created_at")
@@ -79,16 +107,7 @@ def try_match(entry_id: int) -> MatchResult:
 
         for candidate in candidates:
             waited_b = _waited_seconds(candidate)
-            window_b = _elo_window(min(waited_a, waited_b))
-            allowed = max(window, window_b)
-
-            diff = abs(
-                (entry.elo_snapshot or 1200)
-                - (candidate.elo_snapshot or 1200)
-            )
-
-            if diff > allowed:
-                continue
+            diff = abs(elo - candidate.elo_snapshot)
 
             # Lower score is better:
             # prioritize closest ELO, then older waiting
@@ -98,17 +117,13 @@ def try_match(entry_id: int) -> MatchResult:
                 best = candidate
                 best_score = score
 
-        if best is None:
-            return MatchResult(matched=False)
+            # Candidates come oldest first, so after an exact ELO match every
+            # later one scores at least -waited_b: none can beat best any more
+            if diff == 0:
+                break
 
-        best = (
-            MatchQueueEntry.objects
-            .select_for_update()
-            .filter(id=best.id)
-            .first()
-        )
-
-        if not best or best.status != MatchQueueEntry.Status.WAITING:
+        # best is already locked and was read as waiting under that lock
+        if best is None:
             return MatchResult(matched=False)
 
         # Older entry gets X (FIFO fairness)
@@ -125,42 +140,34 @@ def try_match(entry_id: int) -> MatchResult:
             turn="X",
             last_move_at=timezone.now(),
         )
+        wake_timeout_worker()
 
-        now = timezone.now()
-
-        entry.status = MatchQueueEntry.Status.MATCHED
-        entry.matched_at = now
-        entry.matched_game = game
-        entry.save(update_fields=["status", "matched_at", "matched_game"])
-
-        best.status = MatchQueueEntry.Status.MATCHED
-        best.matched_at = now
-        best.matched_game = game
-        best.save(update_fields=["status", "matched_at", "matched_game"])
+        # Both entries in one UPDATE (rows already locked above)
+        MatchQueueEntry.objects.filter(id__in=(entry.id, best.id)).update(
+            status=MatchQueueEntry.Status.MATCHED,
+            matched_at=timezone.now(),
+            matched_game=game,
+        )
 
         role = "X" if p1.id == entry.user_id else "O"
         opponent_id = p2.id if role == "X" else p1.id
 
-        # WebSocket notifications
-        notify_user(
-            p1.id,
-            {
+        # WebSocket notifications, sent once the locks are released
+        events = [
+            (p1.id, {
                 "type": "queue.matched",
                 "game_id": game.id,
                 "role": "X",
                 "opponent_user_id": p2.id,
-            },
-        )
-
-        notify_user(
-            p2.id,
-            {
+            }),
+            (p2.id, {
                 "type": "queue.matched",
                 "game_id": game.id,
                 "role": "O",
                 "opponent_user_id": p1.id,
-            },
-        )
+            }),
+        ]
+        transaction.on_commit(lambda: notify_users(events))
 
         return MatchResult(
             matched=True,
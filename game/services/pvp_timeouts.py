@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.db.models import DateTimeField, ExpressionWrapper, F, Min, QuerySet
+from django.db.models.functions import Coalesce
+
+from game.models import PvPGame
+
+# Postgres LISTEN/NOTIFY channel of the timeout worker. It sleeps until the
+# earliest turn deadline and is woken early when a game becomes active (its
+# deadline may come before that one). Moves only push deadlines later, so
+# they need no wake-up.
+TIMEOUT_CHANNEL = "pvp_timeouts"
+
+
+def _active_with_deadline() -> QuerySet:
+    """Active games annotated with `deadline`: turn start + turn_timeout_sec."""
+    return PvPGame.objects.filter(status=PvPGame.Status.ACTIVE).annotate(
+        deadline=ExpressionWrapper(
+            Coalesce("last_move_at", "started_at")
+            + F("turn_timeout_sec") * timedelta(seconds=1),
+            output_field=DateTimeField(),
+        )
+    )
+
+
+def next_deadline() -> datetime | None:
+    """Earliest turn deadline among active games, None if there is none."""
+    return _active_with_deadline().aggregate(next=Min("deadline"))["next"]
+
+
+def due_games(now: datetime) -> list[tuple[int, str]]:
+    """
+    (id, turn) of the active games whose current turn ran out before `now`.
+    Inside a transaction the rows stay locked until commit; rows already
+    locked (a move being played) are skipped and picked up on a later scan.
+    """
+    return list(
+        _active_with_deadline()
+        .select_for_update(skip_locked=True)
+        .filter(deadline__lt=now)
+        .values_list("id", "turn")
+    )
+
+
+def timeout_result(turn: str) -> str:
+    """Result of a game lost on time by the player to move (`turn`)."""
+    # current turn player times out -> other wins
+    return PvPGame.Result.P2_WIN if turn == "X" else PvPGame.Result.P1_WIN
+
+
+def finalize_timeout(game_id: int, turn: str, now: datetime) -> bool:
+    """
+    End the game on timeout with a single conditional UPDATE of its status,
+    ended_at and result. The filter re-checks status, turn and deadline, so
+    returns False if a move or another ending got there first.
+    """
+    updated = (
+        _active_with_deadline()
+        .filter(pk=game_id, turn=turn, deadline__lt=now)
+        .update(
+            status=PvPGame.Status.FINISHED,
+            ended_at=now,
+            result=timeout_result(turn),
+        )
+    )
+    return updated == 1
+
+
+def wake_timeout_worker() -> None:
+    """
+    Tell the timeout worker to recompute its next deadline. Inside a
+    transaction Postgres delivers the notification on commit only.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, '')", [TIMEOUT_CHANNEL])
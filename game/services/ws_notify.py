@@ -1,6 +1,26 @@
+import asyncio
+import json
+
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
+try:
+    # Optional: orjson encodes small payloads about twice as fast
+    import orjson
+
+    def _json_dumps(payload: dict) -> str:
+        return orjson.dumps(payload).decode()
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_dumps = json.dumps
+
+
+def _event(handler: str, payload: dict) -> dict:
+    """
+    Channel-layer event for a consumer handler. The JSON text is encoded
+    once here, so consumers of a group do not each re-encode the payload.
+    """
+    return {"type": handler, "payload": payload, "text": _json_dumps(payload)}
+
 
 def notify_user(user_id: int, payload: dict):
     """
@@ -9,21 +29,63 @@ def notify_user(user_id: int, payload: dict):
     channel_layer = get_channel_layer()
     async_to_sync(channel_layer.group_send)(
         f"user_{user_id}",
-        {"type": "queue_event", "payload": payload},
+        _event("queue_event", payload),
     )
 
 
+def notify_users(events: list[tuple[int, dict]]):
+    """
+    Push (user_id, payload) events in one async_to_sync call, the
+    group_sends running concurrently.
+    """
+    if not events:
+        return
+    channel_layer = get_channel_layer()
+
+    async def _send_all():
+        await asyncio.gather(*(
+            channel_layer.group_send(
+                f"user_{user_id}",
+                _event("queue_event", payload),
+            )
+            for user_id, payload in events
+        ))
+
+    async_to_sync(_send_all)()
+
+
 def notify_game(game_id: int, payload: dict):
     channel_layer = get_channel_layer()
     async_to_sync(channel_layer.group_send)(
         f"pvp_game_{game_id}",
-        {"type": "game_event", "payload": payload},
+        _event("game_event", payload),
     )
 
 
+def notify_games(events: list[tuple[int, dict]]):
+    """
+    Push (game_id, payload) events in one async_to_sync call, the
+    group_sends running concurrently instead of one round trip each.
+    """
+    if not events:
+        return
+    channel_layer = get_channel_layer()
+
+    async def _send_all():
+        await asyncio.gather(*(
+            channel_layer.group_send(
+                f"pvp_game_{game_id}",
+                _event("game_event", payload),
+            )
+            for game_id, payload in events
+        ))
+
+    async_to_sync(_send_all)()
+
+
 def notify_lobby(payload: dict):
     channel_layer = get_channel_layer()
     async_to_sync(channel_layer.group_send)(
         "pvp_lobby",
-        {"type": "queue_event", "payload": payload},
+        _event("queue_event", payload),
     )
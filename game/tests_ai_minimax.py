@@ -0,0 +1,87 @@
+from array import array
+
+from django.test import SimpleTestCase
+
+from game.ai import minimax_engine as engine
+
+
+class MinimaxTranspositionFlagTests(SimpleTestCase):
+    def setUp(self):
+        engine._init_zobrist()
+        engine._tt_data[:] = array("Q", bytes(len(engine._tt_data) * 8))
+        grid = [[""] * engine.BOARD_SIZE for _ in range(engine.BOARD_SIZE)]
+        grid[7][7] = "X"
+        grid[7][8] = "O"
+        grid[8][7] = "X"
+        self.board = engine._to_flat(grid)
+        engine._load_search_state(self.board, 1)
+        self.node_hash = engine._zobrist_hash(self.board)
+
+    def _search(self, alpha, beta):
+        score, _ = engine._minimax(
+            self.board, 2, alpha, beta, engine.O, engine.X, 6, self.node_hash, 0
+        )
+        _, stored, flag, _ = engine._tt_probe(self.node_hash)
+        self.assertEqual(stored, score)
+        return score, flag
+
+    def test_full_window_is_exact(self):
+        _, flag = self._search(-engine.INF, engine.INF)
+        self.assertEqual(flag, engine.TT_EXACT)
+
+    def test_fail_low_is_upper_bound(self):
+        score, flag = self._search(10**7, 10**7 + 1)
+        self.assertLessEqual(score, 10**7)
+        self.assertEqual(flag, engine.TT_UPPERBOUND)
+
+    def test_fail_high_is_lower_bound(self):
+        score, flag = self._search(-(10**7) - 1, -(10**7))
+        self.assertGreaterEqual(score, -(10**7))
+        self.assertEqual(flag, engine.TT_LOWERBOUND)
+
+    def test_store_keeps_deeper_entry_of_current_search(self):
+        engine._tt_store(self.node_hash, 4, -1234, engine.TT_LOWERBOUND, (3, 9))
+        self.assertEqual(
+            engine._tt_probe(self.node_hash), (4, -1234, engine.TT_LOWERBOUND, (3, 9))
+        )
+        # Same slot, different position, shallower: the deeper entry stays
+        other = self.node_hash ^ (1 << engine.TT_BITS)
+        engine._tt_store(other, 2, 50, engine.TT_EXACT, None)
+        self.assertIsNone(engine._tt_probe(other))
+        # Next search: the old entry gives way
+        engine._tt_new_search()
+        engine._tt_store(other, 2, 50, engine.TT_EXACT, None)
+        self.assertEqual(engine._tt_probe(other), (2, 50, engine.TT_EXACT, None))
+
+    def test_worker_follows_parent_search_generation(self):
+        # A deep entry left by an earlier search, in the slot of another position
+        engine._tt_store(self.node_hash, 6, 0, engine.TT_EXACT, None)
+        other = self.node_hash ^ (1 << engine.TT_BITS)
+        new_age = (engine._tt_age + 1) & 0xFF
+
+        engine._search_root_move(
+            self.board.tobytes(), (6, 6), 1, -engine.INF, engine.O, engine.X, 6, 1, new_age
+        )
+
+        self.assertEqual(engine._tt_age, new_age)
+        engine._tt_store(other, 2, 50, engine.TT_EXACT, None)
+        self.assertEqual(engine._tt_probe(other), (2, 50, engine.TT_EXACT, None))
+
+
+class MinimaxWinnerTests(SimpleTestCase):
+    def setUp(self):
+        self.board = array("b", bytes(engine.CELL_COUNT))
+        engine._load_search_state(self.board, 1)
+
+    def test_winner_follows_place_and_remove(self):
+        row = [7 * engine.BOARD_SIZE + c for c in range(3, 8)]
+        for idx in row[:4]:
+            engine._place(self.board, idx, engine.X)
+        self.assertEqual(engine._check_winner(), engine.EMPTY)
+        self.assertEqual(engine._find_immediate_win(self.board, engine.X), (7, 2))
+
+        engine._place(self.board, row[4], engine.X)
+        self.assertEqual(engine._check_winner(), engine.X)
+
+        engine._remove(self.board, row[4])
+        self.assertEqual(engine._check_winner(), engine.EMPTY)
@@ -0,0 +1,13 @@
+from django.test import SimpleTestCase
+
+from game.consumers import LobbyConsumer
+
+
+class GameIdParsingTests(SimpleTestCase):
+    def test_game_id_accepts_ints_and_decimal_strings_only(self):
+        parse = LobbyConsumer._game_id
+        self.assertEqual(parse({"game_id": 12}), 12)
+        self.assertEqual(parse({"game_id": "12"}), 12)
+        for bad in ("²", "-1", "", "1.5", True, None, 1.0):
+            self.assertIsNone(parse({"game_id": bad}), bad)
+        self.assertIsNone(parse({}))
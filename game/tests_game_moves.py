@@ -0,0 +1,46 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from game.models import Game, Move
+
+
+User = get_user_model()
+
+
+class PlayerMoveTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password="pass12345",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.game = Game.objects.create(user=self.user, mode="engine")
+        self.url = f"/api/game/{self.game.id}/moves/"
+
+    def test_move_numbers_come_from_move_count(self):
+        self.client.post(self.url, {"row": 7, "col": 7}, format="json")
+        self.client.post(self.url, {"row": 7, "col": 8, "player": "O"}, format="json")
+
+        response = self.client.post(self.url, {"row": 7, "col": 8}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.move_count, 2)
+        self.assertEqual(
+            list(Move.objects.filter(game=self.game).values_list("move_number", "player")),
+            [(1, "X"), (2, "O")],
+        )
+
+    def test_state_lists_moves_in_two_queries(self):
+        self.client.post(self.url, {"row": 7, "col": 7}, format="json")
+        self.client.post(self.url, {"row": 7, "col": 8, "player": "O"}, format="json")
+
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/api/game/{self.game.id}/state/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([m["move_number"] for m in response.data["moves"]], [1, 2])
@@ -0,0 +1,144 @@
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from unittest.mock import patch
+
+from game.models import MatchQueueEntry, PvPGame
+from game.services import matchmaking
+from game.services.matchmaking import try_match
+
+
+User = get_user_model()
+
+
+@patch("game.services.matchmaking.notify_users")
+class TryMatchTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username=f"mm_{i}",
+                email=f"mm_{i}@example.com",
+                password="pass12345",
+            )
+            for i in range(3)
+        ]
+
+    def _queue(self, user, elo, mode=MatchQueueEntry.Mode.RANKED):
+        return MatchQueueEntry.objects.create(user=user, mode=mode, elo_snapshot=elo)
+
+    def test_matches_closest_elo_and_marks_both_entries(self, mock_notify_users):
+        older = self._queue(self.users[0], 1200)
+        self._queue(self.users[1], 1240)
+        closest = self._queue(self.users[2], 1210)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = try_match(closest.id)
+
+        self.assertTrue(result.matched)
+        self.assertEqual(result.role, "O")
+        self.assertEqual(result.opponent_user_id, self.users[0].id)
+        game = PvPGame.objects.get(id=result.game_id)
+        self.assertEqual((game.p1_id, game.p2_id), (self.users[0].id, self.users[2].id))
+        self.assertEqual(
+            set(MatchQueueEntry.objects.filter(matched_game=game).values_list("id", flat=True)),
+            {older.id, closest.id},
+        )
+        self.assertEqual(
+            MatchQueueEntry.objects.filter(status=MatchQueueEntry.Status.WAITING).count(), 1
+        )
+        mock_notify_users.assert_called_once_with([
+            (self.users[0].id, {
+                "type": "queue.matched",
+                "game_id": game.id,
+                "role": "X",
+                "opponent_user_id": self.users[2].id,
+            }),
+            (self.users[2].id, {
+                "type": "queue.matched",
+                "game_id": game.id,
+                "role": "O",
+                "opponent_user_id": self.users[0].id,
+            }),
+        ])
+
+    def test_no_match_outside_elo_window_or_mode(self, mock_notify_users):
+        self._queue(self.users[0], 1600)
+        self._queue(self.users[1], 1200, mode=MatchQueueEntry.Mode.CASUAL)
+        entry = self._queue(self.users[2], 1200)
+
+        self.assertFalse(try_match(entry.id).matched)
+        self.assertFalse(PvPGame.objects.exists())
+        mock_notify_users.assert_not_called()
+
+    def test_exact_elo_match_prefers_oldest_entry(self, mock_notify_users):
+        oldest = self._queue(self.users[0], 1200)
+        self._queue(self.users[1], 1200)
+        entry = self._queue(self.users[2], 1200)
+
+        result = try_match(entry.id)
+
+        self.assertEqual(result.opponent_user_id, oldest.user_id)
+
+    def test_closest_elo_found_behind_many_older_candidates(self, mock_notify_users):
+        for i in range(60):
+            user = User.objects.create_user(username=f"mm_old_{i}", password="pass12345")
+            self._queue(user, 1240)
+        self._queue(self.users[0], 1205)
+        entry = self._queue(self.users[1], 1200)
+
+        result = try_match(entry.id)
+
+        self.assertEqual(result.opponent_user_id, self.users[0].id)
+
+
+@patch("game.services.matchmaking.notify_users")
+class ConcurrentTryMatchTests(TransactionTestCase):
+    def test_simultaneous_joins_match_each_other(self, mock_notify_users):
+        a = MatchQueueEntry.objects.create(
+            user=User.objects.create_user(username="mm_a", password="pass12345"),
+            mode=MatchQueueEntry.Mode.RANKED,
+            elo_snapshot=1200,
+        )
+        b = MatchQueueEntry.objects.create(
+            user=User.objects.create_user(username="mm_b", password="pass12345"),
+            mode=MatchQueueEntry.Mode.RANKED,
+            elo_snapshot=1200,
+        )
+
+        # Each attempt pauses right after locking its own entry until the
+        # other one got that far too (or 1s passed): without per-mode
+        # serialization both would then scan while the partner row is locked.
+        both_locked = threading.Barrier(2, timeout=1)
+        first_call = threading.local()
+        waited_seconds = matchmaking._waited_seconds
+
+        def rendezvous(entry):
+            if not getattr(first_call, "done", False):
+                first_call.done = True
+                try:
+                    both_locked.wait()
+                except threading.BrokenBarrierError:
+                    pass
+            return waited_seconds(entry)
+
+        results = {}
+
+        def run(entry_id):
+            try:
+                results[entry_id] = try_match(entry_id)
+            finally:
+                connection.close()
+
+        with patch("game.services.matchmaking._waited_seconds", rendezvous):
+            threads = [threading.Thread(target=run, args=(e.id,)) for e in (a, b)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=10)
+
+        self.assertEqual(sorted(r.matched for r in results.values()), [False, True])
+        self.assertEqual(
+            MatchQueueEntry.objects.filter(status=MatchQueueEntry.Status.MATCHED).count(), 2
+        )
@@ -0,0 +1,75 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+from unittest.mock import patch
+
+from game.models import PvPGame, PvPMove
+
+
+User = get_user_model()
+
+
+@patch("game.views_pvp_game.notify_game")
+class PvPMoveTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.player_x = User.objects.create_user(
+            username="pvp_x",
+            email="pvp_x@example.com",
+            password="pass12345",
+        )
+        self.player_o = User.objects.create_user(
+            username="pvp_o",
+            email="pvp_o@example.com",
+            password="pass12345",
+        )
+        self.game = PvPGame.objects.create(
+            p1=self.player_x,
+            p2=self.player_o,
+            mode=PvPGame.Mode.CASUAL,
+            status=PvPGame.Status.ACTIVE,
+            board_size=15,
+            turn="X",
+        )
+        self.url = f"/api/game/pvp/games/{self.game.id}/move/"
+
+    def _play(self, user, row, col):
+        self.client.force_authenticate(user=user)
+        return self.client.post(self.url, {"row": row, "col": col}, format="json")
+
+    def test_moves_are_packed_and_occupied_cell_rejected(self, mock_notify_game):
+        self.assertEqual(self._play(self.player_x, 7, 7).status_code, status.HTTP_200_OK)
+        self.assertEqual(self._play(self.player_o, 7, 8).status_code, status.HTTP_200_OK)
+
+        response = self._play(self.player_x, 7, 8)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        self.game.refresh_from_db()
+        self.assertEqual(bytes(self.game.moves_packed), bytes([7, 7, 7, 8]))
+        self.assertEqual(self.game.move_count, 2)
+        self.assertEqual(self.game.board_from_moves()[7][8], "O")
+        self.assertEqual(
+            list(PvPMove.objects.filter(game=self.game).values_list("move_number", "player")),
+            [(1, "X"), (2, "O")],
+        )
+
+    def test_five_in_a_row_ends_game(self, mock_notify_game):
+        for col in range(4):
+            self._play(self.player_x, 0, col)
+            self._play(self.player_o, 1, col)
+
+        response = self._play(self.player_x, 0, 4)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["winner"], "X")
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.result, PvPGame.Result.P1_WIN)
+        self.assertEqual(self.game.move_count, 9)
+
+    def test_flip_turn_only_from_expected_turn(self, mock_notify_game):
+        self.assertEqual(PvPGame.objects.flip_turn(self.game.id, "O"), 0)
+        self.assertEqual(PvPGame.objects.flip_turn(self.game.id, "X"), 1)
+
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.turn, "O")
@@ -53,6 +53,25 @@ class PvPPrivateInviteTests(TestCase):
         self.assertIsNotNone(game.invite_expires_at)
         self.assertGreater(game.invite_expires_at, game.invite_created_at)
 
+    def test_private_create_retries_invite_code_collision(self):
+        PvPGame.objects.create(
+            p1=self.other,
+            mode=PvPGame.Mode.CASUAL,
+            is_private=True,
+            invite_code="TAKEN12345",
+        )
+        self.client.force_authenticate(user=self.host)
+        with patch.object(
+            PvPGame, "generate_invite_code", side_effect=["TAKEN12345", "FRESH12345"]
+        ):
+            response = self.client.post(
+                "/api/game/pvp/private/create/",
+                {"mode": "casual"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["invite_code"], "FRESH12345")
+
     @patch("game.views_pvp_private.notify_game")
     @patch("game.views_pvp_private.notify_user")
     def test_private_join_ok(self, mock_notify_user, mock_notify_game):
@@ -0,0 +1,105 @@
+import threading
+import time
+import unittest
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from game.management.commands.pvp_timeout_worker import Command
+from game.models import PvPGame
+from game.services.pvp_timeouts import (
+    due_games,
+    finalize_timeout,
+    next_deadline,
+    wake_timeout_worker,
+)
+
+
+User = get_user_model()
+
+
+class PvPTimeoutTests(TestCase):
+    def setUp(self):
+        self.player_x = User.objects.create_user(
+            username="pvp_x",
+            email="pvp_x@example.com",
+            password="pass12345",
+        )
+        self.player_o = User.objects.create_user(
+            username="pvp_o",
+            email="pvp_o@example.com",
+            password="pass12345",
+        )
+        self.now = timezone.now()
+
+    def _active_game(self, seconds_since_move, turn="X"):
+        return PvPGame.objects.create(
+            p1=self.player_x,
+            p2=self.player_o,
+            mode=PvPGame.Mode.CASUAL,
+            status=PvPGame.Status.ACTIVE,
+            turn=turn,
+            turn_timeout_sec=30,
+            last_move_at=self.now - timedelta(seconds=seconds_since_move),
+        )
+
+    def test_due_games_and_next_deadline(self):
+        overdue = self._active_game(45)
+        running = self._active_game(10)
+
+        self.assertEqual(due_games(self.now), [(overdue.id, "X")])
+        self.assertEqual(next_deadline(), overdue.last_move_at + timedelta(seconds=30))
+
+        running.status = PvPGame.Status.FINISHED
+        running.save(update_fields=["status"])
+        overdue.delete()
+        self.assertIsNone(next_deadline())
+
+    def test_finalize_timeout_player_to_move_loses(self):
+        game = self._active_game(45, turn="O")
+
+        self.assertTrue(finalize_timeout(game.id, "O", self.now))
+
+        game.refresh_from_db()
+        self.assertEqual(game.status, PvPGame.Status.FINISHED)
+        self.assertEqual(game.result, PvPGame.Result.P1_WIN)
+        self.assertEqual(game.ended_at, self.now)
+
+    def test_finalize_timeout_skips_game_that_moved_since(self):
+        game = self._active_game(10)
+
+        self.assertFalse(finalize_timeout(game.id, "X", self.now))
+        game.refresh_from_db()
+        self.assertEqual(game.status, PvPGame.Status.ACTIVE)
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "LISTEN/NOTIFY needs Postgres")
+class TimeoutWorkerWakeUpTests(TransactionTestCase):
+    def tearDown(self):
+        with connection.cursor() as cursor:
+            cursor.execute("UNLISTEN *")
+
+    def test_notify_received_during_a_query_wakes_the_worker(self):
+        command = Command()
+        self.assertTrue(command._listen())
+
+        def notify_soon():
+            time.sleep(0.2)
+            try:
+                wake_timeout_worker()
+            finally:
+                connection.close()
+
+        sender = threading.Thread(target=notify_soon)
+        sender.start()
+        # The notification lands while the worker's own query is running
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_sleep(0.5)")
+        sender.join()
+
+        started = time.monotonic()
+        command._wait(3, True)
+        self.assertLess(time.monotonic() - started, 1)
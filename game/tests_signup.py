@@ -0,0 +1,22 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from game.serializers import SignupSerializer, generate_username_from_email
+
+
+User = get_user_model()
+
+
+class SignupUsernameTests(TestCase):
+    def test_free_base_is_used_as_is(self):
+        self.assertEqual(generate_username_from_email("alice@example.com"), "alice")
+
+    def test_taken_base_gets_suffix(self):
+        User.objects.create_user(username="alice", email="a@example.com", password="pass12345")
+
+        serializer = SignupSerializer(data={"email": "alice@example.com", "password": "pass12345"})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        user = serializer.save()
+
+        self.assertRegex(user.username, r"^alice_[0-9a-f]{4}$")
+        self.assertEqual(User.objects.filter(username__startswith="alice").count(), 2)
@@ -49,11 +49,6 @@ def _cell_occupied(game: Game, row: int, col: int) -> bool:
     return game.moves.filter(row=row, col=col).exists()
 
 
-def _next_move_number(game: Game) -> int:
-    last = game.moves.order_by("-move_number").first()
-    return (last.move_number + 1) if last else 1
-
-
 def _normalize_mode(mode: Optional[str]) -> str:
     mode = (mode or "engine").lower()
     if mode not in {"engine", "gemini", "openspiel"}:
@@ -139,7 +134,7 @@ class PlayerMoveView(APIView):
             with transaction.atomic():
                 Move.objects.create(
                     game=game,
-                    move_number=_next_move_number(game),
+                    move_number=game.next_move_number(),
                     player=player,
                     row=row,
                     col=col,
@@ -246,7 +241,7 @@ class AIMoveView(APIView):
             with transaction.atomic():
                 Move.objects.create(
                     game=game,
-                    move_number=_next_move_number(game),
+                    move_number=game.next_move_number(),
                     player="O",
                     row=row,
                     col=col,
@@ -309,7 +309,7 @@ class AdminFeedbackListView(AdminAPIView):
         status_filter = request.query_params.get("status")
         type_filter = request.query_params.get("type")
 
-        qs = Feedback.objects.all().select_related("user", "game")
+        qs = Feedback.objects.with_context()
 
         if status_filter:
             qs = qs.filter(status=status_filter)
@@ -11,6 +11,7 @@ from rest_framework.renderers import JSONRenderer
 
 from game.models import PvPGame, PvPMove, RematchRequest
 from game.serializers import PvPGameStateSerializer, PvPHeadToHeadSerializer
+from game.services.pvp_timeouts import wake_timeout_worker
 from game.services.ws_notify import notify_game, notify_user
 from game.services.pvp_rules import check_winner_board
 
@@ -27,19 +28,11 @@ def _role_for_user(game: PvPGame, user) -> str | None:
     return None
 
 
-def _build_pvp_board(game: PvPGame) -> list[list[str]]:
-    n = game.board_size
-    board = [["" for _ in range(n)] for _ in range(n)]
-    for m in PvPMove.objects.filter(game=game).order_by("move_number"):
-        board[m.row][m.col] = m.player
-    return board
-
-
 class PvPGameStateView(JsonAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, game_id: int):
-        game = PvPGame.objects.filter(id=game_id).first()
+        game = PvPGame.objects.with_players().filter(id=game_id).first()
         if not game:
             return Response({"detail": "Game not found"}, status=404)
 
@@ -122,11 +115,14 @@ class PvPGameMoveView(JsonAPIView):
             if game.turn != role:
                 return Response({"detail": "Not your turn"}, status=409)
 
+            # board from the locked game row: no PvPMove scan per move
+            board = game.board_from_moves()
+
             # occupied check
-            if PvPMove.objects.filter(game=game, row=row, col=col).exists():
+            if board[row][col]:
                 return Response({"detail": "Cell already occupied"}, status=409)
 
-            move_number = PvPMove.objects.filter(game=game).count() + 1
+            move_number = game.move_count + 1
 
             try:
                 move = PvPMove.objects.create(
@@ -139,8 +135,8 @@ class PvPGameMoveView(JsonAPIView):
             except IntegrityError:
                 return Response({"detail": "Move rejected (duplicate)"}, status=409)
 
-            # Build board AFTER saving move
-            board = _build_pvp_board(game)
+            board[row][col] = role
+            game.moves_packed = bytes(game.moves_packed) + PvPGame.pack_move(row, col)
 
             verdict = check_winner_board(board, win_len=5, last_move=(row, col))
             winner = verdict.get("winner")  # "X"|"O"|None
@@ -162,7 +158,9 @@ class PvPGameMoveView(JsonAPIView):
 
                 game.winning_line = winning_line if winner else []
                 game.last_move_at = timezone.now()
-                game.save(update_fields=["status", "result", "winning_line", "ended_at", "last_move_at"])
+                game.save(update_fields=[
+                    "status", "result", "winning_line", "ended_at", "last_move_at", "moves_packed",
+                ])
 
                 ended_payload = {
                     "type": "game.ended",
@@ -174,9 +172,13 @@ class PvPGameMoveView(JsonAPIView):
                 }
             else:
                 # Switch turn only if not ended
-                game.turn = "O" if role == "X" else "X"
                 game.last_move_at = timezone.now()
-                game.save(update_fields=["turn", "last_move_at"])
+                if not PvPGame.objects.flip_turn(
+                    game.id, role, last_move_at=game.last_move_at, moves_packed=game.moves_packed,
+                ):
+                    transaction.set_rollback(True)
+                    return Response({"detail": "Not your turn"}, status=409)
+                game.turn = "O" if role == "X" else "X"
 
         # ---------------- WS broadcasts (outside txn) ----------------
 
@@ -387,6 +389,7 @@ class PvPRematchAcceptView(JsonAPIView):
                 turn_timeout_sec=game.turn_timeout_sec,
                 time_control=game.time_control,
             )
+            wake_timeout_worker()
 
             rematch.status = RematchRequest.Status.ACCEPTED
             rematch.new_game = new_game
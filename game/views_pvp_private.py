@@ -10,6 +10,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from game.models import PvPGame
+from game.services.pvp_timeouts import wake_timeout_worker
 from game.services.ws_notify import notify_game, notify_lobby
 
 
@@ -33,9 +34,14 @@ class PvPPrivateCreateView(JsonAPIView):
             return Response({"detail": "board_size must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
         if board_size <= 0:
             return Response({"detail": "board_size must be > 0"}, status=status.HTTP_400_BAD_REQUEST)
+        if board_size > PvPGame.MAX_BOARD_SIZE:
+            return Response(
+                {"detail": f"board_size must be <= {PvPGame.MAX_BOARD_SIZE}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         now = timezone.now()
-        game = PvPGame.objects.create(
+        game = PvPGame.create_with_invite_code(
             p1=request.user,
             p2=None,
             mode=mode,
@@ -44,7 +50,6 @@ class PvPPrivateCreateView(JsonAPIView):
             board_size=board_size,
             turn="X",
             is_private=True,
-            invite_code=PvPGame.generate_unique_invite_code(),
             invite_created_at=now,
             invite_expires_at=now + timedelta(minutes=30),
             invite_used_at=None,
@@ -84,6 +89,7 @@ class PvPPrivateJoinView(JsonAPIView):
                 game.result = PvPGame.Result.ONGOING
                 game.invite_used_at = timezone.now()
                 game.save(update_fields=["p2", "status", "result", "invite_used_at"])
+                wake_timeout_worker()
 
                 payload = {
                     "type": "private.matched",
@@ -10,7 +10,9 @@ class GameStateView(APIView):
     permission_classes = [permissions.AllowAny]
 
     def get(self, request, game_id: int):
-        game = Game.objects.filter(id=game_id).prefetch_related("moves").first()
+        game = GameStateSerializer.setup_eager_loading(
+            Game.objects.filter(id=game_id)
+        ).first()
         if not game:
             return Response({"detail": "Game not found"}, status=status.HTTP_404_NOT_FOUND)
 